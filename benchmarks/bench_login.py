@@ -0,0 +1,160 @@
+# benchmarks/bench_login.py
+"""Benchmark login throughput and concurrent read latency.
+
+Compares hashing passwords inside the request threads with hashing them in
+the process pool, while readers query posts through the GraphQL endpoint.
+
+Usage:
+    python benchmarks/bench_login.py
+    python benchmarks/bench_login.py --logins 8 --readers 4 --workers 4
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app import create_app
+from app.config import Config
+from app.models import PostModel, UserModel
+from app.passwords import get_password_hasher
+
+LOGIN = """
+mutation Login($username: String!, $password: String!) {
+  login(loginInput: {username: $username, password: $password}) { accessToken }
+}
+"""
+POSTS = "{ posts(limit: 20) { id title author { username } } }"
+
+
+def make_app(database_path, workers, method):
+    """Create an app bound to a throwaway SQLite database."""
+    config = type(
+        "BenchmarkConfig",
+        (Config,),
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{database_path}",
+            "PASSWORD_HASH_METHOD": method,
+            "PASSWORD_HASH_WORKERS": workers,
+            "GRAPHQL_HTTP_CACHE_ENABLED": False,
+        },
+    )
+    return create_app(config)
+
+
+def seed(app, users):
+    """Create users to log in as, each with a published post to read."""
+    with app.app_context():
+        for index in range(users):
+            user = UserModel.create_user(
+                username=f"bench{index}",
+                email=f"bench{index}@example.com",
+                password="bench-password",
+            )
+            PostModel(
+                title=f"Post by bench{index}",
+                content="Benchmark body",
+                author_id=user.id,
+                is_published=True,
+            ).publish()
+
+
+def run(app, users, logins, readers, duration):
+    """Run login and read loops concurrently; return latencies and errors."""
+    stop = threading.Event()
+    login_latencies, read_latencies, errors = [], [], []
+
+    def login_loop(worker):
+        client = app.test_client()
+        count = 0
+        while not stop.is_set():
+            variables = {
+                "username": f"bench{(worker + count) % users}",
+                "password": "bench-password",
+            }
+            started = time.perf_counter()
+            response = client.post(
+                "/api/graphql", json={"query": LOGIN, "variables": variables}
+            )
+            login_latencies.append(time.perf_counter() - started)
+            for error in response.get_json().get("errors") or []:
+                errors.append(error["message"])
+            count += 1
+
+    def read_loop():
+        client = app.test_client()
+        while not stop.is_set():
+            started = time.perf_counter()
+            client.post("/api/graphql", json={"query": POSTS})
+            read_latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=login_loop, args=(w,)) for w in range(logins)]
+    threads += [threading.Thread(target=read_loop) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return login_latencies, read_latencies, errors
+
+
+def percentiles(latencies):
+    """Return p50/p95/p99 in milliseconds."""
+    if len(latencies) < 2:
+        return [latency * 1000 for latency in latencies * 3][:3] or [0.0] * 3
+    cuts = statistics.quantiles(latencies, n=100)
+    return [cuts[49] * 1000, cuts[94] * 1000, cuts[98] * 1000]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=4, help="login threads")
+    parser.add_argument("--readers", type=int, default=4, help="reader threads")
+    parser.add_argument("--workers", type=int, default=2, help="hashing processes")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--method", default="scrypt", help="password hash method")
+    args = parser.parse_args()
+
+    print(
+        f"{'hashing':>8} {'logins/s':>9} {'login p50':>10} {'p95':>8}"
+        f" {'reads/s':>8} {'read p50':>9} {'p95':>8} {'p99':>8} {'errors':>7}"
+    )
+    for label, workers in (("inline", 0), ("pool", args.workers)):
+        fd, database_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        try:
+            app = make_app(database_path, workers, args.method)
+            seed(app, args.users)
+            logins, reads, errors = run(
+                app, args.users, args.logins, args.readers, args.duration
+            )
+            with app.app_context():
+                get_password_hasher().shutdown()
+
+            login_p = percentiles(logins)
+            read_p = percentiles(reads)
+            print(
+                f"{label:>8} {len(logins) / args.duration:>9.1f}"
+                f" {login_p[0]:>10.1f} {login_p[1]:>8.1f}"
+                f" {len(reads) / args.duration:>8.1f} {read_p[0]:>9.1f}"
+                f" {read_p[1]:>8.1f} {read_p[2]:>8.1f} {len(errors):>7}"
+            )
+            for error in sorted(set(errors))[:3]:
+                print(f"{'':>8} error: {error}")
+        finally:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(database_path + suffix):
+                    os.remove(database_path + suffix)
+
+
+if __name__ == "__main__":
+    main()
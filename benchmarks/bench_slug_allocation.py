@@ -0,0 +1,116 @@
+# benchmarks/bench_slug_allocation.py
+"""Benchmark slug allocation when many posts share the same title.
+
+Usage:
+    python benchmarks/bench_slug_allocation.py
+    python benchmarks/bench_slug_allocation.py --sizes 0 1000 10000 --samples 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import event
+
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models import PostModel, UserModel
+
+TITLE = "Weekly update"
+
+
+def make_app(database_path):
+    """Create an app bound to a throwaway SQLite database."""
+
+    class BenchmarkConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{database_path}"
+
+    return create_app(BenchmarkConfig)
+
+
+def bulk_insert_shared_slugs(author_id, start, count):
+    """Insert posts sharing one base slug directly, bypassing the ORM."""
+    base = PostModel.slugify(TITLE)
+    rows = [
+        {
+            "title": TITLE,
+            "content": "Benchmark body",
+            "slug": base if seq == 0 else f"{base}-{seq}",
+            "slug_base": base,
+            "slug_seq": seq,
+            "is_published": False,
+            "author_id": author_id,
+        }
+        for seq in range(start, start + count)
+    ]
+    if rows:
+        db.session.execute(db.insert(PostModel), rows)
+        db.session.commit()
+
+
+def measure_allocation(samples):
+    """Return (mean seconds, SQL statements) for one slug allocation."""
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    durations = []
+    for _ in range(samples):
+        post = PostModel(title=TITLE, content="Benchmark body")
+        statements.clear()
+        event.listen(db.engine, "before_cursor_execute", count_statement)
+        started = time.perf_counter()
+        post.generate_slug()
+        durations.append(time.perf_counter() - started)
+        event.remove(db.engine, "before_cursor_execute", count_statement)
+
+    return sum(durations) / len(durations), len(statements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[0, 10, 100, 1000, 10000]
+    )
+    parser.add_argument("--samples", type=int, default=100)
+    args = parser.parse_args()
+
+    fd, database_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+
+    try:
+        app = make_app(database_path)
+        with app.app_context():
+            author = UserModel.create_user(
+                username="bench", email="bench@example.com", password="bench"
+            )
+
+            print(f"{'existing posts':>15} {'mean us':>10} {'statements':>11}")
+            existing = 0
+            for size in sorted(args.sizes):
+                bulk_insert_shared_slugs(author.id, existing, size - existing)
+                existing = size
+                mean, statements = measure_allocation(args.samples)
+                print(f"{size:>15} {mean * 1e6:>10.1f} {statements:>11}")
+
+            plan = db.session.execute(
+                db.text(
+                    "EXPLAIN QUERY PLAN SELECT max(slug_seq) FROM posts "
+                    "WHERE slug_base = :base"
+                ),
+                {"base": PostModel.slugify(TITLE)},
+            ).all()
+            print("\nQuery plan:", "; ".join(row[-1] for row in plan))
+    finally:
+        os.remove(database_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+# benchmarks/bench_sqlite_concurrency.py
+"""Benchmark SQLite read latency while concurrent writers are committing.
+
+Compares SQLite's stock settings (rollback journal, synchronous=FULL, no
+writer queue) with the tuned profile (WAL, synchronous=NORMAL, mmap, larger
+page cache and the writer queue). Writers run in separate processes by
+default, like several app workers; ``--writer-mode thread`` keeps them in the
+reader process, where the writer queue applies.
+
+Usage:
+    python benchmarks/bench_sqlite_concurrency.py
+    python benchmarks/bench_sqlite_concurrency.py --readers 8 --writers 4 --duration 10
+    python benchmarks/bench_sqlite_concurrency.py --writer-mode thread
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models import PostModel, UserModel
+from app.services.post_service import PostService
+
+PROFILES = {
+    "stock": {
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_MMAP_SIZE": 0,
+        "SQLITE_CACHE_SIZE": -2000,
+        "SQLITE_BUSY_TIMEOUT": 5000,
+        "SQLITE_SERIALIZE_WRITES": False,
+    },
+    "tuned": {
+        "SQLITE_JOURNAL_MODE": "WAL",
+        "SQLITE_SYNCHRONOUS": "NORMAL",
+        "SQLITE_MMAP_SIZE": 256 * 1024 * 1024,
+        "SQLITE_CACHE_SIZE": -64 * 1024,
+        "SQLITE_BUSY_TIMEOUT": 5000,
+        "SQLITE_SERIALIZE_WRITES": True,
+    },
+}
+
+
+def make_app(database_path, settings):
+    """Create an app bound to a throwaway SQLite database."""
+    config = type(
+        "BenchmarkConfig",
+        (Config,),
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{database_path}",
+            "POST_CACHE_ENABLED": False,
+            **settings,
+        },
+    )
+    return create_app(config)
+
+
+def seed(app, posts):
+    """Create an author with published posts to read."""
+    with app.app_context():
+        author = UserModel.create_user(
+            username="bench", email="bench@example.com", password="bench"
+        )
+        published_at = datetime.now(UTC)
+        db.session.execute(
+            db.insert(PostModel),
+            [
+                {
+                    "title": f"Seed post {index}",
+                    "content": "Benchmark body " * 50,
+                    "slug": f"seed-post-{index}",
+                    "slug_base": f"seed-post-{index}",
+                    "slug_seq": 0,
+                    "is_published": True,
+                    "published_at": published_at,
+                    "author_id": author.id,
+                }
+                for index in range(posts)
+            ],
+        )
+        db.session.commit()
+        return author.id
+
+
+def write_posts(app, author_id, worker, stop):
+    """Create posts until stopped; return write latencies and errors."""
+    latencies, errors = [], []
+    while not stop.is_set():
+        started = time.perf_counter()
+        with app.app_context():
+            result = PostService.create_post(
+                title=f"Writer {worker} post {len(latencies)}",
+                content="Written during the benchmark",
+                author_id=author_id,
+                is_published=True,
+            )
+        latencies.append(time.perf_counter() - started)
+        if result["error"]:
+            errors.append(result["error"])
+    return latencies, errors
+
+
+def writer_process(database_path, settings, author_id, worker, ready, stop, results):
+    """Writer running in its own process, as with several app workers."""
+    app = make_app(database_path, settings)
+    ready.release()
+    results.put(write_posts(app, author_id, worker, stop))
+
+
+def run_workers(app, database_path, settings, author_id, args):
+    """Run readers and writers concurrently; return latencies and errors."""
+    read_latencies, write_latencies, errors = [], [], []
+
+    def read_loop(stop):
+        while not stop.is_set():
+            started = time.perf_counter()
+            with app.app_context():
+                posts = PostService.get_all_posts(limit=20)
+                [post.title for post in posts]
+            read_latencies.append(time.perf_counter() - started)
+
+    def write_loop(stop, worker):
+        latencies, worker_errors = write_posts(app, author_id, worker, stop)
+        write_latencies.extend(latencies)
+        errors.extend(worker_errors)
+
+    if args.writer_mode == "process":
+        context = multiprocessing.get_context("spawn")
+        stop, ready, results = context.Event(), context.Semaphore(0), context.Queue()
+        writers = [
+            context.Process(
+                target=writer_process,
+                args=(database_path, settings, author_id, worker, ready, stop, results),
+            )
+            for worker in range(args.writers)
+        ]
+    else:
+        stop = threading.Event()
+        writers = [
+            threading.Thread(target=write_loop, args=(stop, worker))
+            for worker in range(args.writers)
+        ]
+
+    for writer in writers:
+        writer.start()
+    if args.writer_mode == "process":
+        for _ in writers:
+            ready.acquire()
+
+    readers = [
+        threading.Thread(target=read_loop, args=(stop,)) for _ in range(args.readers)
+    ]
+    for reader in readers:
+        reader.start()
+    time.sleep(args.duration)
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    if args.writer_mode == "process":
+        for _ in writers:
+            latencies, worker_errors = results.get()
+            write_latencies.extend(latencies)
+            errors.extend(worker_errors)
+    for writer in writers:
+        writer.join()
+
+    return read_latencies, write_latencies, errors
+
+
+def percentiles(latencies):
+    """Return p50/p95/p99 in milliseconds."""
+    if len(latencies) < 2:
+        return [latency * 1000 for latency in latencies * 3][:3] or [0.0] * 3
+    cuts = statistics.quantiles(latencies, n=100)
+    return [cuts[49] * 1000, cuts[94] * 1000, cuts[98] * 1000]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument(
+        "--writer-mode",
+        choices=["process", "thread"],
+        default="process",
+        help="writers in separate processes (no GIL contention) or in threads",
+    )
+    parser.add_argument(
+        "--profiles", nargs="+", choices=sorted(PROFILES), default=["stock", "tuned"]
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'profile':>8} {'reads':>7} {'read p50':>9} {'p95':>8} {'p99':>8}"
+        f" {'writes':>7} {'write p50':>10} {'p95':>8} {'errors':>7}"
+    )
+    for name in args.profiles:
+        fd, database_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        try:
+            app = make_app(database_path, PROFILES[name])
+            author_id = seed(app, args.posts)
+            reads, writes, errors = run_workers(
+                app, database_path, PROFILES[name], author_id, args
+            )
+            with app.app_context():
+                db.engine.dispose()
+
+            read_p = percentiles(reads)
+            write_p = percentiles(writes)
+            print(
+                f"{name:>8} {len(reads):>7} {read_p[0]:>9.2f} {read_p[1]:>8.2f}"
+                f" {read_p[2]:>8.2f} {len(writes):>7} {write_p[0]:>10.2f}"
+                f" {write_p[1]:>8.2f} {len(errors):>7}"
+            )
+            for error in sorted(set(errors))[:3]:
+                print(f"{'':>8} error: {error}")
+        finally:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(database_path + suffix):
+                    os.remove(database_path + suffix)
+
+
+if __name__ == "__main__":
+    main()
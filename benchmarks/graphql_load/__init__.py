@@ -0,0 +1,18 @@
+# benchmarks/graphql_load/__init__.py
+"""Load test for the GraphQL endpoint.
+
+Generates a synthetic blog, replays a weighted mix of standard operations
+through the Flask test client and a multi-threaded HTTP driver, and writes
+throughput, latency percentiles and SQL statements per operation as JSON so
+runs can be compared.
+
+Usage (from the repository root):
+    python -m benchmarks.graphql_load --output baseline.json
+    python -m benchmarks.graphql_load --posts 20000 --threads 8 --duration 30
+    python -m benchmarks.graphql_load --compare baseline.json
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
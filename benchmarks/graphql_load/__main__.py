@@ -0,0 +1,202 @@
+# benchmarks/graphql_load/__main__.py
+"""Command line entry point: ``python -m benchmarks.graphql_load``."""
+
+import argparse
+import dataclasses
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import UTC, datetime
+
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models import UserModel
+from app.passwords import get_password_hasher
+
+from . import __doc__ as package_doc
+from .data import DataSpec, generate
+from .drivers import HttpDriver, SqlCounter, TestClientDriver, run_mix, serve
+from .operations import STANDARD_MIX, MixContext
+from .report import compare, summarize
+
+
+def make_app(database_path, http_cache):
+    """Create an app bound to a throwaway SQLite database."""
+    config = type(
+        "BenchmarkConfig",
+        (Config,),
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{database_path}",
+            "GRAPHQL_HTTP_CACHE_ENABLED": http_cache,
+        },
+    )
+    return create_app(config)
+
+
+def git_commit():
+    """Return the checked out commit, if any."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_driver(driver, app, args, context):
+    """Warm up, then run the mix and summarize it."""
+    counter = SqlCounter(app) if app is not None else None
+    run_mix(driver, STANDARD_MIX, context, args.threads, args.warmup, args.seed)
+
+    if counter is None:
+        samples, elapsed = run_mix(
+            driver, STANDARD_MIX, context, args.threads, args.duration, args.seed
+        )
+        return summarize(samples, elapsed)
+
+    with counter.listening():
+        samples, elapsed = run_mix(
+            driver, STANDARD_MIX, context, args.threads, args.duration, args.seed
+        )
+    return summarize(samples, elapsed, counter.counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=package_doc.splitlines()[0],
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    spec_defaults = DataSpec()
+    parser.add_argument("--users", type=int, default=spec_defaults.users)
+    parser.add_argument("--posts", type=int, default=spec_defaults.posts)
+    parser.add_argument("--tags", type=int, default=spec_defaults.tags)
+    parser.add_argument(
+        "--body-words",
+        type=int,
+        default=spec_defaults.body_words_median,
+        help="median post length in words",
+    )
+    parser.add_argument(
+        "--body-sigma",
+        type=float,
+        default=spec_defaults.body_words_sigma,
+        help="spread of the log-normal post length",
+    )
+    parser.add_argument("--seed", type=int, default=spec_defaults.seed)
+    parser.add_argument(
+        "--driver", choices=["test-client", "http", "both"], default="both"
+    )
+    parser.add_argument(
+        "--url",
+        help="benchmark a running server over HTTP instead (seeded the same way)",
+    )
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="seconds per driver"
+    )
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds per driver")
+    parser.add_argument(
+        "--http-cache", action="store_true", help="keep GraphQL HTTP caching enabled"
+    )
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument(
+        "--compare", help="earlier JSON report to check for regressions"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="relative latency/throughput change tolerated by --compare",
+    )
+    args = parser.parse_args()
+
+    spec = DataSpec(
+        users=args.users,
+        posts=args.posts,
+        tags=args.tags,
+        body_words_median=args.body_words,
+        body_words_sigma=args.body_sigma,
+        seed=args.seed,
+    )
+    report = {
+        "meta": {
+            "started_at": datetime.now(UTC).isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "threads": args.threads,
+            "duration_s": args.duration,
+            "data": dataclasses.asdict(spec),
+        },
+        "runs": {},
+    }
+
+    if args.url:
+        # The server's database is expected to hold the same generated users
+        driver = HttpDriver(args.url)
+        _, body = driver.post({"query": "{ posts(limit: 500) { slug } }"}, {})
+        context = MixContext(
+            slugs=[post["slug"] for post in body["data"]["posts"]],
+            usernames=[f"bench{index}" for index in range(spec.users)],
+        )
+        report["runs"]["http"] = run_driver(driver, None, args, context)
+    else:
+        fd, database_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        try:
+            app = make_app(database_path, args.http_cache)
+            with app.app_context():
+                print("Generating data...", file=sys.stderr)
+                slugs = generate(spec)
+                usernames = db.session.scalars(
+                    db.select(UserModel.username).where(
+                        UserModel.username.like("bench%")
+                    )
+                ).all()
+            context = MixContext(slugs=slugs, usernames=usernames)
+
+            if args.driver in ("test-client", "both"):
+                print("Running through the test client...", file=sys.stderr)
+                report["runs"]["test-client"] = run_driver(
+                    TestClientDriver(app), app, args, context
+                )
+            if args.driver in ("http", "both"):
+                print("Running over HTTP...", file=sys.stderr)
+                with serve(app) as url:
+                    report["runs"]["http"] = run_driver(
+                        HttpDriver(url), app, args, context
+                    )
+
+            with app.app_context():
+                get_password_hasher().shutdown()
+        finally:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(database_path + suffix):
+                    os.remove(database_path + suffix)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = compare(json.load(file), report, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
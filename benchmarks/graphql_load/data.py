@@ -0,0 +1,101 @@
+# benchmarks/graphql_load/data.py
+"""Synthetic blog data on top of the sample data of ``setup_db``."""
+
+import contextlib
+import json
+import random
+import sys
+from dataclasses import dataclass
+
+from app.extensions import db
+from app.models import PostModel
+from app.passwords import get_password_hasher
+from app.transfer import import_lines
+from setup_db import create_sample_data
+
+PASSWORD = "bench-password"
+
+WORDS = (
+    "api cache graphql python flask query index latency schema resolver "
+    "database replica token session request response server client async "
+    "thread process pool memory cursor batch stream search ranking feed "
+    "author draft publish markdown render excerpt slug tag counter metric"
+).split()
+
+
+@dataclass
+class DataSpec:
+    """Size and shape of the generated data."""
+
+    users: int = 50
+    posts: int = 2000
+    tags: int = 40
+    max_tags_per_post: int = 4
+    # Body length in words follows a log-normal distribution
+    body_words_median: int = 300
+    body_words_sigma: float = 0.8
+    published_ratio: float = 0.8
+    seed: int = 42
+
+
+def _sentence(rng, words):
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _body(rng, spec):
+    words = max(
+        5, int(rng.lognormvariate(0, spec.body_words_sigma) * spec.body_words_median)
+    )
+    paragraphs = []
+    while words > 0:
+        length = min(words, rng.randint(20, 80))
+        paragraphs.append(_sentence(rng, length))
+        words -= length
+    return "## " + _sentence(rng, 4) + "\n\n" + "\n\n".join(paragraphs)
+
+
+def records(spec, password_hash):
+    """Yield users, then posts, as NDJSON lines for ``import_lines``."""
+    rng = random.Random(spec.seed)
+    tags = [f"{rng.choice(WORDS)}-{index}" for index in range(spec.tags)]
+    # Few distinct titles, so many posts share a base slug
+    titles = [_sentence(rng, 3)[:-1] for _ in range(max(1, spec.posts // 20))]
+
+    for index in range(spec.users):
+        yield json.dumps(
+            {
+                "type": "user",
+                "username": f"bench{index}",
+                "email": f"bench{index}@example.com",
+                "password_hash": password_hash,
+            }
+        )
+
+    for _ in range(spec.posts):
+        post_tags = rng.sample(tags, rng.randint(0, spec.max_tags_per_post))
+        yield json.dumps(
+            {
+                "type": "post",
+                "author": f"bench{rng.randrange(spec.users)}",
+                "title": rng.choice(titles),
+                "content": _body(rng, spec),
+                "tags": ", ".join(post_tags) or None,
+                "is_published": rng.random() < spec.published_ratio,
+            }
+        )
+
+
+def generate(spec):
+    """Fill the empty database of the current app; return the post slugs."""
+    # The sample data prints progress; keep stdout for the report
+    with contextlib.redirect_stdout(sys.stderr):
+        create_sample_data()
+
+    # One hash shared by every user: hashing is benchmarked by login, not here
+    password_hash = get_password_hasher().hash(PASSWORD)
+    import_lines(records(spec, password_hash), batch_size=1000)
+
+    return db.session.scalars(
+        db.select(PostModel.slug).where(PostModel.is_published.is_(True))
+    ).all()
@@ -0,0 +1,167 @@
+# benchmarks/graphql_load/drivers.py
+"""Drive the operation mix through the test client or over HTTP."""
+
+import json
+import logging
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from contextlib import contextmanager
+
+from flask import has_request_context, request
+from sqlalchemy import event
+from werkzeug.serving import make_server
+
+from app.extensions import db
+
+from .data import PASSWORD
+from .operations import LOGIN
+
+# Tells the in-process SQL counter which operation a request belongs to
+OPERATION_HEADER = "X-Benchmark-Operation"
+
+
+class SqlCounter:
+    """Counts statements per operation on every engine of the app."""
+
+    def __init__(self, app):
+        with app.app_context():
+            self.engines = list(db.engines.values())
+        self.counts = Counter()
+        self._lock = threading.Lock()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            operation = request.headers.get(OPERATION_HEADER)
+            if operation:
+                with self._lock:
+                    self.counts[operation] += 1
+
+    @contextmanager
+    def listening(self):
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._count)
+        try:
+            yield self
+        finally:
+            for engine in self.engines:
+                event.remove(engine, "before_cursor_execute", self._count)
+
+
+class TestClientDriver:
+    """Calls the app in-process, without sockets or a WSGI server."""
+
+    name = "test-client"
+
+    def __init__(self, app):
+        self.app = app
+        self._local = threading.local()
+
+    def post(self, payload, headers):
+        if not hasattr(self._local, "client"):
+            self._local.client = self.app.test_client()
+        response = self._local.client.post(
+            "/api/graphql", json=payload, headers=headers
+        )
+        return response.status_code, response.get_json(silent=True)
+
+
+class HttpDriver:
+    """Calls a GraphQL endpoint over HTTP, one connection per request."""
+
+    name = "http"
+
+    def __init__(self, url):
+        self.url = url
+
+    def post(self, payload, headers):
+        body = json.dumps(payload).encode()
+        http_request = urllib.request.Request(
+            self.url,
+            data=body,
+            headers={"Content-Type": "application/json", **headers},
+        )
+        try:
+            with urllib.request.urlopen(http_request, timeout=30) as response:
+                return response.status, json.loads(response.read() or b"null")
+        except urllib.error.HTTPError as e:
+            return e.code, None
+
+
+@contextmanager
+def serve(app):
+    """Serve the app with a threaded WSGI server on a free local port."""
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)  # No access log
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.port}/api/graphql"
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def _login(driver, username):
+    payload = {
+        "query": LOGIN,
+        "variables": {"username": username, "password": PASSWORD},
+    }
+    _, body = driver.post(payload, {})
+    return body["data"]["login"]["accessToken"]
+
+
+def run_mix(driver, mix, context, threads, duration, seed=0):
+    """Run the weighted mix from ``threads`` threads for ``duration`` seconds.
+
+    Returns ``(operation, seconds, error)`` samples, ``error`` being None for
+    successful requests, and the measured time.
+    """
+    samples = []
+    stop = threading.Event()
+    ready = threading.Barrier(threads + 1)
+    weights = [operation.weight for operation in mix]
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        # Each thread acts as one signed-in user; signing in is not timed
+        try:
+            token = _login(driver, context.usernames[index % len(context.usernames)])
+        finally:
+            ready.wait()
+        local = []
+        while not stop.is_set():
+            operation = rng.choices(mix, weights)[0]
+            headers = {OPERATION_HEADER: operation.name}
+            if operation.authenticated:
+                headers["Authorization"] = f"Bearer {token}"
+            payload = {
+                "query": operation.query,
+                "variables": operation.variables(rng, context),
+            }
+
+            started = time.perf_counter()
+            status, body = driver.post(payload, headers)
+            elapsed = time.perf_counter() - started
+            if status != 200 or body is None:
+                error = f"HTTP {status}"
+            else:
+                error = (body.get("errors") or [{}])[0].get("message")
+            local.append((operation.name, elapsed, error))
+        samples.extend(local)
+
+    workers = [
+        threading.Thread(target=worker, args=(index,)) for index in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    ready.wait()
+    started = time.perf_counter()
+    time.sleep(duration)
+    stop.set()
+    for thread in workers:
+        thread.join()
+    return samples, time.perf_counter() - started
@@ -0,0 +1,77 @@
+# benchmarks/graphql_load/operations.py
+"""The standard operation mix."""
+
+from dataclasses import dataclass
+
+from .data import PASSWORD, WORDS
+
+POST_LIST = """
+query PostList {
+  posts(limit: 20) { id title slug excerpt author { username } tagList }
+}
+"""
+POST_BY_SLUG = """
+query PostBySlug($slug: String!) {
+  postBySlug(slug: $slug) { id title contentHtml author { username } tagList }
+}
+"""
+SEARCH = """
+query Search($term: String!) {
+  searchPosts(searchTerm: $term) { id title excerpt }
+}
+"""
+ME = "query Me { me { id username postCount } }"
+CREATE_POST = """
+mutation CreatePost($title: String!, $content: String!) {
+  createPost(postInput: {title: $title, content: $content, tags: "benchmark"}) {
+    id slug
+  }
+}
+"""
+LOGIN = """
+mutation Login($username: String!, $password: String!) {
+  login(loginInput: {username: $username, password: $password}) { accessToken }
+}
+"""
+
+
+@dataclass(frozen=True)
+class Operation:
+    """A GraphQL operation, how often it runs and how to fill its variables."""
+
+    name: str
+    query: str
+    weight: int
+    authenticated: bool = False
+
+    def variables(self, rng, context):
+        if self.name == "post_by_slug":
+            return {"slug": rng.choice(context.slugs)}
+        if self.name == "search":
+            return {"term": rng.choice(WORDS)}
+        if self.name == "create_post":
+            return {
+                "title": f"Benchmark {rng.choice(WORDS)}",
+                "content": " ".join(rng.choice(WORDS) for _ in range(120)),
+            }
+        if self.name == "login":
+            return {"username": rng.choice(context.usernames), "password": PASSWORD}
+        return {}
+
+
+STANDARD_MIX = (
+    Operation("post_list", POST_LIST, weight=30),
+    Operation("post_by_slug", POST_BY_SLUG, weight=25),
+    Operation("search", SEARCH, weight=15),
+    Operation("me", ME, weight=15, authenticated=True),
+    Operation("create_post", CREATE_POST, weight=5, authenticated=True),
+    Operation("login", LOGIN, weight=10),
+)
+
+
+@dataclass
+class MixContext:
+    """Data the operations draw their variables from."""
+
+    slugs: list
+    usernames: list
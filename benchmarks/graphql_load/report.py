@@ -0,0 +1,100 @@
+# benchmarks/graphql_load/report.py
+"""Summaries of a run, and comparison against an earlier report."""
+
+import statistics
+from collections import defaultdict
+
+
+def percentiles(latencies):
+    """Return p50/p95/p99 in milliseconds."""
+    if len(latencies) < 2:
+        return [round(latency * 1000, 3) for latency in latencies * 3][:3] or [0.0] * 3
+    cuts = statistics.quantiles(latencies, n=100)
+    return [round(cuts[index] * 1000, 3) for index in (49, 94, 98)]
+
+
+def _summary(latencies, errors, elapsed, statements):
+    p50, p95, p99 = percentiles(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "error_sample": errors[0] if errors else None,
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "p50_ms": p50,
+        "p95_ms": p95,
+        "p99_ms": p99,
+        "sql_per_request": (
+            round(statements / len(latencies), 2)
+            if statements is not None and latencies
+            else None
+        ),
+    }
+
+
+def summarize(samples, elapsed, sql_counts=None):
+    """Summarize ``(operation, seconds, error)`` samples per operation and overall.
+
+    ``sql_counts`` maps operations to statements executed; None when the
+    server runs out of process and statements cannot be counted.
+    """
+    latencies, errors = defaultdict(list), defaultdict(list)
+    for name, seconds, error in samples:
+        latencies[name].append(seconds)
+        if error is not None:
+            errors[name].append(error)
+
+    operations = {
+        name: _summary(
+            latencies[name],
+            errors[name],
+            elapsed,
+            sql_counts.get(name, 0) if sql_counts is not None else None,
+        )
+        for name in sorted(latencies)
+    }
+    total = _summary(
+        [seconds for _, seconds, _ in samples],
+        [error for _, _, error in samples if error is not None],
+        elapsed,
+        sum(sql_counts.values()) if sql_counts is not None else None,
+    )
+    return {"elapsed_s": round(elapsed, 3), "total": total, "operations": operations}
+
+
+def compare(baseline, current, tolerance=0.2):
+    """Return regressions of ``current`` against ``baseline`` as messages.
+
+    Latency or throughput moving the wrong way by more than ``tolerance``
+    (relative), or any extra SQL statement per request, counts as a regression.
+    """
+    regressions = []
+    for driver, run in current["runs"].items():
+        base_run = baseline.get("runs", {}).get(driver)
+        if base_run is None:
+            continue
+
+        for name, stats in run["operations"].items():
+            base = base_run["operations"].get(name)
+            if base is None:
+                continue
+            label = f"{driver} {name}"
+
+            if base["p95_ms"] and stats["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{label}: p95 {base['p95_ms']:.1f} -> {stats['p95_ms']:.1f} ms"
+                )
+            if stats["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+                regressions.append(
+                    f"{label}: throughput {base['throughput_rps']:.1f}"
+                    f" -> {stats['throughput_rps']:.1f} req/s"
+                )
+            if (
+                base["sql_per_request"] is not None
+                and stats["sql_per_request"] is not None
+                and stats["sql_per_request"] >= base["sql_per_request"] + 1
+            ):
+                regressions.append(
+                    f"{label}: SQL per request {base['sql_per_request']}"
+                    f" -> {stats['sql_per_request']}"
+                )
+    return regressions
@@ -1,31 +1,64 @@
 # src/app/__init__.py
 from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 from app.api import create_graphql_blueprint
+from app.api.persisted_queries import init_persisted_queries
+from app.cache import init_cache
 from app.config import Config
+from app.engine import configure_engine, init_engine
 from app.extensions import db, init_extensions
+from app.http_cache import init_http_cache
+from app.passwords import init_password_hasher
+from app.revocation import init_revocation
 
 
 def create_app(config_class=Config):
     """Create Flask application."""
     app = Flask(__name__)
     app.config.from_object(config_class)
+    if app.config["TRUSTED_PROXY_COUNT"]:
+        # Take the client address and scheme from the trusted proxies' headers
+        proxies = app.config["TRUSTED_PROXY_COUNT"]
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxies, x_proto=proxies)
 
     # DEBUG: Print the actual database URI being used
     print(f"Database URI: {app.config['SQLALCHEMY_DATABASE_URI']}")
 
     # Initialize extensions
+    configure_engine(app)
     init_extensions(app)
+    init_engine(app)
+    init_cache(app)
+    init_persisted_queries(app)
+    init_http_cache(app)
+    init_password_hasher(app)
+    init_revocation(app)
 
     # Import models so they're registered with SQLAlchemy
-    from app.models import PostModel, UserModel  # noqa: F401
+    from app.models import (  # noqa: F401
+        PostModel,
+        RevokedTokenModel,
+        TagModel,
+        UserModel,
+    )
 
     # Register GraphQL API blueprint
     graphql_bp = create_graphql_blueprint()
     app.register_blueprint(graphql_bp, url_prefix="/api")
 
-    # Create database tables
+    # Register management commands
+    from app.commands import register_commands
+
+    register_commands(app)
+
+    # Create database tables on the primary; replicas get them by replication
     with app.app_context():
-        db.create_all()
+        db.create_all(bind_key=None)
+
+    # Install the full-text search index for the configured database
+    from app.search import init_search
+
+    init_search(app)
 
     return app
@@ -1,8 +1,31 @@
 # app/api/graphql_view.py
-from flask import Blueprint
-from flask_jwt_extended import verify_jwt_in_request
+import dataclasses
+
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    g,
+    request,
+    send_from_directory,
+)
 from strawberry.flask.views import GraphQLView
 
+from app.api.persisted_queries import PersistedQueryError, get_persisted_query_store
+from app.engine import PoolTimeoutError, pool_stats
+from app.extensions import db
+from app.http_cache import apply_cache_headers
+from app.identity import current_identity
+from app.metrics import CONTENT_TYPE, render_metrics
+from app.profiling import (
+    PROFILE_ID,
+    PROFILE_ID_HEADER,
+    is_admin,
+    profile_directory,
+    request_profile,
+)
+from app.schemas.loaders import Loaders
 from app.schemas.schema import schema
 
 
@@ -13,14 +36,86 @@ class CustomGraphQLView(GraphQLView):
         """Add authentication context to GraphQL requests."""
         context = super().get_context(request, response)
 
-        # Try to verify JWT token if present
-        try:
-            verify_jwt_in_request(optional=True)
-        except Exception:
-            pass  # Continue without authentication
+        # Fresh batch loaders per request so cached rows never leak between users
+        context["loaders"] = Loaders()
+
+        # Token and user are resolved on first use, once per request
+        context["identity"] = current_identity()
+
+        # Profiled requests name their profile in the slow-operation log
+        context["profile_id"] = g.get("profile_id")
 
         return context
 
+    def parse_http_body(self, request):
+        """Resolve Automatic Persisted Query hashes to their query text."""
+        request_data = super().parse_http_body(request)
+        query = get_persisted_query_store().resolve(
+            request_data.query, request_data.extensions
+        )
+        return dataclasses.replace(request_data, query=query)
+
+    def process_result(self, request, result):
+        """Tag errors caused by an exhausted connection pool."""
+        response_data = super().process_result(request, result)
+        for error, formatted in zip(
+            result.errors or [], response_data.get("errors") or [], strict=False
+        ):
+            if isinstance(error.original_error, PoolTimeoutError):
+                formatted.setdefault("extensions", {})["code"] = "DATABASE_BUSY"
+        return response_data
+
+    def create_response(self, response_data, sub_response):
+        """Make successful GET queries cacheable and conditional."""
+        response = super().create_response(response_data, sub_response)
+
+        if any(
+            (error.get("extensions") or {}).get("code") == "DATABASE_BUSY"
+            for error in response_data.get("errors") or []
+        ):
+            # Fail fast so clients and load balancers retry elsewhere
+            response.status_code = 503
+            response.headers["Retry-After"] = "1"
+            return response
+
+        if (
+            request.method == "GET"
+            and current_app.config["GRAPHQL_HTTP_CACHE_ENABLED"]
+            and not response_data.get("errors")
+        ):
+            apply_cache_headers(response, request)
+            response.make_conditional(request)
+
+        return response
+
+    def dispatch_request(self):
+        """Profile the request when asked to, see ``app.profiling``."""
+        profile = request_profile()
+        if profile is None:
+            return self._dispatch()
+
+        profile.start()
+        g.profile_id = profile.id
+        try:
+            response = self._dispatch()
+        finally:
+            profile.stop()
+        response.headers[PROFILE_ID_HEADER] = profile.id
+        return response
+
+    def _dispatch(self):
+        """Return APQ protocol errors in the shape Apollo clients expect."""
+        try:
+            return super().dispatch_request()
+        except PersistedQueryError as e:
+            return Response(
+                self.encode_json(
+                    {"errors": [{"message": e.message, "extensions": {"code": e.code}}]}
+                ),
+                status=200,
+                content_type="application/json",
+            )
+
 
 def create_graphql_blueprint():
     """Create GraphQL API blueprint."""
@@ -41,4 +136,36 @@ def create_graphql_blueprint():
         """Simple health check endpoint."""
         return {"status": "healthy", "service": "GraphQL Blog API"}
 
+    @api_bp.route("/cache/stats")
+    def cache_stats():
+        """Hit, miss and eviction counters for sizing the in-process caches."""
+        caches = {
+            "post": current_app.extensions.get("post_cache"),
+            "token": current_app.extensions.get("token_cache"),
+            "user": current_app.extensions.get("user_cache"),
+            "token_revocations": current_app.extensions.get("token_revocations"),
+        }
+        return {
+            name: cache.stats() if cache else None for name, cache in caches.items()
+        }
+
+    @api_bp.route("/pool/stats")
+    def pool_stats_view():
+        """Connection pool usage and checkout waits for sizing the pool."""
+        return pool_stats(db.engine)
+
+    @api_bp.route("/profiles/<profile_id>")
+    def download_profile(profile_id):
+        """Download a request profile; admins only."""
+        if not is_admin() or not PROFILE_ID.match(profile_id):
+            abort(404)
+        return send_from_directory(profile_directory(), profile_id, as_attachment=True)
+
+    @api_bp.route("/metrics")
+    def metrics():
+        """Latencies, errors, pool and cache figures in the Prometheus format."""
+        if not current_app.config["METRICS_ENABLED"]:
+            abort(404)
+        return Response(render_metrics(), content_type=CONTENT_TYPE)
+
     return api_bp
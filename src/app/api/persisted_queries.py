@@ -0,0 +1,122 @@
+# app/api/persisted_queries.py
+"""Automatic Persisted Queries (APQ) registry.
+
+Clients send ``extensions.persistedQuery.sha256Hash`` instead of the query text;
+unknown hashes get a ``PersistedQueryNotFound`` error, after which the client
+resends the full query together with its hash to register it.
+"""
+
+import hashlib
+import json
+
+from flask import current_app
+
+from app.cache import TTLCache
+
+APQ_VERSION = 1
+
+
+class PersistedQueryError(Exception):
+    """APQ protocol error returned to clients as a GraphQL error."""
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+class PersistedQueryStore:
+    """Resolves query hashes from a fixed manifest and a bounded APQ cache."""
+
+    def __init__(
+        self,
+        registered: dict[str, str] | None = None,
+        strict: bool = False,
+        max_size: int = 1000,
+        ttl: float = 86400.0,
+    ):
+        self.registered = dict(registered or {})
+        self.strict = strict
+        self.cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    @staticmethod
+    def hash_query(query: str) -> str:
+        """Return the APQ sha256 hash of a query."""
+        return hashlib.sha256(query.encode()).hexdigest()
+
+    def lookup(self, query_hash: str) -> str | None:
+        """Return the query text registered under a hash."""
+        return self.registered.get(query_hash) or self.cache.get(query_hash)
+
+    def resolve(self, query: str | None, extensions: dict | None) -> str | None:
+        """Return the query text to execute for a request."""
+        persisted = (extensions or {}).get("persistedQuery")
+
+        if not persisted:
+            if self.strict:
+                raise PersistedQueryError(
+                    "Only persisted queries are accepted",
+                    "PERSISTED_QUERY_REQUIRED",
+                )
+            return query
+
+        if persisted.get("version") != APQ_VERSION:
+            raise PersistedQueryError(
+                "Unsupported persisted query version", "PERSISTED_QUERY_INVALID"
+            )
+
+        query_hash = persisted.get("sha256Hash")
+        if not isinstance(query_hash, str):
+            raise PersistedQueryError(
+                "Missing persisted query hash", "PERSISTED_QUERY_INVALID"
+            )
+
+        if query is None:
+            stored = self.lookup(query_hash)
+            if stored is None:
+                raise PersistedQueryError(
+                    "PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"
+                )
+            return stored
+
+        if self.hash_query(query) != query_hash:
+            raise PersistedQueryError(
+                "provided sha does not match query", "PERSISTED_QUERY_INVALID"
+            )
+
+        if query_hash not in self.registered:
+            if self.strict:
+                raise PersistedQueryError(
+                    "PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED"
+                )
+            self.cache.set(query_hash, query)
+
+        return query
+
+
+def load_manifest(path: str | None) -> dict[str, str]:
+    """Load a {sha256: query} manifest; a list of queries is hashed on load."""
+    if not path:
+        return {}
+
+    with open(path, encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+
+    if isinstance(manifest, list):
+        return {PersistedQueryStore.hash_query(query): query for query in manifest}
+    return manifest
+
+
+def init_persisted_queries(app):
+    """Create the persisted query store from config."""
+    app.extensions["persisted_queries"] = PersistedQueryStore(
+        registered=load_manifest(app.config["GRAPHQL_PERSISTED_QUERIES_FILE"]),
+        strict=app.config["GRAPHQL_PERSISTED_QUERIES_STRICT"],
+        max_size=app.config["GRAPHQL_APQ_CACHE_SIZE"],
+        ttl=app.config["GRAPHQL_APQ_CACHE_TTL"],
+    )
+
+
+def get_persisted_query_store() -> PersistedQueryStore:
+    """Return the persisted query store of the current app."""
+    return current_app.extensions["persisted_queries"]
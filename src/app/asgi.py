@@ -0,0 +1,105 @@
+# app/asgi.py
+"""ASGI application serving the async GraphQL schema.
+
+Runs side by side with the Flask app against the same database: the Flask app
+still owns configuration, JWT settings, the search backend and cache hooks,
+and its app context is pushed for every ASGI request so those keep working.
+"""
+
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from strawberry.asgi import GraphQL
+
+from app import create_app
+from app.async_db import init_async_db
+from app.config import Config
+from app.metrics import CONTENT_TYPE, render_metrics
+from app.schemas.async_loaders import AsyncLoaders
+from app.schemas.async_schema import async_schema
+from app.services.async_auth_service import AsyncAuthService
+
+
+class FlaskAppContextMiddleware:
+    """Push the Flask app context around each ASGI request."""
+
+    def __init__(self, app, flask_app):
+        self.app = app
+        self.flask_app = flask_app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.app(scope, receive, send)
+            return
+
+        with self.flask_app.app_context():
+            await self.app(scope, receive, send)
+
+
+class AsyncGraphQLView(GraphQL):
+    """Strawberry ASGI view with per-request loaders and the JWT identity."""
+
+    async def get_context(self, request, response) -> dict:
+        claims = await AsyncAuthService.get_token_claims(
+            request.headers.get("Authorization")
+        )
+        return {
+            "request": request,
+            "response": response,
+            "token_claims": claims,
+            "user_id": claims["sub"] if claims else None,
+            "async_loaders": AsyncLoaders(),
+        }
+
+
+async def health_check(request):
+    """Simple health check endpoint."""
+    return JSONResponse(
+        {"status": "healthy", "service": "GraphQL Blog API", "mode": "asgi"}
+    )
+
+
+async def metrics(request):
+    """Latencies, errors, pool and cache figures in the Prometheus format."""
+    return Response(render_metrics(), headers={"Content-Type": CONTENT_TYPE})
+
+
+def create_asgi_app(config_class=Config):
+    """ASGI application factory."""
+    flask_app = create_app(config_class)
+    engine = init_async_db(flask_app)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await engine.dispose()
+
+    graphql_view = AsyncGraphQLView(
+        async_schema,
+        graphql_ide="graphiql" if flask_app.config["GRAPHQL_PLAYGROUND"] else None,
+    )
+
+    routes = [
+        Route("/api/graphql", graphql_view, methods=["GET", "POST"]),
+        Route("/api/health", health_check),
+    ]
+    if flask_app.config["METRICS_ENABLED"]:
+        routes.append(Route("/api/metrics", metrics))
+
+    return Starlette(
+        routes=routes,
+        middleware=[
+            Middleware(
+                CORSMiddleware,
+                allow_origins=flask_app.config["CORS_ORIGINS"],
+                allow_methods=["GET", "POST"],
+                allow_headers=["Authorization", "Content-Type"],
+            ),
+            Middleware(FlaskAppContextMiddleware, flask_app=flask_app),
+        ],
+        lifespan=lifespan,
+    )
@@ -0,0 +1,53 @@
+# app/async_db.py
+"""Async SQLAlchemy engine and sessions for the ASGI app.
+
+The models are shared with the Flask app; only the driver differs. Each
+service call opens its own ``AsyncSession`` because a session must not be
+used by concurrently running resolvers.
+"""
+
+from flask import current_app
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.engine import apply_sqlite_profile, engine_options
+from app.extensions import db
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url):
+    """Return the async driver variant of a database URL."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r}")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def init_async_db(app):
+    """Create the async engine and session factory of the app."""
+    url = app.config["ASYNC_DATABASE_URL"]
+    if not url:
+        # Flask-SQLAlchemy resolves relative SQLite paths against the instance
+        # folder, so derive the URL from its engine rather than the raw config
+        with app.app_context():
+            url = async_database_url(db.engine.url)
+
+    # Same pool sizing as the sync engine, on the async-adapted pool
+    engine = create_async_engine(url, **engine_options(url, app.config, poolclass=None))
+    apply_sqlite_profile(engine.sync_engine, app.config)
+    app.extensions["async_engine"] = engine
+    # Objects outlive their session, so keep loaded attributes after commit
+    app.extensions["async_sessionmaker"] = async_sessionmaker(
+        engine, expire_on_commit=False
+    )
+    return engine
+
+
+def async_session() -> AsyncSession:
+    """Open a new async session on the current app's engine."""
+    return current_app.extensions["async_sessionmaker"]()
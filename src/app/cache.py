@@ -0,0 +1,196 @@
+# app/cache.py
+"""In-process caches with LRU/TTL eviction and tag-based invalidation.
+
+Caches live per worker process; cross-process staleness is bounded by the TTL.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._keys_by_tag: dict[Hashable, set] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable):
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value, tags: Iterable[Hashable] = ()) -> None:
+        """Store value under key; tags allow invalidating related keys at once."""
+        tags = tuple(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, time.monotonic() + self.ttl, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_tag(self, tag: Hashable) -> None:
+        """Drop every entry stored with the given tag."""
+        with self._lock:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def stats(self) -> dict:
+        """Return counters used to size the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+def init_cache(app):
+    """Create the application caches from config."""
+    app.extensions["post_cache"] = (
+        TTLCache(
+            max_size=app.config["POST_CACHE_MAX_SIZE"],
+            ttl=app.config["POST_CACHE_TTL"],
+        )
+        if app.config["POST_CACHE_ENABLED"]
+        else None
+    )
+    # Verified access-token claims, keyed by the encoded token
+    app.extensions["token_cache"] = TTLCache(
+        max_size=app.config["TOKEN_CACHE_MAX_SIZE"],
+        ttl=app.config["TOKEN_CACHE_TTL"],
+    )
+    app.extensions["user_cache"] = TTLCache(
+        max_size=app.config["USER_CACHE_MAX_SIZE"],
+        ttl=app.config["USER_CACHE_TTL"],
+    )
+
+
+def get_post_cache() -> TTLCache | None:
+    """Return the post cache of the current app, if enabled."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("post_cache")
+
+
+def post_cache_tag(post_id: int) -> tuple:
+    """Tag shared by every cache entry holding the given post."""
+    return ("post", post_id)
+
+
+def invalidate_post(post_id: int, session: Session | None = None) -> None:
+    """Drop cached entries for a post, again once the session commits."""
+    cache = get_post_cache()
+    if cache is None:
+        return
+
+    cache.invalidate_tag(post_cache_tag(post_id))
+
+    # A concurrent reader may re-cache the old row before our commit lands
+    if session is not None:
+        session.info.setdefault("invalidated_post_ids", set()).add(post_id)
+
+
+def get_user_cache() -> TTLCache | None:
+    """Return the user snapshot cache of the current app."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("user_cache")
+
+
+def user_cache_tag(user_id: int) -> tuple:
+    """Tag of the cached snapshot of the given user."""
+    return ("user", user_id)
+
+
+def invalidate_user(user_id: int, session: Session | None = None) -> None:
+    """Drop the cached snapshot of a user, again once the session commits."""
+    cache = get_user_cache()
+    if cache is None:
+        return
+
+    cache.invalidate_tag(user_cache_tag(user_id))
+    if session is not None:
+        session.info.setdefault("invalidated_user_ids", set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_posts(session):
+    post_ids = session.info.pop("invalidated_post_ids", None)
+    cache = get_post_cache()
+    if post_ids and cache is not None:
+        for post_id in post_ids:
+            cache.invalidate_tag(post_cache_tag(post_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session):
+    user_ids = session.info.pop("invalidated_user_ids", None)
+    cache = get_user_cache()
+    if user_ids and cache is not None:
+        for user_id in user_ids:
+            cache.invalidate_tag(user_cache_tag(user_id))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidated_posts(session):
+    session.info.pop("invalidated_post_ids", None)
+    session.info.pop("invalidated_user_ids", None)
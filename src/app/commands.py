@@ -0,0 +1,161 @@
+# app/commands.py
+"""Flask CLI management commands."""
+
+from datetime import UTC, datetime
+
+import click
+from flask.cli import with_appcontext
+
+from app.extensions import db
+from app.models import PostModel, RevokedTokenModel, TagModel, UserModel
+from app.search import get_search_backend, install_search
+from app.transfer import ImportCheckpoint, TransferError, export_lines, import_lines
+
+
+@click.command("rebuild-post-counters")
+@with_appcontext
+def rebuild_post_counters_command():
+    """Recompute denormalized user post counters, e.g. after a bulk import."""
+    updated = UserModel.rebuild_post_counters()
+    click.echo(f"Rebuilt post counters for {updated} users")
+
+
+@click.command("migrate-tags")
+@click.option("--batch-size", default=500, show_default=True)
+@with_appcontext
+def migrate_tags_command(batch_size):
+    """One-time migration of comma-separated post tags into the tag tables."""
+    migrated = TagModel.backfill_from_posts(batch_size=batch_size)
+    click.echo(f"Migrated tags for {migrated} posts")
+
+
+@click.command("backfill-slugs")
+@click.option("--batch-size", default=500, show_default=True)
+@with_appcontext
+def backfill_slugs_command(batch_size):
+    """Split existing slugs into base and suffix for indexed slug allocation."""
+    updated = PostModel.backfill_slug_sequences(batch_size=batch_size)
+    click.echo(f"Backfilled slug sequences for {updated} posts")
+
+
+@click.command("backfill-published-at")
+@with_appcontext
+def backfill_published_at_command():
+    """Date published posts saved without a publication date by their creation."""
+    updated = PostModel.backfill_published_at()
+    click.echo(f"Backfilled publication dates for {updated} posts")
+
+
+@click.command("rerender-posts")
+@click.option("--batch-size", default=200, show_default=True)
+@click.option("--force", is_flag=True, help="Re-render every post.")
+@with_appcontext
+def rerender_posts_command(batch_size, force):
+    """Re-render post HTML after the Markdown renderer version changes."""
+    rendered = PostModel.rerender_outdated(batch_size=batch_size, force=force)
+    click.echo(f"Re-rendered {rendered} posts")
+
+
+@click.command("install-search")
+@with_appcontext
+def install_search_command():
+    """Create the full-text index structures of the configured search backend."""
+    backend = get_search_backend()
+    install_search(backend)
+    click.echo(f"Installed the {backend.name} search index")
+
+
+@click.command("purge-revoked-tokens")
+@with_appcontext
+def purge_revoked_tokens_command():
+    """Delete revocation records of tokens that have expired anyway."""
+    purged = RevokedTokenModel.purge_expired(datetime.now(UTC))
+    click.echo(f"Purged {purged} expired token revocations")
+
+
+@click.command("sync-replicas")
+@with_appcontext
+def sync_replicas_command():
+    """Copy the primary SQLite database onto SQLite replicas (local testing)."""
+    primary = db.engine
+    if primary.dialect.name != "sqlite":
+        raise click.ClickException("sync-replicas only copies SQLite databases")
+
+    replicas = {
+        key: engine
+        for key, engine in db.engines.items()
+        if key is not None and key.startswith("replica_")
+    }
+    for key, replica in replicas.items():
+        if replica.dialect.name != "sqlite":
+            raise click.ClickException(f"{key} is not a SQLite database")
+
+        with primary.connect() as source, replica.connect() as target:
+            source.connection.driver_connection.backup(
+                target.connection.driver_connection
+            )
+        click.echo(f"Copied primary to {key} ({replica.url.database})")
+
+    if not replicas:
+        click.echo("No replicas configured (DATABASE_REPLICA_URLS)")
+
+
+@click.group("data")
+def data_cli():
+    """Export and import users and posts as NDJSON."""
+
+
+@data_cli.command("export")
+@click.argument("output", type=click.File("w", encoding="utf-8"), default="-")
+@click.option("--batch-size", default=1000, show_default=True)
+@with_appcontext
+def export_data_command(output, batch_size):
+    """Stream every user and post to OUTPUT (stdout by default)."""
+    exported = 0
+    for line in export_lines(batch_size=batch_size):
+        output.write(line + "\n")
+        exported += 1
+    click.echo(f"Exported {exported} records", err=True)
+
+
+@data_cli.command("import")
+@click.argument("source", type=click.Path(exists=True, dir_okay=False))
+@click.option("--batch-size", default=1000, show_default=True)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False),
+    help="Progress file, SOURCE.checkpoint by default.",
+)
+@click.option("--restart", is_flag=True, help="Ignore progress of an earlier run.")
+@with_appcontext
+def import_data_command(source, batch_size, checkpoint, restart):
+    """Load users and posts from an NDJSON file, resuming an interrupted run."""
+    checkpoint = ImportCheckpoint(checkpoint or f"{source}.checkpoint")
+    if restart:
+        checkpoint.clear()
+    start = checkpoint.load()
+    if start:
+        click.echo(f"Resuming after line {start}")
+
+    with open(source, encoding="utf-8") as lines:
+        try:
+            stats = import_lines(lines, batch_size=batch_size, checkpoint=checkpoint)
+        except TransferError as e:
+            raise click.ClickException(str(e)) from e
+    click.echo(
+        f"Imported {stats['users']} users and {stats['posts']} posts"
+        f" ({stats['skipped']} already present)"
+    )
+
+
+def register_commands(app):
+    """Register management commands with the Flask CLI."""
+    app.cli.add_command(rebuild_post_counters_command)
+    app.cli.add_command(migrate_tags_command)
+    app.cli.add_command(backfill_slugs_command)
+    app.cli.add_command(backfill_published_at_command)
+    app.cli.add_command(rerender_posts_command)
+    app.cli.add_command(install_search_command)
+    app.cli.add_command(purge_revoked_tokens_command)
+    app.cli.add_command(sync_replicas_command)
+    app.cli.add_command(data_cli)
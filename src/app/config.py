@@ -3,6 +3,16 @@ import os
 from datetime import timedelta
 
 
+def _flag(value: str) -> bool:
+    return value.lower() == "true"
+
+
+def _optional(parse, name: str):
+    """Parse an optional environment variable, None when unset or empty."""
+    value = os.environ.get(name)
+    return parse(value) if value else None
+
+
 class Config:
     """Base configuration with common settings."""
 
@@ -12,18 +22,154 @@ class Config:
     # Database Configuration
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or "sqlite:///blog.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Async driver URL for the ASGI app; derived from the URI above when unset
+    ASYNC_DATABASE_URL = os.environ.get("ASYNC_DATABASE_URL")
+
+    # Read replicas (comma-separated URLs) serving GraphQL query operations
+    DATABASE_REPLICA_URLS = [
+        url for url in os.environ.get("DATABASE_REPLICA_URLS", "").split(",") if url
+    ]
+    # Seconds a client reads from the primary after its own write
+    READ_AFTER_WRITE_WINDOW = float(os.environ.get("READ_AFTER_WRITE_WINDOW", 5))
+    # Reverse proxies in front of the app whose X-Forwarded-* headers are
+    # trusted to name the client address; 0 uses the socket peer
+    TRUSTED_PROXY_COUNT = int(os.environ.get("TRUSTED_PROXY_COUNT", 0))
+
+    # Engine profile: default, small, web or worker (see app/engine.py)
+    DATABASE_ENGINE_PROFILE = os.environ.get("DATABASE_ENGINE_PROFILE", "default")
+    # Optional overrides of single profile settings
+    DATABASE_POOL_SIZE = _optional(int, "DATABASE_POOL_SIZE")
+    DATABASE_MAX_OVERFLOW = _optional(int, "DATABASE_MAX_OVERFLOW")
+    DATABASE_POOL_TIMEOUT = _optional(int, "DATABASE_POOL_TIMEOUT")  # whole seconds
+    DATABASE_POOL_PRE_PING = _optional(_flag, "DATABASE_POOL_PRE_PING")
+    DATABASE_POOL_RECYCLE = _optional(int, "DATABASE_POOL_RECYCLE")  # seconds
+    DATABASE_STATEMENT_TIMEOUT = _optional(int, "DATABASE_STATEMENT_TIMEOUT")  # ms
+
+    # SQLite connection profile, applied to every new connection
+    SQLITE_JOURNAL_MODE = os.environ.get("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE = int(os.environ.get("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
+    # Negative values are KiB, positive values are pages
+    SQLITE_CACHE_SIZE = int(os.environ.get("SQLITE_CACHE_SIZE", -64 * 1024))
+    SQLITE_BUSY_TIMEOUT = int(os.environ.get("SQLITE_BUSY_TIMEOUT", 5000))  # ms
+    # Queue writers of this process so they never contend for the write lock
+    SQLITE_SERIALIZE_WRITES = (
+        os.environ.get("SQLITE_SERIALIZE_WRITES", "true").lower() == "true"
+    )
+    SQLITE_WRITER_QUEUE_TIMEOUT = float(
+        os.environ.get("SQLITE_WRITER_QUEUE_TIMEOUT", 30)
+    )
 
     # JWT Configuration
     JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY") or SECRET_KEY
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(
-        hours=int(os.environ.get("JWT_ACCESS_TOKEN_HOURS", 24))
+        hours=int(os.environ.get("JWT_ACCESS_TOKEN_HOURS", 1))
     )
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(
         days=int(os.environ.get("JWT_REFRESH_TOKEN_DAYS", 30))
     )
+    # Seconds between reloads of the revoked token filter from the database;
+    # bounds how long another worker's revocation takes to apply here
+    TOKEN_REVOCATION_REFRESH_INTERVAL = float(
+        os.environ.get("TOKEN_REVOCATION_REFRESH_INTERVAL", 30)
+    )
+    TOKEN_REVOCATION_FALSE_POSITIVE_RATE = float(
+        os.environ.get("TOKEN_REVOCATION_FALSE_POSITIVE_RATE", 0.001)
+    )
+
+    # Password hashing: werkzeug method ("scrypt", "scrypt:n:r:p",
+    # "pbkdf2:sha256:iterations"); stored hashes are upgraded on login
+    PASSWORD_HASH_METHOD = os.environ.get("PASSWORD_HASH_METHOD", "scrypt")
+    # Worker processes hashing off the request threads; 0 hashes inline
+    PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", 2))
+    # Queued hashes beyond which logins fail fast
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get("PASSWORD_HASH_MAX_PENDING", 32))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get("PASSWORD_HASH_TIMEOUT", 10))
 
     # CORS Configuration
     CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "*").split(",")
 
     # GraphQL Configuration
     GRAPHQL_PLAYGROUND = os.environ.get("GRAPHQL_PLAYGROUND", "true").lower() == "true"
+    GRAPHQL_DEFAULT_PAGE_SIZE = int(os.environ.get("GRAPHQL_DEFAULT_PAGE_SIZE", 20))
+    GRAPHQL_MAX_PAGE_SIZE = int(os.environ.get("GRAPHQL_MAX_PAGE_SIZE", 100))
+    GRAPHQL_DOCUMENT_CACHE_SIZE = int(
+        os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 256)
+    )
+
+    # Query cost limits, enforced before execution
+    GRAPHQL_MAX_DEPTH = int(os.environ.get("GRAPHQL_MAX_DEPTH", 10))
+    GRAPHQL_MAX_ALIASES = int(os.environ.get("GRAPHQL_MAX_ALIASES", 30))
+    GRAPHQL_MAX_COST = int(os.environ.get("GRAPHQL_MAX_COST", 5000))
+    # Assumed size of list fields without a page size argument
+    GRAPHQL_DEFAULT_LIST_SIZE = int(os.environ.get("GRAPHQL_DEFAULT_LIST_SIZE", 100))
+    # Items accepted by one bulk mutation (createPosts, publishPosts, deletePosts)
+    BULK_MUTATION_MAX_ITEMS = int(os.environ.get("BULK_MUTATION_MAX_ITEMS", 500))
+
+    # Automatic Persisted Queries; strict mode only accepts manifest hashes
+    GRAPHQL_PERSISTED_QUERIES_FILE = os.environ.get("GRAPHQL_PERSISTED_QUERIES_FILE")
+    GRAPHQL_PERSISTED_QUERIES_STRICT = (
+        os.environ.get("GRAPHQL_PERSISTED_QUERIES_STRICT", "false").lower() == "true"
+    )
+    GRAPHQL_APQ_CACHE_SIZE = int(os.environ.get("GRAPHQL_APQ_CACHE_SIZE", 1000))
+    GRAPHQL_APQ_CACHE_TTL = float(os.environ.get("GRAPHQL_APQ_CACHE_TTL", 86400))
+
+    # SQL statistics per operation: returned under `extensions.sql` in debug
+    # mode (or when enabled), logged when an operation crosses a threshold
+    GRAPHQL_SQL_STATS_IN_RESPONSE = (
+        os.environ.get("GRAPHQL_SQL_STATS_IN_RESPONSE", "false").lower() == "true"
+    )
+    GRAPHQL_SQL_LOG_MIN_QUERIES = int(os.environ.get("GRAPHQL_SQL_LOG_MIN_QUERIES", 50))
+    GRAPHQL_SQL_LOG_MIN_DURATION_MS = float(
+        os.environ.get("GRAPHQL_SQL_LOG_MIN_DURATION_MS", 500)
+    )
+    # Executions of one statement shape that flag a likely N+1 pattern
+    GRAPHQL_SQL_LOG_REPEATED = int(os.environ.get("GRAPHQL_SQL_LOG_REPEATED", 10))
+
+    # Prometheus metrics at /api/metrics; label values kept per metric before
+    # further operation names are counted under "__other__"
+    METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_MAX_LABEL_VALUES = int(os.environ.get("METRICS_MAX_LABEL_VALUES", 500))
+
+    # Operations at least this slow are logged with their timing breakdown
+    # (0 disables the log)
+    GRAPHQL_SLOW_OPERATION_MS = float(os.environ.get("GRAPHQL_SLOW_OPERATION_MS", 1000))
+
+    # Usernames allowed to profile requests (X-Profile) and download profiles
+    ADMIN_USERNAMES = {
+        name.strip()
+        for name in os.environ.get("ADMIN_USERNAMES", "").split(",")
+        if name.strip()
+    }
+    # Fraction of all GraphQL requests profiled with the stack sampler
+    PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+    PROFILE_SAMPLE_INTERVAL_MS = float(os.environ.get("PROFILE_SAMPLE_INTERVAL_MS", 5))
+    # Where profiles are written; the instance folder when unset
+    PROFILE_DIR = os.environ.get("PROFILE_DIR")
+    PROFILE_MAX_FILES = int(os.environ.get("PROFILE_MAX_FILES", 100))
+
+    # Post Cache Configuration
+    POST_CACHE_ENABLED = os.environ.get("POST_CACHE_ENABLED", "true").lower() == "true"
+    POST_CACHE_MAX_SIZE = int(os.environ.get("POST_CACHE_MAX_SIZE", 1024))
+    POST_CACHE_TTL = float(os.environ.get("POST_CACHE_TTL", 300))
+
+    # Authentication caches (per process): decoded access tokens and snapshots
+    # of their users (id, username, active flag)
+    TOKEN_CACHE_MAX_SIZE = int(os.environ.get("TOKEN_CACHE_MAX_SIZE", 4096))
+    TOKEN_CACHE_TTL = float(os.environ.get("TOKEN_CACHE_TTL", 900))
+    USER_CACHE_MAX_SIZE = int(os.environ.get("USER_CACHE_MAX_SIZE", 4096))
+    USER_CACHE_TTL = float(os.environ.get("USER_CACHE_TTL", 60))
+
+    # HTTP caching of GraphQL GET queries
+    GRAPHQL_HTTP_CACHE_ENABLED = (
+        os.environ.get("GRAPHQL_HTTP_CACHE_ENABLED", "true").lower() == "true"
+    )
+    GRAPHQL_HTTP_CACHE_MAX_AGE = int(os.environ.get("GRAPHQL_HTTP_CACHE_MAX_AGE", 0))
+    GRAPHQL_HTTP_CACHE_SHARED_MAX_AGE = int(
+        os.environ.get("GRAPHQL_HTTP_CACHE_SHARED_MAX_AGE", 60)
+    )
+    # "module:function" called with the surrogate keys to purge after a write
+    SURROGATE_PURGE_HOOK = os.environ.get("SURROGATE_PURGE_HOOK")
+
+    # Search Configuration: auto, sqlite_fts, postgres_fts or like
+    SEARCH_BACKEND = os.environ.get("SEARCH_BACKEND", "auto")
@@ -0,0 +1,379 @@
+# app/engine.py
+"""Database engine tuning.
+
+Engines are sized by a named profile (``DATABASE_ENGINE_PROFILE``) with
+optional per-setting overrides. The pool records how long checkouts wait and
+gives up after ``pool_timeout`` with a ``PoolTimeoutError``, which requests
+surface as a 503 instead of hanging behind an exhausted pool.
+
+SQLite runs in WAL mode so readers never wait for a committing writer, and
+writers of a process queue up in arrival order instead of racing for the
+database lock and failing with ``database is locked``. Writers in other
+processes still wait on ``busy_timeout``.
+"""
+
+import bisect
+import threading
+import time
+
+from flask import current_app, has_app_context, jsonify
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+from app.extensions import db
+from app.replicas import init_read_routing
+
+# Pool sizing per deployment shape; "default" keeps SQLAlchemy's defaults
+ENGINE_PROFILES = {
+    "default": {},
+    # Single small instance sharing the database with other services
+    "small": {
+        "pool_size": 3,
+        "max_overflow": 2,
+        "pool_timeout": 3,
+        "pool_pre_ping": True,
+        "pool_recycle": 900,
+        "statement_timeout": 10_000,
+    },
+    # Threaded web workers serving short GraphQL requests
+    "web": {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 5,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "statement_timeout": 15_000,
+    },
+    # CLI commands and batch jobs running long statements
+    "worker": {
+        "pool_size": 2,
+        "max_overflow": 0,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "statement_timeout": 600_000,
+    },
+}
+
+# Config keys overriding single profile settings when set
+ENGINE_OVERRIDES = {
+    "pool_size": "DATABASE_POOL_SIZE",
+    "max_overflow": "DATABASE_MAX_OVERFLOW",
+    "pool_timeout": "DATABASE_POOL_TIMEOUT",
+    "pool_pre_ping": "DATABASE_POOL_PRE_PING",
+    "pool_recycle": "DATABASE_POOL_RECYCLE",
+    "statement_timeout": "DATABASE_STATEMENT_TIMEOUT",
+}
+
+# Upper bounds (seconds) of the checkout wait histogram
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolTimeoutError(exc.TimeoutError):
+    """Raised when no database connection frees up within ``pool_timeout``."""
+
+
+class PoolMetrics:
+    """Checkout wait times and timeouts of a connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        # Non-cumulative counts per bucket, the last one for waits above all
+        self.wait_buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS) + 1)
+
+    def record_checkout(self, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            self.wait_buckets[bisect.bisect_left(CHECKOUT_WAIT_BUCKETS, waited)] += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "mean_wait": (
+                    self.total_wait / self.checkouts if self.checkouts else 0.0
+                ),
+                "max_wait": self.max_wait,
+                "total_wait": self.total_wait,
+                "wait_buckets": dict(
+                    zip(
+                        [*CHECKOUT_WAIT_BUCKETS, float("inf")],
+                        self.wait_buckets,
+                        strict=True,
+                    )
+                ),
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that measures checkout waits and fails with a clear error."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError as e:
+            self.metrics.record_timeout()
+            raise PoolTimeoutError(
+                f"No database connection available after {self.timeout():g}s "
+                f"({self.checkedout()} in use, pool size {self.size()}, "
+                f"max overflow {self._max_overflow})"
+            ) from e
+        self.metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+
+class WriterQueueTimeout(RuntimeError):
+    """Raised when a session waits too long for its turn to write."""
+
+
+class WriterQueue:
+    """FIFO ticket lock admitting one writing transaction at a time."""
+
+    def __init__(self, timeout: float | None = 30.0):
+        self.timeout = timeout
+        self._condition = threading.Condition()
+        self._next_ticket = 0
+        self._now_serving = 0
+        self._abandoned: set[int] = set()
+        self.acquired = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def acquire(self) -> None:
+        """Wait for our turn to write, in arrival order."""
+        started = time.perf_counter()
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+
+            if not self._condition.wait_for(
+                lambda: self._now_serving == ticket, self.timeout
+            ):
+                # Let the writers behind us skip the ticket we gave up
+                self._abandoned.add(ticket)
+                self.timeouts += 1
+                raise WriterQueueTimeout(
+                    f"Timed out after {self.timeout}s waiting to write"
+                )
+
+            waited = time.perf_counter() - started
+            self.acquired += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def release(self) -> None:
+        """Hand the write lock to the next writer in line."""
+        with self._condition:
+            self._now_serving += 1
+            while self._now_serving in self._abandoned:
+                self._abandoned.remove(self._now_serving)
+                self._now_serving += 1
+            self._condition.notify_all()
+
+    def stats(self) -> dict:
+        """Return queue depth and wait times."""
+        with self._condition:
+            return {
+                # Tickets past the one being served, minus those given up
+                "waiting": max(
+                    self._next_ticket - self._now_serving - len(self._abandoned) - 1,
+                    0,
+                ),
+                "acquired": self.acquired,
+                "timeouts": self.timeouts,
+                "mean_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+                "max_wait": self.max_wait,
+            }
+
+
+def sqlite_pragmas(config) -> dict:
+    """Return the PRAGMA statements of the configured SQLite profile."""
+    return {
+        "journal_mode": config["SQLITE_JOURNAL_MODE"],
+        "synchronous": config["SQLITE_SYNCHRONOUS"],
+        "mmap_size": config["SQLITE_MMAP_SIZE"],
+        "cache_size": config["SQLITE_CACHE_SIZE"],
+        "busy_timeout": config["SQLITE_BUSY_TIMEOUT"],
+    }
+
+
+def apply_sqlite_profile(engine, config) -> None:
+    """Set the SQLite pragmas on every new connection of an engine."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    pragmas = sqlite_pragmas(config)
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def engine_profile(config) -> dict:
+    """Return the configured engine profile with its overrides applied."""
+    name = config["DATABASE_ENGINE_PROFILE"]
+    if name not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown DATABASE_ENGINE_PROFILE {name!r}; "
+            f"expected one of {', '.join(ENGINE_PROFILES)}"
+        )
+
+    profile = dict(ENGINE_PROFILES[name])
+    for option, key in ENGINE_OVERRIDES.items():
+        if config.get(key) is not None:
+            profile[option] = config[key]
+    return profile
+
+
+def engine_options(url, config, poolclass=MeteredQueuePool) -> dict:
+    """Translate the engine profile into ``create_engine`` keyword arguments."""
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory databases live in a single static connection
+        return {}
+
+    options = engine_profile(config)
+    statement_timeout = options.pop("statement_timeout", None)
+
+    if poolclass is not None:
+        options["poolclass"] = poolclass
+
+    if statement_timeout and url.get_backend_name() == "postgresql":
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(statement_timeout)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={statement_timeout}"
+            }
+
+    return options
+
+
+def configure_engine(app):
+    """Set engine options and replica binds before the engines are created."""
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        **engine_options(app.config["SQLALCHEMY_DATABASE_URI"], app.config),
+        # Options set explicitly in the config take precedence
+        **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),
+    }
+
+    binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+    replicas = []
+    for index, url in enumerate(app.config["DATABASE_REPLICA_URLS"]):
+        key = f"replica_{index}"
+        binds[key] = {"url": url, **engine_options(url, app.config)}
+        replicas.append(key)
+    app.config["SQLALCHEMY_BINDS"] = binds
+    init_read_routing(app, replicas)
+
+
+def pool_stats(engine) -> dict:
+    """Return the live state and checkout metrics of an engine's pool."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+
+    stats = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # QueuePool counts overflow from -size; only connections beyond it count
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeout": pool.timeout(),
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.stats())
+    return stats
+
+
+def _pool_timeout_response(error):
+    response = jsonify(
+        {"errors": [{"message": str(error), "extensions": {"code": "DATABASE_BUSY"}}]}
+    )
+    response.status_code = 503
+    response.headers["Retry-After"] = "1"
+    return response
+
+
+def init_engine(app):
+    """Apply the engine profile and create the writer queue for SQLite."""
+    app.register_error_handler(PoolTimeoutError, _pool_timeout_response)
+
+    with app.app_context():
+        engine = db.engine
+        for bind_engine in db.engines.values():
+            apply_sqlite_profile(bind_engine, app.config)
+
+    app.extensions["writer_queue"] = (
+        WriterQueue(timeout=app.config["SQLITE_WRITER_QUEUE_TIMEOUT"])
+        if engine.dialect.name == "sqlite" and app.config["SQLITE_SERIALIZE_WRITES"]
+        else None
+    )
+
+
+def get_writer_queue() -> WriterQueue | None:
+    """Return the SQLite writer queue of the current app, if enabled."""
+    return current_app.extensions.get("writer_queue")
+
+
+def _acquire_writer_lock(session) -> None:
+    if "writer_queue" in session.info or not has_app_context():
+        return
+
+    queue = get_writer_queue()
+    if queue is not None:
+        queue.acquire()
+        # Remember the queue so the release does not depend on the app context
+        session.info["writer_queue"] = queue
+
+
+# Only Flask-SQLAlchemy sessions queue: a blocking lock would stall the event
+# loop of the ASGI app, whose writers rely on busy_timeout instead
+@event.listens_for(db.session, "before_flush")
+def _queue_flush(session, flush_context, instances):
+    if session.new or session.dirty or session.deleted:
+        _acquire_writer_lock(session)
+
+
+@event.listens_for(db.session, "do_orm_execute")
+def _queue_dml(orm_execute_state):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        _acquire_writer_lock(orm_execute_state.session)
+
+
+@event.listens_for(db.session, "after_transaction_end")
+def _release_writer_lock(session, transaction):
+    if transaction.parent is None and "writer_queue" in session.info:
+        session.info.pop("writer_queue").release()
@@ -0,0 +1,107 @@
+# app/http_cache.py
+"""HTTP caching for GraphQL GET responses.
+
+Resolvers record the posts and users a response touched. ``ETag`` and
+``Last-Modified`` are derived from their ``updated_at`` values, and
+``Surrogate-Key`` lists them so a reverse proxy or CDN can purge exactly the
+affected responses when a post changes.
+"""
+
+import hashlib
+import logging
+from importlib import import_module
+
+from flask import current_app, g, has_app_context, has_request_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+def surrogate_key(kind: str, entity_id: int | None = None) -> str:
+    """Return the surrogate key of an entity (``post-42``) or collection."""
+    return kind if entity_id is None else f"{kind}-{entity_id}"
+
+
+def record_entity(kind: str, entity_id: int, updated_at) -> None:
+    """Note that the current response includes the given entity."""
+    if not has_request_context():
+        return
+    entities = g.setdefault("http_cache_entities", {})
+    entities[surrogate_key(kind, entity_id)] = updated_at
+
+
+def record_collection(kind: str) -> None:
+    """Note that the current response includes a list of entities."""
+    if not has_request_context():
+        return
+    g.setdefault("http_cache_collections", set()).add(surrogate_key(kind))
+
+
+def apply_cache_headers(response, request) -> None:
+    """Add validators, Cache-Control and Surrogate-Key to a GET response."""
+    config = current_app.config
+    entities = g.get("http_cache_entities", {})
+    collections = g.get("http_cache_collections", set())
+
+    digest = hashlib.sha256(request.query_string)
+    if entities:
+        for key in sorted(entities):
+            digest.update(f"|{key}:{entities[key].isoformat()}".encode())
+        response.last_modified = max(entities.values())
+    else:
+        # Nothing timestamped was touched, so only the body can validate it
+        digest.update(response.get_data())
+    response.set_etag(digest.hexdigest())
+
+    response.vary.add("Authorization")
+    if request.headers.get("Authorization"):
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return
+
+    response.cache_control.public = True
+    response.cache_control.max_age = config["GRAPHQL_HTTP_CACHE_MAX_AGE"]
+    response.cache_control.s_maxage = config["GRAPHQL_HTTP_CACHE_SHARED_MAX_AGE"]
+    keys = sorted(collections | set(entities))
+    if keys:
+        response.headers["Surrogate-Key"] = " ".join(keys)
+
+
+def log_purge(keys: list[str]) -> None:
+    """Default purge hook: log the keys a CDN integration should purge."""
+    logger.info("Surrogate keys to purge: %s", " ".join(keys))
+
+
+def init_http_cache(app):
+    """Resolve the configured surrogate key purge hook."""
+    hook = app.config["SURROGATE_PURGE_HOOK"]
+    if isinstance(hook, str):
+        module_name, _, attribute = hook.partition(":")
+        hook = getattr(import_module(module_name), attribute)
+    app.extensions["surrogate_purge_hook"] = hook or log_purge
+
+
+def queue_purge(session: Session | None, *keys: str) -> None:
+    """Purge surrogate keys once the session's transaction commits."""
+    if session is not None:
+        session.info.setdefault("surrogate_keys", set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _purge_committed_keys(session):
+    keys = session.info.pop("surrogate_keys", None)
+    if not keys or not has_app_context():
+        return
+
+    try:
+        hook = current_app.extensions["surrogate_purge_hook"]
+        hook(sorted(keys))
+    except Exception:
+        # A failing CDN must never fail the write that triggered the purge
+        logger.exception("Surrogate key purge failed")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_purge_keys(session):
+    session.info.pop("surrogate_keys", None)
@@ -0,0 +1,122 @@
+# app/identity.py
+"""Who sent the current request.
+
+The bearer token is decoded and its user looked up at most once per request,
+and only when an ``Authorization`` header is present. Verified token claims
+are kept in a bounded LRU and users as small snapshots with a TTL, so most
+authenticated requests skip both; snapshots are dropped whenever their user
+row changes.
+"""
+
+import time
+from dataclasses import dataclass
+from functools import cached_property
+
+from flask import current_app, g, has_request_context, request
+from flask_jwt_extended import decode_token
+
+from app.cache import get_user_cache, user_cache_tag
+from app.extensions import db
+from app.models import UserModel
+from app.revocation import get_revocation_list
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """The user fields authorization needs, cheap to cache."""
+
+    id: int
+    username: str
+    is_active: bool
+
+
+def bearer_token(authorization: str | None) -> str | None:
+    """Return the token of a ``Bearer`` authorization header."""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token
+
+
+def decode_access_token(token: str) -> dict | None:
+    """Return the claims of a valid, unrevoked access token, or None."""
+    cache = current_app.extensions.get("token_cache")
+    claims = cache.get(token) if cache is not None else None
+
+    if claims is None:
+        try:
+            claims = decode_token(token)
+        except Exception:
+            return None
+        if claims.get("type") != "access":
+            return None
+        if cache is not None:
+            cache.set(token, claims)
+
+    # Cached claims can outlive the token itself
+    if claims.get("exp") is not None and claims["exp"] <= time.time():
+        return None
+    # Checked on every use, so revocations apply to cached tokens too
+    if get_revocation_list().is_revoked(claims):
+        return None
+    return claims
+
+
+def get_user_snapshot(user_id: int) -> UserSnapshot | None:
+    """Return a snapshot of a user, loading it on a cache miss."""
+    cache = get_user_cache()
+    snapshot = cache.get(user_id) if cache is not None else None
+    if snapshot is not None:
+        return snapshot
+
+    row = db.session.execute(
+        db.select(UserModel.id, UserModel.username, UserModel.is_active).where(
+            UserModel.id == user_id
+        )
+    ).first()
+    if row is None:
+        return None
+
+    snapshot = UserSnapshot(*row)
+    if cache is not None:
+        cache.set(user_id, snapshot, tags=[user_cache_tag(user_id)])
+    return snapshot
+
+
+class RequestIdentity:
+    """Identity behind a bearer token, resolved lazily and only once."""
+
+    def __init__(self, token: str | None):
+        self.token = token
+
+    @cached_property
+    def claims(self) -> dict | None:
+        """Claims of a valid, unrevoked access token."""
+        return decode_access_token(self.token) if self.token else None
+
+    @cached_property
+    def user_id(self) -> int | None:
+        """Id in a valid access token, whether or not the user still exists."""
+        try:
+            return int(self.claims["sub"]) if self.claims else None
+        except (TypeError, ValueError):
+            return None
+
+    @cached_property
+    def user(self) -> UserSnapshot | None:
+        """Snapshot of the authenticated user, if still active."""
+        if self.user_id is None:
+            return None
+
+        snapshot = get_user_snapshot(self.user_id)
+        return snapshot if snapshot is not None and snapshot.is_active else None
+
+
+def current_identity() -> RequestIdentity:
+    """Return the identity of the current request."""
+    if not has_request_context():
+        return RequestIdentity(None)
+
+    if "identity" not in g:
+        g.identity = RequestIdentity(bearer_token(request.headers.get("Authorization")))
+    return g.identity
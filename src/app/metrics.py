@@ -0,0 +1,445 @@
+# app/metrics.py
+"""Runtime metrics served in the Prometheus text format.
+
+GraphQL latencies and error counts are recorded on the request path, so
+recording takes no lock: every thread writes to its own shard of plain lists,
+and a scrape sums the shards. Memory stays bounded by the fixed histogram
+buckets and a cap on label values per metric; operation names come from
+clients, so values past the cap are counted under ``"__other__"``.
+
+Pool, cache, writer queue and revocation figures are read from their own
+``stats()`` at scrape time.
+"""
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+
+from flask import current_app
+
+from app.config import Config
+from app.engine import pool_stats
+from app.extensions import db
+
+# Upper bounds (seconds) of the latency histograms
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Label value counting every value past the cap of a metric
+OTHER_LABEL = "__other__"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsRegistry:
+    """Per-thread shards of metric series, merged when scraped."""
+
+    def __init__(self, max_label_values: int = 500):
+        self.max_label_values = max_label_values
+        self.metrics: list[Metric] = []
+        self._local = threading.local()
+        # (thread, shard) of every thread that recorded something
+        self._shards: list[tuple[threading.Thread, dict]] = []
+        # Series of threads that have exited
+        self._retired: dict = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, documentation: str, label: str, buckets=None):
+        return self._register(
+            Histogram(self, name, documentation, label, buckets or LATENCY_BUCKETS)
+        )
+
+    def counter(self, name: str, documentation: str, label: str):
+        return self._register(Counter(self, name, documentation, label))
+
+    def _register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def shard(self) -> dict:
+        """Return the series of the current thread."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            pass
+
+        shard = self._local.shard = {}
+        with self._lock:
+            # Thread-per-request servers would otherwise grow a shard per request
+            self._retire_exited_threads()
+            self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def collect(self) -> dict:
+        """Return every series summed over the threads that recorded it."""
+        with self._lock:
+            self._retire_exited_threads()
+            merged = {key: list(series) for key, series in self._retired.items()}
+            # A copy is taken atomically while the owning thread keeps writing
+            shards = [shard.copy() for _, shard in self._shards]
+
+        for shard in shards:
+            _merge(merged, shard)
+        return merged
+
+    def _retire_exited_threads(self) -> None:
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                _merge(self._retired, shard)
+        self._shards = live
+
+
+def _merge(target: dict, shard: dict) -> None:
+    for key, series in shard.items():
+        total = target.get(key)
+        if total is None:
+            target[key] = list(series)
+        else:
+            for index, value in enumerate(series):
+                total[index] += value
+
+
+class Metric(ABC):
+    """A metric family with a single label."""
+
+    kind = ""
+
+    def __init__(self, registry: MetricsRegistry, name, documentation, label):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self._label_values: set = set()
+
+    @abstractmethod
+    def new_series(self) -> list:
+        """Return the zeroed values of a new series."""
+
+    def series(self, value: str) -> list:
+        """Return the current thread's series for a label value."""
+        shard = self.registry.shard()
+        series = shard.get((self, value))
+        if series is None:
+            value = self._admit(value)
+            series = shard.get((self, value))
+            if series is None:
+                series = shard[(self, value)] = self.new_series()
+        return series
+
+    def _admit(self, value: str) -> str:
+        if value in self._label_values:
+            return value
+        if len(self._label_values) >= self.registry.max_label_values:
+            return OTHER_LABEL
+        with self.registry._lock:
+            if len(self._label_values) >= self.registry.max_label_values:
+                return OTHER_LABEL
+            self._label_values.add(value)
+        return value
+
+    @abstractmethod
+    def samples(self, series: list) -> list[tuple[str, dict, float]]:
+        """Return (name suffix, extra labels, value) samples of a series."""
+
+
+class Counter(Metric):
+    """Monotonic count per label value."""
+
+    kind = "counter"
+
+    def new_series(self) -> list:
+        return [0]
+
+    def inc(self, value: str, amount: float = 1) -> None:
+        self.series(value)[0] += amount
+
+    def samples(self, series: list) -> list[tuple[str, dict, float]]:
+        return [("", {}, series[0])]
+
+
+class Histogram(Metric):
+    """Observations per label value in fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, registry, name, documentation, label, buckets):
+        super().__init__(registry, name, documentation, label)
+        self.buckets = tuple(buckets)
+
+    def new_series(self) -> list:
+        # Non-cumulative bucket counts, the one above all bounds, then the sum
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def observe(self, value: str, amount: float) -> None:
+        series = self.series(value)
+        series[bisect.bisect_left(self.buckets, amount)] += 1
+        series[-1] += amount
+
+    def samples(self, series: list) -> list[tuple[str, dict, float]]:
+        return histogram_samples(self.buckets, series[:-1], series[-1])
+
+
+def histogram_samples(buckets, counts, total) -> list[tuple[str, dict, float]]:
+    """Cumulative ``_bucket``, ``_sum`` and ``_count`` samples of a histogram."""
+    samples = []
+    cumulative = 0
+    for bound, count in zip([*buckets, math.inf], counts, strict=True):
+        cumulative += count
+        samples.append(("_bucket", {"le": bound}, cumulative))
+    samples.append(("_sum", {}, total))
+    samples.append(("_count", {}, cumulative))
+    return samples
+
+
+registry = MetricsRegistry(max_label_values=Config.METRICS_MAX_LABEL_VALUES)
+
+operation_duration = registry.histogram(
+    "graphql_operation_duration_seconds",
+    "Duration of GraphQL operations.",
+    "operation",
+)
+operation_errors = registry.counter(
+    "graphql_operation_errors_total",
+    "GraphQL operations that returned errors.",
+    "operation",
+)
+operation_statements = registry.counter(
+    "graphql_operation_sql_statements_total",
+    "SQL statements run by GraphQL operations.",
+    "operation",
+)
+resolver_duration = registry.histogram(
+    "graphql_resolver_duration_seconds",
+    "Duration of GraphQL field resolvers, excluding their child fields.",
+    "field",
+)
+resolver_errors = registry.counter(
+    "graphql_resolver_errors_total",
+    "GraphQL field resolvers that raised.",
+    "field",
+)
+
+
+def _format_value(value) -> str:
+    return "+Inf" if value == math.inf else str(value)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            (value if isinstance(value, str) else _format_value(value))
+            .replace("\\", "\\\\")
+            .replace("\n", "\\n")
+            .replace('"', '\\"'),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+class Exposition:
+    """Lines of a Prometheus text exposition, grouped by metric family."""
+
+    def __init__(self):
+        self._families: dict[str, tuple[str, str, list]] = {}
+
+    def add(self, name, kind, documentation, labels, samples) -> None:
+        """Add ``(suffix, extra labels, value)`` samples of one labelled series."""
+        _, _, lines = self._families.setdefault(name, (kind, documentation, []))
+        for suffix, extra, value in samples:
+            lines.append(
+                f"{name}{suffix}{_format_labels({**labels, **extra})} "
+                f"{_format_value(value)}"
+            )
+
+    def gauge(self, name, documentation, labels, value) -> None:
+        self.add(name, "gauge", documentation, labels, [("", {}, value)])
+
+    def counter(self, name, documentation, labels, value) -> None:
+        self.add(name, "counter", documentation, labels, [("", {}, value)])
+
+    def render(self) -> str:
+        lines = []
+        for name, (kind, documentation, samples) in self._families.items():
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def _add_registry(exposition: Exposition) -> None:
+    by_metric = {metric: [] for metric in registry.metrics}
+    for (metric, value), series in registry.collect().items():
+        by_metric[metric].append((value, series))
+
+    for metric, values in by_metric.items():
+        # Families without samples still document themselves
+        exposition.add(metric.name, metric.kind, metric.documentation, {}, [])
+        for value, series in sorted(values, key=lambda item: item[0]):
+            exposition.add(
+                metric.name,
+                metric.kind,
+                metric.documentation,
+                {metric.label: value},
+                metric.samples(series),
+            )
+
+
+def _add_pool(exposition: Exposition, engine_name: str, engine) -> None:
+    stats = pool_stats(engine)
+    if "size" not in stats:
+        return
+
+    labels = {"engine": engine_name}
+    exposition.gauge(
+        "db_pool_size", "Connections kept in the pool.", labels, stats["size"]
+    )
+    exposition.gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out.",
+        labels,
+        stats["checked_out"],
+    )
+    exposition.gauge(
+        "db_pool_overflow",
+        "Connections open beyond the pool size.",
+        labels,
+        stats["overflow"],
+    )
+    if "wait_buckets" not in stats:
+        return
+
+    exposition.add(
+        "db_pool_checkout_wait_seconds",
+        "histogram",
+        "Time spent waiting for a pooled connection.",
+        labels,
+        histogram_samples(
+            list(stats["wait_buckets"])[:-1],
+            list(stats["wait_buckets"].values()),
+            stats["total_wait"],
+        ),
+    )
+    exposition.counter(
+        "db_pool_checkout_timeouts_total",
+        "Checkouts that gave up after the pool timeout.",
+        labels,
+        stats["timeouts"],
+    )
+
+
+def _add_cache(exposition: Exposition, cache_name: str, cache) -> None:
+    stats = cache.stats()
+    labels = {"cache": cache_name}
+    exposition.gauge(
+        "cache_entries", "Entries held by the cache.", labels, stats["size"]
+    )
+    exposition.gauge(
+        "cache_hit_ratio",
+        "Hits per lookup since the process started.",
+        labels,
+        stats["hit_rate"],
+    )
+    for counter in ("hits", "misses", "evictions", "expirations", "invalidations"):
+        exposition.counter(
+            f"cache_{counter}_total", f"Cache {counter}.", labels, stats[counter]
+        )
+
+
+def _add_writer_queue(exposition: Exposition, queue) -> None:
+    stats = queue.stats()
+    exposition.gauge(
+        "sqlite_writer_queue_waiting",
+        "Transactions waiting for their turn to write.",
+        {},
+        stats["waiting"],
+    )
+    exposition.counter(
+        "sqlite_writer_queue_acquired_total",
+        "Transactions admitted to write.",
+        {},
+        stats["acquired"],
+    )
+    exposition.counter(
+        "sqlite_writer_queue_timeouts_total",
+        "Transactions that gave up waiting to write.",
+        {},
+        stats["timeouts"],
+    )
+
+
+def _add_revocations(exposition: Exposition, revocations) -> None:
+    stats = revocations.stats()
+    exposition.counter(
+        "token_revocation_checks_total",
+        "Tokens checked for revocation.",
+        {},
+        stats["checks"],
+    )
+    exposition.counter(
+        "token_revocation_filter_hits_total",
+        "Checks the Bloom filter could not rule out.",
+        {},
+        stats["filter_hits"],
+    )
+    exposition.counter(
+        "token_revocation_revoked_total",
+        "Tokens rejected as revoked.",
+        {},
+        stats["revoked"],
+    )
+
+
+def render_metrics() -> str:
+    """Return the metrics of the current app in the Prometheus text format."""
+    exposition = Exposition()
+    _add_registry(exposition)
+
+    for bind, engine in db.engines.items():
+        _add_pool(exposition, bind or "primary", engine)
+    async_engine = current_app.extensions.get("async_engine")
+    if async_engine is not None:
+        _add_pool(exposition, "async", async_engine.sync_engine)
+
+    caches = {
+        "post": current_app.extensions.get("post_cache"),
+        "token": current_app.extensions.get("token_cache"),
+        "user": current_app.extensions.get("user_cache"),
+    }
+    persisted_queries = current_app.extensions.get("persisted_queries")
+    if persisted_queries is not None:
+        caches["persisted_queries"] = persisted_queries.cache
+    for name, cache in caches.items():
+        if cache is not None:
+            _add_cache(exposition, name, cache)
+
+    writer_queue = current_app.extensions.get("writer_queue")
+    if writer_queue is not None:
+        _add_writer_queue(exposition, writer_queue)
+
+    revocations = current_app.extensions.get("token_revocations")
+    if revocations is not None:
+        _add_revocations(exposition, revocations)
+
+    return exposition.render()
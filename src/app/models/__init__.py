@@ -1,6 +1,15 @@
 # src/app/models/__init__.py
 from app.models.base import BaseModel
 from app.models.post import PostModel
+from app.models.revoked_token import RevokedTokenModel
+from app.models.tag import TagModel, post_tags
 from app.models.user import UserModel
 
-__all__ = ["BaseModel", "UserModel", "PostModel"]
+__all__ = [
+    "BaseModel",
+    "UserModel",
+    "PostModel",
+    "RevokedTokenModel",
+    "TagModel",
+    "post_tags",
+]
@@ -1,31 +1,69 @@
 # app/models/post.py
+import re
+from contextlib import contextmanager
 from datetime import UTC, datetime
 
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import object_session
+
+from app.cache import invalidate_post
 from app.extensions import db
+from app.http_cache import queue_purge, surrogate_key
 from app.models.base import BaseModel
+from app.models.tag import TagModel, post_tags
+from app.rendering import RENDERER_VERSION, content_hash, html_to_text, render_markdown
 
 
 class PostModel(BaseModel):
     """Blog post model with content and metadata."""
 
     __tablename__ = "posts"
+    __table_args__ = (
+        # Keyset pagination indexes matching the (sort key, id) cursors
+        db.Index("ix_posts_published_feed", "is_published", "published_at", "id"),
+        db.Index("ix_posts_created_at_id", "created_at", "id"),
+        db.Index("ix_posts_author_feed", "author_id", "created_at", "id"),
+        # Finds the highest used suffix of a base slug with one index seek
+        db.Index("ix_posts_slug_base_seq", "slug_base", "slug_seq"),
+    )
+
+    # Attempts at allocating a free slug when concurrent creates collide
+    SLUG_ALLOCATION_ATTEMPTS = 5
 
     # Content fields
     title = db.Column(db.String(200), nullable=False, index=True)
     content = db.Column(db.Text, nullable=False)
     excerpt = db.Column(db.String(500), nullable=True)
 
+    # Rendered content, refreshed on save when the body or renderer changes
+    content_html = db.Column(db.Text, nullable=True)
+    content_hash = db.Column(db.String(64), nullable=True)
+    content_renderer_version = db.Column(db.Integer, nullable=True, index=True)
+
     # SEO and organization
     slug = db.Column(db.String(200), unique=True, nullable=True, index=True)
+    slug_base = db.Column(db.String(200), nullable=True)  # Slug without suffix
+    slug_seq = db.Column(db.Integer, nullable=True)  # Numeric suffix, 0 for none
     tags = db.Column(db.String(500), nullable=True)  # Comma-separated tags
 
+    # Normalized tags, synced from `tags` on save
+    tag_objects = db.relationship(
+        "TagModel", secondary=post_tags, backref=db.backref("posts", lazy="dynamic")
+    )
+
     # Publishing
-    is_published = db.Column(db.Boolean, default=False, nullable=False, index=True)
+    # active_history keeps the previous value available to the counter events
+    is_published = db.orm.column_property(
+        db.Column(db.Boolean, default=False, nullable=False, index=True),
+        active_history=True,
+    )
     published_at = db.Column(db.DateTime, nullable=True)
 
     # Relationships
-    author_id = db.Column(
-        db.Integer, db.ForeignKey("users.id"), nullable=False, index=True
+    author_id = db.orm.column_property(
+        db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True),
+        active_history=True,
     )
 
     def __repr__(self):
@@ -34,8 +72,13 @@ class PostModel(BaseModel):
     @property
     def tag_list(self):
         """Return tags as a list."""
-        if self.tags:
-            return [tag.strip() for tag in self.tags.split(",") if tag.strip()]
+        return self.split_tags(self.tags)
+
+    @staticmethod
+    def split_tags(tags):
+        """Split comma-separated tags, keeping their order and case."""
+        if tags:
+            return [tag.strip() for tag in tags.split(",") if tag.strip()]
         return []
 
     @tag_list.setter
@@ -59,28 +102,51 @@ class PostModel(BaseModel):
         self.published_at = None
         return self.save()
 
-    def generate_slug(self):
-        """Generate URL-friendly slug from title."""
-        import re
+    def stamp_published_at(self):
+        """Date a post saved as published without a publication date."""
+        if self.is_published and self.published_at is None:
+            self.published_at = datetime.now(UTC)
 
+    @staticmethod
+    def slugify(text):
+        """Convert text to a URL-friendly slug."""
+        # Convert to lowercase and replace spaces/special chars with hyphens
+        slug = re.sub(r"[^\w\s-]", "", text.lower())
+        slug = re.sub(r"[\s_-]+", "-", slug)
+        return slug.strip("-")
+
+    @staticmethod
+    def split_slug(slug):
+        """Split a slug into its base and numeric suffix."""
+        match = re.fullmatch(r"(.+)-(\d+)", slug)
+        if match:
+            return match.group(1), int(match.group(2))
+        return slug, 0
+
+    def generate_slug(self, min_seq=0, session=None):
+        """Generate URL-friendly slug from title.
+
+        The next free suffix comes from a single ``max(slug_seq)`` lookup on the
+        (slug_base, slug_seq) index, so the cost does not grow with the number
+        of posts sharing a title.
+        """
         if not self.title:
             return None
 
-        # Convert to lowercase and replace spaces/special chars with hyphens
-        slug = re.sub(r"[^\w\s-]", "", self.title.lower())
-        slug = re.sub(r"[\s_-]+", "-", slug)
-        slug = slug.strip("-")
+        base_slug = self.slugify(self.title)
 
-        # Ensure uniqueness
-        base_slug = slug
-        counter = 1
-        while (
-            PostModel.query.filter_by(slug=slug).filter(PostModel.id != self.id).first()
-        ):
-            slug = f"{base_slug}-{counter}"
-            counter += 1
+        query = (
+            (session or db.session)
+            .query(db.func.max(PostModel.slug_seq))
+            .filter(PostModel.slug_base == base_slug)
+        )
+        if self.id is not None:
+            query = query.filter(PostModel.id != self.id)
+        current = query.scalar()
 
-        return slug
+        self.slug_base = base_slug
+        self.slug_seq = max(min_seq, 0 if current is None else current + 1)
+        return base_slug if self.slug_seq == 0 else f"{base_slug}-{self.slug_seq}"
 
     def auto_generate_excerpt(self, max_length=200):
         """Generate excerpt from content if not provided."""
@@ -88,10 +154,9 @@ class PostModel(BaseModel):
             return self.excerpt
 
         if self.content:
-            # Remove HTML tags if any and truncate
-            import re
-
-            clean_content = re.sub(r"<[^>]+>", "", self.content)
+            # Use the visible text of the rendered body, without Markdown syntax
+            self.render_content()
+            clean_content = html_to_text(self.content_html)
 
             if len(clean_content) <= max_length:
                 return clean_content
@@ -105,6 +170,51 @@ class PostModel(BaseModel):
 
         return None
 
+    def render_content(self, force=False):
+        """Render content to HTML unless the body and renderer are unchanged."""
+        if not self.content:
+            return False
+
+        digest = content_hash(self.content)
+        if (
+            not force
+            and self.content_hash == digest
+            and self.content_renderer_version == RENDERER_VERSION
+        ):
+            return False
+
+        self.content_html = render_markdown(self.content)
+        self.content_hash = digest
+        self.content_renderer_version = RENDERER_VERSION
+        return True
+
+    @classmethod
+    def rerender_outdated(cls, batch_size=200, force=False):
+        """Re-render posts produced by an older renderer version."""
+        rendered = 0
+        last_id = 0
+        while True:
+            query = cls.query.filter(cls.id > last_id)
+            if not force:
+                query = query.filter(
+                    db.or_(
+                        cls.content_renderer_version.is_(None),
+                        cls.content_renderer_version != RENDERER_VERSION,
+                    )
+                )
+            posts = query.order_by(cls.id).limit(batch_size).all()
+            if not posts:
+                break
+
+            for post in posts:
+                post.render_content(force=force)
+            db.session.commit()
+
+            rendered += len(posts)
+            last_id = posts[-1].id
+
+        return rendered
+
     @classmethod
     def get_published(cls):
         """Get all published posts ordered by publication date."""
@@ -112,6 +222,11 @@ class PostModel(BaseModel):
             db.desc(cls.published_at)
         )
 
+    @classmethod
+    def feed_sort_column(cls, published_only=True):
+        """Column that orders post feeds; drafts have no publication date."""
+        return cls.published_at if published_only else cls.created_at
+
     @classmethod
     def get_by_author(cls, author_id, published_only=True):
         """Get posts by specific author."""
@@ -122,28 +237,369 @@ class PostModel(BaseModel):
 
         return query.order_by(db.desc(cls.created_at))
 
+    @classmethod
+    def get_by_tag(cls, tag_name, published_only=True):
+        """Get posts carrying a tag, resolved through the tag indexes."""
+        query = cls.query.join(post_tags).join(TagModel)
+        query = query.filter(TagModel.name == TagModel.normalize(tag_name))
+
+        if published_only:
+            query = query.filter(cls.is_published.is_(True))
+
+        return query.order_by(db.desc(cls.published_at), db.desc(cls.created_at))
+
+    @classmethod
+    def search_ranked(cls, search_term, published_only=True, after=None):
+        """Search posts, returning (post, score) rows best match first.
+
+        Matching and scoring are delegated to the configured search backend;
+        ``after`` is an optional (score, id) key to continue from.
+        """
+        from app.search import get_search_backend
+
+        hits = get_search_backend().match(search_term)
+        query = db.session.query(cls, hits.c.score).join(hits, hits.c.post_id == cls.id)
+
+        if published_only:
+            query = query.filter(cls.is_published.is_(True))
+
+        if after is not None:
+            query = query.filter(db.tuple_(hits.c.score, cls.id) > after)
+
+        return query.order_by(hits.c.score, cls.id)
+
     @classmethod
     def search_posts(cls, search_term, published_only=True):
-        """Search posts by title or content."""
-        query = cls.query.filter(
-            db.or_(
-                cls.title.contains(search_term),
-                cls.content.contains(search_term),
-                cls.tags.contains(search_term),
+        """Search posts by title, content or tags, best match first."""
+        return cls.search_ranked(search_term, published_only).with_entities(cls)
+
+    @classmethod
+    def backfill_slug_sequences(cls, batch_size=500):
+        """Fill slug_base/slug_seq for posts created before they existed."""
+        updated = 0
+        while True:
+            posts = (
+                cls.query.filter(cls.slug.isnot(None), cls.slug_base.is_(None))
+                .limit(batch_size)
+                .all()
             )
+            if not posts:
+                break
+
+            for post in posts:
+                post.slug_base, post.slug_seq = cls.split_slug(post.slug)
+            db.session.commit()
+            updated += len(posts)
+
+        return updated
+
+    @classmethod
+    def backfill_published_at(cls):
+        """Date published posts that have no publication date by their creation.
+
+        Keyset cursors of the published feed are built from ``published_at``.
+        """
+        result = db.session.execute(
+            db.update(cls)
+            .where(cls.is_published.is_(True), cls.published_at.is_(None))
+            .values(published_at=cls.created_at)
         )
+        db.session.commit()
+        return result.rowcount
 
-        if published_only:
-            query = query.filter_by(is_published=True)
+    def prepare_for_save(self, session=None):
+        """Fill slug, rendered content, excerpt and tags before a flush.
 
-        return query.order_by(db.desc(cls.published_at))
+        Returns whether a new slug was allocated, so callers know a slug
+        conflict on insert may be retried with the next suffix.
+        """
+        slug_allocated = not self.slug
+        if slug_allocated:
+            self.slug = self.generate_slug(session=session)
+        elif self.slug_base is None:
+            self.slug_base, self.slug_seq = self.split_slug(self.slug)
 
-    def save(self):
-        """Override save to auto-generate slug and excerpt."""
-        if not self.slug:
-            self.slug = self.generate_slug()
+        self.render_content()
+        self.stamp_published_at()
 
         if not self.excerpt:
             self.excerpt = self.auto_generate_excerpt()
 
-        return super().save()
+        if self.id is None or db.inspect(self).attrs.tags.history.has_changes():
+            self.tag_objects = TagModel.get_or_create_many(self.tag_list, session)
+
+        return slug_allocated
+
+    def save(self):
+        """Override save to auto-generate slug and excerpt."""
+        slug_allocated = self.prepare_for_save()
+
+        attempt = 1
+        while True:
+            try:
+                return super().save()
+            except IntegrityError as e:
+                # A concurrent create (or a legacy row) took the slug: move on
+                # to the next suffix
+                db.session.rollback()
+                if (
+                    not slug_allocated
+                    or "slug" not in str(e.orig)
+                    or attempt >= self.SLUG_ALLOCATION_ATTEMPTS
+                ):
+                    raise
+                attempt += 1
+                self.slug = self.generate_slug(min_seq=self.slug_seq + 1)
+
+    @classmethod
+    def allocate_slugs(cls, posts, session=None):
+        """Give new posts free slugs with one lookup for the whole batch."""
+        session = session or db.session
+        bases = [cls.slugify(post.title) for post in posts]
+        next_seq = {
+            base: seq + 1
+            for base, seq in session.execute(
+                db.select(cls.slug_base, db.func.max(cls.slug_seq))
+                .where(cls.slug_base.in_(set(bases)))
+                .group_by(cls.slug_base)
+            )
+        }
+
+        pending = list(zip(posts, bases, strict=True))
+        while pending:
+            for post, base in pending:
+                post.slug_base = base
+                post.slug_seq = next_seq.get(base, 0)
+                post.slug = base if post.slug_seq == 0 else f"{base}-{post.slug_seq}"
+                next_seq[base] = post.slug_seq + 1
+
+            # Legacy slugs may not follow their base (e.g. "hello-2" titled
+            # "Hello 2"); move the few colliding posts on to the next suffix
+            taken = set(
+                session.scalars(
+                    db.select(cls.slug).where(
+                        cls.slug.in_([post.slug for post, _ in pending])
+                    )
+                )
+            )
+            pending = [(post, base) for post, base in pending if post.slug in taken]
+
+    @classmethod
+    def prepare_many(cls, posts, session=None):
+        """Batch counterpart of ``prepare_for_save`` for new posts.
+
+        Posts that already have a slug keep it. Returns the tags of each post
+        rather than attaching them, as the posts are inserted outside the unit
+        of work.
+        """
+        session = session or db.session
+        cls.allocate_slugs([post for post in posts if not post.slug], session)
+        for post in posts:
+            if post.slug_base is None:
+                post.slug_base, post.slug_seq = cls.split_slug(post.slug)
+
+        names = [name for post in posts for name in post.tag_list]
+        tags = {tag.name: tag for tag in TagModel.get_or_create_many(names, session)}
+        tags_per_post = []
+        for post in posts:
+            names = dict.fromkeys(TagModel.normalize(name) for name in post.tag_list)
+            tags_per_post.append([tags[name] for name in names if name])
+            post.render_content()
+            post.stamp_published_at()
+            if not post.excerpt:
+                post.excerpt = post.auto_generate_excerpt()
+        return tags_per_post
+
+    @classmethod
+    def insert_many(cls, posts, session=None):
+        """Insert new posts with one multi-row INSERT, without committing.
+
+        The unit of work inserts row by row on SQLite to read back each id, so
+        this runs a single executemany and looks the ids up by their unique
+        slugs instead. The posts themselves stay unsaved; returns the new ids
+        in order.
+        """
+        if not posts:
+            return []
+
+        session = session or db.session
+        tags_per_post = cls.prepare_many(posts, session)
+        session.flush()  # Assigns ids to newly created tags
+
+        # executemany needs the same keys in every row: unset timestamps are
+        # now and other unset columns get their scalar default
+        now = datetime.now(UTC)
+        columns = [column for column in cls.__table__.columns if column.key != "id"]
+        rows = []
+        for post in posts:
+            row = {}
+            for column in columns:
+                value = getattr(post, column.key)
+                default = column.default
+                if value is None and column.key in ("created_at", "updated_at"):
+                    value = now
+                elif value is None and default is not None and default.is_scalar:
+                    value = default.arg
+                row[column.key] = value
+            rows.append(row)
+        # A Core insert, as ORM bulk inserts split rows by which values are None
+        session.execute(cls.__table__.insert(), rows)
+
+        ids_by_slug = dict(
+            session.execute(
+                db.select(cls.slug, cls.id).where(
+                    cls.slug.in_([post.slug for post in posts])
+                )
+            ).all()
+        )
+        post_ids = [ids_by_slug[post.slug] for post in posts]
+
+        links = [
+            {"post_id": post_id, "tag_id": tag.id}
+            for post_id, tags in zip(post_ids, tags_per_post, strict=True)
+            for tag in tags
+        ]
+        if links:
+            session.execute(post_tags.insert(), links)
+
+        # What the per-row insert events would have done
+        counters = {}
+        for post in posts:
+            total, published = counters.get(post.author_id, (0, 0))
+            counters[post.author_id] = (total + 1, published + bool(post.is_published))
+        connection = session.connection()
+        for author_id, (total, published) in counters.items():
+            _adjust_post_counters(connection, author_id, total, published)
+        queue_purge(
+            session,
+            surrogate_key("posts"),
+            *(surrogate_key("post", post_id) for post_id in post_ids),
+            *(surrogate_key("user", author_id) for author_id in counters),
+        )
+
+        return post_ids
+
+    @classmethod
+    def flush_batch(cls, session=None):
+        """Flush pending post changes, updating author counters per author."""
+        session = session or db.session
+        with cls.batched_counters(session):
+            session.flush()
+
+    @classmethod
+    @contextmanager
+    def batched_counters(cls, session=None):
+        """Apply author counter changes once per author instead of per row."""
+        session = session or db.session
+        deltas = session.info[BATCHED_COUNTERS] = {}
+        try:
+            yield
+            connection = session.connection()
+            for author_id, (total, published) in deltas.items():
+                _adjust_post_counters(connection, author_id, total, published)
+        finally:
+            session.info.pop(BATCHED_COUNTERS, None)
+
+
+# session.info key collecting counter deltas inside PostModel.batched_counters
+BATCHED_COUNTERS = "post_counter_deltas"
+
+
+def _adjust_post_counters(connection, author_id, total=0, published=0, session=None):
+    """Shift an author's denormalized counters; NULL counters stay NULL."""
+    from app.models.user import UserModel
+
+    if not total and not published:
+        return
+
+    deltas = session.info.get(BATCHED_COUNTERS) if session is not None else None
+    if deltas is not None:
+        delta = deltas.setdefault(author_id, [0, 0])
+        delta[0] += total
+        delta[1] += published
+        return
+
+    connection.execute(
+        db.update(UserModel)
+        .where(UserModel.id == author_id)
+        .values(
+            post_count=UserModel.post_count + total,
+            published_post_count=UserModel.published_post_count + published,
+        )
+    )
+
+
+@event.listens_for(PostModel, "after_insert")
+def _count_inserted_post(mapper, connection, target):
+    _adjust_post_counters(
+        connection,
+        target.author_id,
+        total=1,
+        published=int(target.is_published),
+        session=object_session(target),
+    )
+
+
+@event.listens_for(PostModel, "after_delete")
+def _count_deleted_post(mapper, connection, target):
+    _adjust_post_counters(
+        connection,
+        target.author_id,
+        total=-1,
+        published=-int(target.is_published),
+        session=object_session(target),
+    )
+
+
+@event.listens_for(PostModel, "after_update")
+def _count_updated_post(mapper, connection, target):
+    state = db.inspect(target)
+    author_history = state.attrs.author_id.history
+    published_history = state.attrs.is_published.history
+
+    if not author_history.has_changes() and not published_history.has_changes():
+        return
+
+    old_author = (author_history.deleted or [target.author_id])[0]
+    old_published = bool((published_history.deleted or [target.is_published])[0])
+    session = object_session(target)
+
+    if old_author == target.author_id:
+        _adjust_post_counters(
+            connection,
+            target.author_id,
+            published=int(target.is_published) - int(old_published),
+            session=session,
+        )
+        return
+
+    _adjust_post_counters(
+        connection, old_author, total=-1, published=-int(old_published), session=session
+    )
+    _adjust_post_counters(
+        connection,
+        target.author_id,
+        total=1,
+        published=int(target.is_published),
+        session=session,
+    )
+
+
+@event.listens_for(PostModel, "after_update")
+@event.listens_for(PostModel, "after_delete")
+def _invalidate_cached_post(mapper, connection, target):
+    invalidate_post(target.id, object_session(target))
+
+
+@event.listens_for(PostModel, "after_insert")
+@event.listens_for(PostModel, "after_update")
+@event.listens_for(PostModel, "after_delete")
+def _purge_post_surrogate_keys(mapper, connection, target):
+    author_ids = {target.author_id}
+    author_ids.update(db.inspect(target).attrs.author_id.history.deleted)
+    queue_purge(
+        object_session(target),
+        surrogate_key("posts"),
+        surrogate_key("post", target.id),
+        *(surrogate_key("user", author_id) for author_id in author_ids),
+    )
@@ -0,0 +1,31 @@
+# app/models/revoked_token.py
+from app.extensions import db
+from app.models.base import BaseModel
+
+
+class RevokedTokenModel(BaseModel):
+    """A revoked JWT, or with no ``jti`` every token a user was issued before
+    ``created_at`` (sign out of all sessions).
+
+    Rows are only needed until ``expires_at``; after that the tokens they
+    revoke are rejected as expired anyway.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    jti = db.Column(db.String(36), unique=True, nullable=True)
+    token_type = db.Column(db.String(10), nullable=True)
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<RevokedTokenModel {self.jti or f'all:{self.user_id}'}>"
+
+    @classmethod
+    def purge_expired(cls, now):
+        """Delete rows whose tokens have expired anyway."""
+        result = db.session.execute(db.delete(cls).where(cls.expires_at <= now))
+        db.session.commit()
+        return result.rowcount
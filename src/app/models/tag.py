@@ -0,0 +1,108 @@
+# app/models/tag.py
+from app.extensions import db
+from app.models.base import BaseModel
+
+# Association table; the composite primary key serves post -> tags lookups and
+# the reversed index serves tag -> posts lookups
+post_tags = db.Table(
+    "post_tags",
+    db.Column(
+        "post_id",
+        db.Integer,
+        db.ForeignKey("posts.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    db.Column(
+        "tag_id",
+        db.Integer,
+        db.ForeignKey("tags.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    db.Index("ix_post_tags_tag_id_post_id", "tag_id", "post_id"),
+)
+
+
+class TagModel(BaseModel):
+    """Normalized tag shared between posts."""
+
+    __tablename__ = "tags"
+
+    name = db.Column(db.String(100), unique=True, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<TagModel {self.name}>"
+
+    @staticmethod
+    def normalize(name):
+        """Return the canonical form of a tag name."""
+        return name.strip().lower()
+
+    @classmethod
+    def find_by_name(cls, name):
+        """Find tag by name."""
+        return cls.query.filter_by(name=cls.normalize(name)).first()
+
+    @classmethod
+    def get_or_create_many(cls, names, session=None):
+        """Return tags for the given names, creating the missing ones."""
+        names = list(dict.fromkeys(cls.normalize(name) for name in names if name))
+        if not names:
+            return []
+
+        session = session or db.session
+        existing = {
+            tag.name: tag
+            for tag in session.scalars(db.select(cls).where(cls.name.in_(names)))
+        }
+        for name in names:
+            if name not in existing:
+                existing[name] = cls(name=name)
+                session.add(existing[name])
+
+        return [existing[name] for name in names]
+
+    @classmethod
+    def get_with_post_counts(cls, published_only=True):
+        """Return (name, post_count) rows aggregated over the tag index."""
+        from app.models.post import PostModel
+
+        count = db.func.count(post_tags.c.post_id)
+        query = (
+            db.select(cls.name, count)
+            .join(post_tags, post_tags.c.tag_id == cls.id)
+            .group_by(cls.id, cls.name)
+            .order_by(db.desc(count), cls.name)
+        )
+
+        if published_only:
+            query = query.join(PostModel, PostModel.id == post_tags.c.post_id).where(
+                PostModel.is_published.is_(True)
+            )
+
+        return db.session.execute(query).all()
+
+    @classmethod
+    def backfill_from_posts(cls, batch_size=500):
+        """Populate tag tables from the legacy comma-separated post tags."""
+        from app.models.post import PostModel
+
+        migrated = 0
+        last_id = 0
+        while True:
+            posts = (
+                PostModel.query.filter(PostModel.id > last_id)
+                .order_by(PostModel.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not posts:
+                break
+
+            for post in posts:
+                post.tag_objects = cls.get_or_create_many(post.tag_list)
+            db.session.commit()
+
+            migrated += len(posts)
+            last_id = posts[-1].id
+
+        return migrated
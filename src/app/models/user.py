@@ -1,14 +1,19 @@
 # app/models/user.py
-from werkzeug.security import check_password_hash, generate_password_hash
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
 
+from app.cache import invalidate_user
 from app.extensions import db
+from app.http_cache import queue_purge, surrogate_key
 from app.models.base import BaseModel
+from app.passwords import get_password_hasher
 
 
 class UserModel(BaseModel):
     """UserModel model for authentication and blog authoring."""
 
     __tablename__ = "users"
+    __table_args__ = (db.Index("ix_users_created_at_id", "created_at", "id"),)
 
     # UserModel identification
     username = db.Column(db.String(80), unique=True, nullable=False, index=True)
@@ -25,6 +30,10 @@ class UserModel(BaseModel):
     # Account status
     is_active = db.Column(db.Boolean, default=True, nullable=False)
 
+    # Denormalized counters maintained by PostModel events (NULL until rebuilt)
+    post_count = db.Column(db.Integer, default=0, nullable=True)
+    published_post_count = db.Column(db.Integer, default=0, nullable=True)
+
     # Relationships
     posts = db.relationship(
         "PostModel", backref="author", lazy="dynamic", cascade="all, delete-orphan"
@@ -35,11 +44,15 @@ class UserModel(BaseModel):
 
     def set_password(self, password):
         """Hash and set user password."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = get_password_hasher().hash(password)
 
     def check_password(self, password):
         """Check if provided password matches stored hash."""
-        return check_password_hash(self.password_hash, password)
+        return get_password_hasher().verify(self.password_hash, password)
+
+    def password_needs_rehash(self):
+        """Whether the stored hash predates the configured hash parameters."""
+        return get_password_hasher().needs_rehash(self.password_hash)
 
     @property
     def full_name(self):
@@ -51,11 +64,6 @@ class UserModel(BaseModel):
         else:
             return self.username
 
-    @property
-    def post_count(self):
-        """Return number of posts by this user."""
-        return self.posts.count()
-
     def get_recent_posts(self, limit=5):
         """Get user's most recent posts."""
         return self.posts.order_by(db.desc("created_at")).limit(limit).all()
@@ -76,3 +84,41 @@ class UserModel(BaseModel):
         user = cls(username=username, email=email, **kwargs)
         user.set_password(password)
         return user.save()
+
+    @classmethod
+    def rebuild_post_counters(cls):
+        """Recompute post counters for every user with a single UPDATE."""
+        from app.models.post import PostModel
+
+        total = (
+            db.select(db.func.count(PostModel.id))
+            .where(PostModel.author_id == cls.id)
+            .scalar_subquery()
+        )
+        published = (
+            db.select(db.func.count(PostModel.id))
+            .where(PostModel.author_id == cls.id, PostModel.is_published.is_(True))
+            .scalar_subquery()
+        )
+        result = db.session.execute(
+            db.update(cls).values(post_count=total, published_post_count=published)
+        )
+        db.session.commit()
+        return result.rowcount
+
+
+@event.listens_for(UserModel, "after_insert")
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def _purge_user_surrogate_keys(mapper, connection, target):
+    queue_purge(
+        object_session(target),
+        surrogate_key("users"),
+        surrogate_key("user", target.id),
+    )
+
+
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def _invalidate_user_snapshot(mapper, connection, target):
+    invalidate_user(target.id, object_session(target))
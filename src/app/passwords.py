@@ -0,0 +1,125 @@
+# app/passwords.py
+"""Password hashing off the request threads.
+
+Hashing is deliberately slow, so it runs in a small process pool rather than
+in the threads serving requests. Only ``max_pending`` jobs may be queued at a
+time; a burst of logins beyond that fails fast instead of starving every
+worker.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from flask import current_app, has_app_context
+from werkzeug.security import (
+    DEFAULT_PBKDF2_ITERATIONS,
+    check_password_hash,
+    generate_password_hash,
+)
+
+
+class PasswordHashingBusy(RuntimeError):
+    """Raised when too many password hashes are already queued."""
+
+
+def normalize_hash_method(method: str) -> str:
+    """Spell out werkzeug's defaults, as they appear in stored hashes."""
+    name, *args = method.split(":")
+    if name == "scrypt":
+        defaults = [str(2**15), "8", "1"]
+    elif name == "pbkdf2":
+        defaults = ["sha256", str(DEFAULT_PBKDF2_ITERATIONS)]
+    else:
+        raise ValueError(f"Unsupported password hash method {method!r}")
+    return ":".join([name, *args, *defaults[len(args) :]])
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords in a bounded process pool."""
+
+    def __init__(
+        self,
+        method: str = "scrypt",
+        workers: int = 2,
+        max_pending: int = 32,
+        timeout: float | None = 10.0,
+    ):
+        self.method = normalize_hash_method(method)
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._executor_pid = None
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured method."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        """Check a password against a stored hash."""
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Whether a stored hash was made with other parameters than configured."""
+        return password_hash.split("$", 1)[0] != self.method
+
+    def _run(self, function, *args):
+        if self.workers <= 0:
+            return function(*args)
+
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusy(
+                "Too many password checks in progress, please retry shortly"
+            )
+
+        try:
+            future = self._get_executor().submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result(timeout=self.timeout)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            # A forked app worker must not share its parent's pool
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    # Workers only import werkzeug, not the app
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+def init_password_hasher(app):
+    """Create the password hasher from config."""
+    app.extensions["password_hasher"] = PasswordHasher(
+        method=app.config["PASSWORD_HASH_METHOD"],
+        workers=app.config["PASSWORD_HASH_WORKERS"],
+        max_pending=app.config["PASSWORD_HASH_MAX_PENDING"],
+        timeout=app.config["PASSWORD_HASH_TIMEOUT"],
+    )
+
+
+# Used outside an app context, e.g. by scripts importing the models
+_inline_hasher = PasswordHasher(workers=0)
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the password hasher of the current app."""
+    if not has_app_context():
+        return _inline_hasher
+    return current_app.extensions.get("password_hasher", _inline_hasher)
@@ -0,0 +1,168 @@
+# app/profiling.py
+"""Profiles of single GraphQL requests.
+
+An admin (a user listed in ``ADMIN_USERNAMES``) profiles a request by sending
+an ``X-Profile`` header; ``PROFILE_SAMPLE_RATE`` additionally profiles a random
+fraction of all requests. ``X-Profile: cprofile`` records a deterministic
+cProfile trace (``.prof``, for pstats or snakeviz); any other value samples
+the request's stack every ``PROFILE_SAMPLE_INTERVAL_MS`` into collapsed stacks
+(``.collapsed``, for flamegraph.pl or speedscope). Sampling only slows the
+request by the time taken to walk its stack, so it suits production use.
+
+Profiles are written to ``PROFILE_DIR``, which keeps the newest
+``PROFILE_MAX_FILES``, and are downloaded by admins from
+``/api/profiles/<profile id>``.
+"""
+
+import cProfile
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from flask import current_app, request
+
+from app.identity import current_identity
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+# Profile ids are file names inside the profile directory
+PROFILE_ID = re.compile(r"^[\w.-]+\.(collapsed|prof)$")
+
+
+class StackSampler:
+    """Counts the stacks of one thread, sampled at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                    f":{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Stacks in the collapsed format, root first, one per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+class RequestProfile:
+    """Profiles the current thread between ``start`` and ``stop``."""
+
+    def __init__(self, mode: str, directory: str, max_files: int, interval: float):
+        self.mode = mode
+        self.directory = directory
+        self.max_files = max_files
+        self.interval = interval
+        self.name = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:12]}"
+        self._profiler = None
+
+    @property
+    def id(self) -> str:
+        """File name of the profile."""
+        return f"{self.name}.{'prof' if self.mode == 'cprofile' else 'collapsed'}"
+
+    def start(self) -> None:
+        if self.mode == "cprofile":
+            self._profiler = cProfile.Profile()
+            try:
+                self._profiler.enable()
+                return
+            except ValueError:
+                # Python 3.12+ runs one cProfile per process; sample instead
+                self.mode = "sample"
+
+        self._profiler = StackSampler(threading.get_ident(), self.interval)
+        self._profiler.start()
+
+    def stop(self) -> str:
+        """Stop profiling and write the profile, returning its path."""
+        if self.mode == "cprofile":
+            self._profiler.disable()
+        else:
+            self._profiler.stop()
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, self.id)
+        if self.mode == "cprofile":
+            self._profiler.dump_stats(path)
+        else:
+            with open(path, "w") as f:
+                f.write(self._profiler.collapsed())
+        prune_profiles(self.directory, self.max_files)
+        return path
+
+
+def prune_profiles(directory: str, max_files: int) -> None:
+    """Delete all but the newest ``max_files`` profiles."""
+    profiles = sorted(
+        (entry for entry in os.scandir(directory) if PROFILE_ID.match(entry.name)),
+        key=lambda entry: entry.stat().st_mtime,
+    )
+    for entry in profiles[: max(len(profiles) - max_files, 0)]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            # Pruned concurrently by another worker
+            pass
+
+
+def profile_directory() -> str:
+    """Return the directory profiles of the current app are written to."""
+    return current_app.config["PROFILE_DIR"] or os.path.join(
+        current_app.instance_path, "profiles"
+    )
+
+
+def is_admin() -> bool:
+    """Whether the current request carries the token of an admin user."""
+    user = current_identity().user
+    return user is not None and user.username in current_app.config["ADMIN_USERNAMES"]
+
+
+def request_profile() -> RequestProfile | None:
+    """Return the profile to record for the current request, if any."""
+    config = current_app.config
+    mode = request.headers.get(PROFILE_HEADER, "").strip().lower()
+
+    if mode and is_admin():
+        mode = "cprofile" if mode == "cprofile" else "sample"
+    elif (
+        config["PROFILE_SAMPLE_RATE"]
+        and random.random() < config["PROFILE_SAMPLE_RATE"]
+    ):
+        mode = "sample"
+    else:
+        return None
+
+    return RequestProfile(
+        mode,
+        profile_directory(),
+        max_files=config["PROFILE_MAX_FILES"],
+        interval=config["PROFILE_SAMPLE_INTERVAL_MS"] / 1000,
+    )
@@ -0,0 +1,36 @@
+# app/rendering.py
+"""Markdown to sanitized HTML rendering for post content."""
+
+import hashlib
+import html
+
+import markdown
+import nh3
+
+# Bump whenever rendering output changes, then run `flask rerender-posts`
+RENDERER_VERSION = 1
+
+MARKDOWN_EXTENSIONS = ["fenced_code", "tables", "sane_lists"]
+
+# Keep language classes on code blocks for client-side highlighting
+ALLOWED_ATTRIBUTES = {
+    **nh3.ALLOWED_ATTRIBUTES,
+    "code": {"class"},
+}
+
+
+def content_hash(content: str) -> str:
+    """Return the hash identifying a content body."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def render_markdown(content: str) -> str:
+    """Render Markdown to HTML with scripts, handlers and unsafe URLs removed."""
+    rendered = markdown.markdown(content, extensions=MARKDOWN_EXTENSIONS)
+    return nh3.clean(rendered, attributes=ALLOWED_ATTRIBUTES)
+
+
+def html_to_text(rendered: str) -> str:
+    """Return the visible text of rendered HTML on a single line."""
+    text = html.unescape(nh3.clean(rendered, tags=set()))
+    return " ".join(text.split())
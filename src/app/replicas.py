@@ -0,0 +1,128 @@
+# app/replicas.py
+"""Read-replica routing.
+
+Replicas are Flask-SQLAlchemy binds (``replica_0``, ``replica_1``, ...). Only
+GraphQL query operations read from them; mutations, CLI commands and anything
+flushing stay on the primary. A client that just committed a write reads from
+the primary for ``READ_AFTER_WRITE_WINDOW`` seconds so it sees its own changes.
+
+The window travels with the client rather than living in a worker: the
+response to a write carries a signed, timestamped token naming the client (its
+user and address) in a cookie and a header. Any worker honours the token until
+the window passes, as long as it is sent back by the same client, either as the
+cookie or echoed in the header.
+"""
+
+import itertools
+import math
+
+from flask import current_app, g, has_app_context, has_request_context, request
+from flask_sqlalchemy.session import Session
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from sqlalchemy import event
+
+# Cookie and header carrying the read-after-write token
+READ_AFTER_WRITE_COOKIE = "read_after_write"
+READ_AFTER_WRITE_HEADER = "X-Read-After-Write"
+
+
+class RoutingSession(Session):
+    """Session sending reads to the replica chosen for the current request."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_app_context():
+            replica = g.get("read_replica")
+            if replica is not None:
+                return self._db.engines[replica]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def init_read_routing(app, replicas: list[str]):
+    """Set up replica rotation and the read-after-write tokens."""
+    app.extensions["read_replicas"] = itertools.cycle(replicas) if replicas else None
+    if replicas:
+        app.extensions["read_after_write"] = URLSafeTimedSerializer(
+            app.config["SECRET_KEY"], salt="read-after-write"
+        )
+        app.after_request(issue_read_after_write_token)
+
+
+def client_keys() -> list[str]:
+    """Keys identifying the requesting client for read-after-write tracking."""
+    # Imported here: the session class is needed before the models exist
+    from app.identity import current_identity
+
+    # remote_addr is the forwarded client address behind TRUSTED_PROXY_COUNT
+    # proxies (see create_app)
+    keys = [f"addr:{request.remote_addr}"]
+    user_id = current_identity().user_id
+    if user_id is not None:
+        keys.append(f"user:{user_id}")
+    return keys
+
+
+def reads_own_writes() -> bool:
+    """Whether the request carries a live read-after-write token for its client."""
+    serializer = current_app.extensions.get("read_after_write")
+    token = request.cookies.get(READ_AFTER_WRITE_COOKIE) or request.headers.get(
+        READ_AFTER_WRITE_HEADER
+    )
+    if serializer is None or not token:
+        return False
+
+    try:
+        keys = serializer.loads(
+            token, max_age=current_app.config["READ_AFTER_WRITE_WINDOW"]
+        )
+    except BadSignature:  # Tampered with or expired
+        return False
+    return not set(keys).isdisjoint(client_keys())
+
+
+def route_reads_to_replica() -> str | None:
+    """Send the current request's reads to a replica, unless it must stay on
+    the primary to read its own writes."""
+    replicas = current_app.extensions.get("read_replicas")
+    if replicas is None or not has_request_context() or reads_own_writes():
+        return None
+
+    g.read_replica = next(replicas)
+    return g.read_replica
+
+
+def issue_read_after_write_token(response):
+    """Hand a client that committed a write its read-after-write token."""
+    if g.pop("committed_write", False):
+        token = current_app.extensions["read_after_write"].dumps(client_keys())
+        response.set_cookie(
+            READ_AFTER_WRITE_COOKIE,
+            token,
+            max_age=math.ceil(current_app.config["READ_AFTER_WRITE_WINDOW"]),
+            secure=request.is_secure,
+            httponly=True,
+            samesite="Lax",
+        )
+        response.headers[READ_AFTER_WRITE_HEADER] = token
+    return response
+
+
+def route_reads_to_primary() -> None:
+    """Undo replica routing for the rest of the request."""
+    if has_app_context():
+        g.pop("read_replica", None)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _note_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_writer(session):
+    if session.info.pop("wrote", False) and has_request_context():
+        g.committed_write = True
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_write(session):
+    session.info.pop("wrote", None)
@@ -0,0 +1,199 @@
+# app/revocation.py
+"""JWT revocation checked through an in-memory Bloom filter.
+
+Revoked token ids (``jti``) live in the ``revoked_tokens`` table. Each process
+keeps a Bloom filter of them, plus the per-user "signed out everywhere"
+cutoffs, rebuilt from the table every ``TOKEN_REVOCATION_REFRESH_INTERVAL``
+seconds. Most tokens are not in the filter and are accepted without touching
+the database; a filter hit is confirmed with a query to rule out false
+positives. Revocations made by this process apply immediately, those made by
+other processes after their next rebuild.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from datetime import UTC, datetime
+
+from flask import current_app
+
+from app.extensions import db, jwt
+from app.models import RevokedTokenModel
+
+# Smallest filter built, leaving room for revocations between rebuilds
+BLOOM_MIN_CAPACITY = 1024
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter of strings."""
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001):
+        self.size = max(
+            8,
+            math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2),
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        # Double hashing: k positions from two 64-bit halves
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+def _on_primary() -> dict:
+    # Replicas may lag behind a revocation, so always ask the primary
+    return {"bind": db.engine}
+
+
+def _cutoff(value: datetime) -> int:
+    # JWT iat claims are whole seconds, so cutoffs are too: a token issued in
+    # the same second as the revocation, before or after it, stays valid
+    # SQLite returns naive datetimes; they are stored in UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return math.floor(value.timestamp())
+
+
+class RevocationList:
+    """Per-process view of the revoked tokens."""
+
+    def __init__(self, refresh_interval: float = 30.0, false_positive_rate=0.001):
+        self.refresh_interval = refresh_interval
+        self.false_positive_rate = false_positive_rate
+        self._lock = threading.Lock()
+        self._filter = BloomFilter(BLOOM_MIN_CAPACITY, false_positive_rate)
+        self._cutoffs: dict[int, int] = {}
+        self._loaded_at = None
+        self.checks = 0
+        self.filter_hits = 0
+        self.revoked = 0
+        self.rebuilds = 0
+
+    def is_revoked(self, claims: dict) -> bool:
+        """Whether a decoded token has been revoked."""
+        self._refresh_if_stale()
+        self.checks += 1
+
+        cutoff = self._cutoffs.get(int(claims["sub"]))
+        if cutoff is not None and claims["iat"] < cutoff:
+            self.revoked += 1
+            return True
+
+        jti = claims.get("jti")
+        if jti is None or jti not in self._filter:
+            return False
+
+        # Confirm, as the filter may report false positives
+        self.filter_hits += 1
+        revoked = db.session.scalar(
+            db.select(db.exists().where(RevokedTokenModel.jti == jti)),
+            bind_arguments=_on_primary(),
+        )
+        if revoked:
+            self.revoked += 1
+        return revoked
+
+    def revoke(self, claims: dict) -> None:
+        """Revoke a single decoded token."""
+        RevokedTokenModel(
+            jti=claims["jti"],
+            token_type=claims.get("type"),
+            user_id=int(claims["sub"]),
+            expires_at=datetime.fromtimestamp(claims["exp"], UTC),
+        ).save()
+        with self._lock:
+            self._filter.add(claims["jti"])
+
+    def revoke_all(self, user_id: int) -> None:
+        """Revoke every token issued to a user before the current second."""
+        now = datetime.now(UTC)
+        longest = max(
+            current_app.config["JWT_ACCESS_TOKEN_EXPIRES"],
+            current_app.config["JWT_REFRESH_TOKEN_EXPIRES"],
+        )
+        RevokedTokenModel(
+            user_id=user_id, created_at=now, expires_at=now + longest
+        ).save()
+        with self._lock:
+            self._cutoffs[user_id] = _cutoff(now)
+
+    def rebuild(self) -> None:
+        """Reload the filter and cutoffs from the table."""
+        now = datetime.now(UTC)
+        active = RevokedTokenModel.expires_at > now
+        jtis = db.session.scalars(
+            db.select(RevokedTokenModel.jti).where(
+                active, RevokedTokenModel.jti.is_not(None)
+            ),
+            bind_arguments=_on_primary(),
+        ).all()
+        cutoffs = db.session.execute(
+            db.select(
+                RevokedTokenModel.user_id, db.func.max(RevokedTokenModel.created_at)
+            )
+            .where(active, RevokedTokenModel.jti.is_(None))
+            .group_by(RevokedTokenModel.user_id),
+            bind_arguments=_on_primary(),
+        ).all()
+
+        bloom = BloomFilter(
+            max(BLOOM_MIN_CAPACITY, 2 * len(jtis)), self.false_positive_rate
+        )
+        for jti in jtis:
+            bloom.add(jti)
+
+        with self._lock:
+            self._filter = bloom
+            self._cutoffs = {user_id: _cutoff(at) for user_id, at in cutoffs}
+            self._loaded_at = time.monotonic()
+            self.rebuilds += 1
+
+    def _refresh_if_stale(self) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at >= self.refresh_interval:
+            self.rebuild()
+
+    def stats(self) -> dict:
+        """Return counters for sizing the filter and refresh interval."""
+        return {
+            "filter_bits": self._filter.size,
+            "filter_hashes": self._filter.hash_count,
+            "user_cutoffs": len(self._cutoffs),
+            "checks": self.checks,
+            "filter_hits": self.filter_hits,
+            "revoked": self.revoked,
+            "rebuilds": self.rebuilds,
+        }
+
+
+def init_revocation(app):
+    """Create the revocation list and hook it into Flask-JWT-Extended."""
+    app.extensions["token_revocations"] = RevocationList(
+        refresh_interval=app.config["TOKEN_REVOCATION_REFRESH_INTERVAL"],
+        false_positive_rate=app.config["TOKEN_REVOCATION_FALSE_POSITIVE_RATE"],
+    )
+    jwt.token_in_blocklist_loader(is_token_revoked)
+
+
+def get_revocation_list() -> RevocationList:
+    """Return the revocation list of the current app."""
+    return current_app.extensions["token_revocations"]
+
+
+def is_token_revoked(jwt_header: dict, jwt_data: dict) -> bool:
+    """Flask-JWT-Extended blocklist callback, used by ``jwt_required`` views."""
+    return get_revocation_list().is_revoked(jwt_data)
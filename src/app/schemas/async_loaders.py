@@ -0,0 +1,56 @@
+# app/schemas/async_loaders.py
+"""Request-scoped DataLoaders for the async schema.
+
+Strawberry's DataLoader collects every ``load`` issued in the same event loop
+tick into one batch. Each batch opens its own session, since loaders for
+different fields dispatch concurrently.
+"""
+
+from strawberry.dataloader import DataLoader
+
+from app.async_db import async_session
+from app.extensions import db
+from app.models import PostModel, UserModel
+
+
+async def load_users(user_ids: list[int]) -> list[UserModel | None]:
+    """Load users by id with a single ``WHERE id IN (...)`` query."""
+    async with async_session() as session:
+        users = await session.scalars(
+            db.select(UserModel).where(UserModel.id.in_(user_ids))
+        )
+        by_id = {user.id: user for user in users}
+    return [by_id.get(user_id) for user_id in user_ids]
+
+
+async def load_post_counts(author_ids: list[int]) -> list[tuple[int, int]]:
+    """Count total and published posts per author with one GROUP BY query."""
+    async with async_session() as session:
+        rows = await session.execute(
+            db.select(
+                PostModel.author_id,
+                db.func.count(PostModel.id),
+                db.func.count(PostModel.id).filter(PostModel.is_published.is_(True)),
+            )
+            .where(PostModel.author_id.in_(author_ids))
+            .group_by(PostModel.author_id)
+        )
+        counts = {author_id: (total, published) for author_id, total, published in rows}
+    return [counts.get(author_id, (0, 0)) for author_id in author_ids]
+
+
+class AsyncLoaders:
+    """Container for the loaders available to a single async GraphQL request."""
+
+    def __init__(self):
+        self.user_by_id = DataLoader(load_fn=load_users)
+        self.post_counts_by_author = DataLoader(load_fn=load_post_counts)
+
+
+def get_async_loaders(info) -> AsyncLoaders:
+    """Return the request loaders, creating them if the context has none."""
+    context = info.context
+    loaders = context.get("async_loaders")
+    if loaders is None:
+        loaders = context["async_loaders"] = AsyncLoaders()
+    return loaders
@@ -0,0 +1,402 @@
+# app/schemas/async_schema.py
+"""Async variant of the GraphQL schema, served by the ASGI app.
+
+Types keep the names of their sync counterparts and the shared operations
+resolve to the same shapes. The Relay connections (postsConnection,
+postsByAuthorConnection, searchPostsConnection, usersConnection) and the tags
+query are only served by the Flask app, while register is only exposed here.
+"""
+
+import strawberry
+from strawberry.types import Info
+
+from app.async_db import async_session
+from app.extensions import db
+from app.models import UserModel
+from app.schemas.async_loaders import get_async_loaders
+from app.schemas.schema import post_input_fields, schema_extensions
+from app.schemas.selection import post_columns
+from app.schemas.types import (
+    BulkDeletePayloadGType,
+    BulkItemErrorGType,
+    LoginGInput,
+    MessageResponseGType,
+    PostGInput,
+    PostGType,
+    UserGInput,
+    UserGType,
+    convert_bulk_errors,
+    convert_post_model,
+    convert_user_model,
+)
+from app.services.async_auth_service import AsyncAuthService
+from app.services.async_post_service import AsyncPostService
+
+
+@strawberry.type(name="UserGType", description="GraphQL User Type")
+class AsyncUserGType(UserGType):
+    @strawberry.field()
+    async def post_count(self, info: Info) -> int:
+        """Number of posts by this user"""
+        if self.stored_post_count is not None:
+            return self.stored_post_count
+        return (await get_async_loaders(info).post_counts_by_author.load(self.id))[0]
+
+    @strawberry.field()
+    async def published_post_count(self, info: Info) -> int:
+        """Number of published posts by this user"""
+        if self.stored_published_post_count is not None:
+            return self.stored_published_post_count
+        return (await get_async_loaders(info).post_counts_by_author.load(self.id))[1]
+
+
+@strawberry.type(name="PostGType", description="GraphQL Post Type")
+class AsyncPostGType(PostGType):
+    @strawberry.field()
+    async def author(self, info: Info) -> AsyncUserGType:
+        """Post author."""
+        author = await get_async_loaders(info).user_by_id.load(self.author_id)
+        return convert_async_user_model(author)
+
+
+@strawberry.type(name="AuthPayloadGType")
+class AsyncAuthPayloadGType:
+    """Authentication response payload."""
+
+    access_token: str
+    user: AsyncUserGType
+    refresh_token: str | None = None
+
+
+@strawberry.type(name="BulkPostsPayloadGType")
+class AsyncBulkPostsPayloadGType:
+    """Posts created or updated by a bulk mutation, and the skipped items."""
+
+    posts: list[AsyncPostGType]
+    errors: list[BulkItemErrorGType]
+
+
+def convert_async_user_model(user_model) -> AsyncUserGType:
+    """Convert SQLAlchemy User model to the async GraphQL User type."""
+    return AsyncUserGType(**vars(convert_user_model(user_model)))
+
+
+def convert_async_post_model(post_model, columns=None) -> AsyncPostGType:
+    """Convert SQLAlchemy Post model to the async GraphQL Post type."""
+    return AsyncPostGType(**vars(convert_post_model(post_model, columns)))
+
+
+def convert_async_post_models(post_models, columns=None) -> list[AsyncPostGType]:
+    """Convert a list of posts; their authors and tags batch on first access."""
+    return [convert_async_post_model(post, columns) for post in post_models]
+
+
+async def require_user_id(info: Info) -> int:
+    """Return the id of the authenticated, active user or reject the operation.
+
+    The token only vouches for who the user was when it was issued, so the user
+    is loaded once per request and a deactivated account is rejected.
+    """
+    context = info.context
+    if "user" not in context:
+        context["user"] = await AsyncAuthService.get_user(context.get("user_id"))
+    if context["user"] is None:
+        raise Exception("Authentication required")
+    return context["user"].id
+
+
+@strawberry.type(name="QueryGType")
+class AsyncQueryGType:
+    """GraphQL queries."""
+
+    @strawberry.field()
+    def hello(self) -> str:
+        """Simple hello world query."""
+        return "Hello from GraphQL Blog API!"
+
+    @strawberry.field()
+    async def posts(
+        self, info: Info, published_only: bool = True, limit: int | None = None
+    ) -> list[AsyncPostGType]:
+        """Get all blog posts."""
+        columns = post_columns(info)
+        posts = await AsyncPostService.get_all_posts(
+            published_only=published_only, limit=limit, columns=columns
+        )
+        return convert_async_post_models(posts, columns)
+
+    @strawberry.field()
+    async def post(self, id: int, published_only: bool = True) -> AsyncPostGType | None:
+        """Get a single post by ID."""
+        post = await AsyncPostService.get_post_by_id(id, published_only=published_only)
+        return convert_async_post_model(post) if post else None
+
+    @strawberry.field()
+    async def post_by_slug(
+        self, slug: str, published_only: bool = True
+    ) -> AsyncPostGType | None:
+        """Get a single post by slug."""
+        post = await AsyncPostService.get_post_by_slug(
+            slug, published_only=published_only
+        )
+        return convert_async_post_model(post) if post else None
+
+    @strawberry.field()
+    async def posts_by_author(
+        self, info: Info, author_id: int, published_only: bool = True
+    ) -> list[AsyncPostGType]:
+        """Get posts by a specific author."""
+        columns = post_columns(info)
+        posts = await AsyncPostService.get_posts_by_author(
+            author_id, published_only=published_only, columns=columns
+        )
+        return convert_async_post_models(posts, columns)
+
+    @strawberry.field()
+    async def search_posts(
+        self, info: Info, search_term: str, published_only: bool = True
+    ) -> list[AsyncPostGType]:
+        """Search posts by title, content, or tags."""
+        columns = post_columns(info)
+        posts = await AsyncPostService.search_posts(
+            search_term, published_only=published_only, columns=columns
+        )
+        return convert_async_post_models(posts, columns)
+
+    @strawberry.field()
+    async def posts_by_tag(
+        self, info: Info, tag: str, published_only: bool = True
+    ) -> list[AsyncPostGType]:
+        """Get posts carrying a specific tag."""
+        columns = post_columns(info)
+        posts = await AsyncPostService.get_posts_by_tag(
+            tag, published_only=published_only, columns=columns
+        )
+        return convert_async_post_models(posts, columns)
+
+    @strawberry.field()
+    async def users(self) -> list[AsyncUserGType]:
+        """Get all users."""
+        async with async_session() as session:
+            users = await session.scalars(
+                db.select(UserModel).where(UserModel.is_active.is_(True))
+            )
+            return [convert_async_user_model(user) for user in users]
+
+    @strawberry.field()
+    async def user(self, id: int) -> AsyncUserGType | None:
+        """Get a single user by ID."""
+        user = await AsyncAuthService.get_user(id)
+        return convert_async_user_model(user) if user else None
+
+    @strawberry.field()
+    async def me(self, info: Info) -> AsyncUserGType | None:
+        """Get current authenticated user."""
+        current_user = await AsyncAuthService.get_user(info.context.get("user_id"))
+        return convert_async_user_model(current_user) if current_user else None
+
+
+@strawberry.type(name="MutationGType")
+class AsyncMutationGType:
+    """GraphQL mutations"""
+
+    @strawberry.mutation()
+    async def register(self, user_input: UserGInput) -> AsyncAuthPayloadGType:
+        """Register a new user."""
+        result = await AsyncAuthService.register_user(
+            username=user_input.username,
+            email=user_input.email,
+            password=user_input.password,
+            first_name=user_input.first_name,
+            last_name=user_input.last_name,
+            bio=user_input.bio,
+        )
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        # Generate access token for new user
+        auth_result = await AsyncAuthService.authenticate_user(
+            user_input.username, user_input.password
+        )
+
+        if auth_result["error"]:
+            raise Exception(auth_result["error"])
+
+        return AsyncAuthPayloadGType(
+            access_token=auth_result["token"],
+            refresh_token=auth_result["refresh_token"],
+            user=convert_async_user_model(auth_result["user"]),
+        )
+
+    @strawberry.mutation()
+    async def login(self, login_input: LoginGInput) -> AsyncAuthPayloadGType:
+        """Authenticate user and return access token."""
+        result = await AsyncAuthService.authenticate_user(
+            login_input.username, login_input.password
+        )
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return AsyncAuthPayloadGType(
+            access_token=result["token"],
+            refresh_token=result["refresh_token"],
+            user=convert_async_user_model(result["user"]),
+        )
+
+    @strawberry.mutation()
+    async def refresh_token(self, refresh_token: str) -> AsyncAuthPayloadGType:
+        """Exchange a refresh token for a new access and refresh token."""
+        result = await AsyncAuthService.refresh_tokens(refresh_token)
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return AsyncAuthPayloadGType(
+            access_token=result["token"],
+            refresh_token=result["refresh_token"],
+            user=convert_async_user_model(result["user"]),
+        )
+
+    @strawberry.mutation()
+    async def logout(
+        self, info: Info, refresh_token: str | None = None
+    ) -> MessageResponseGType:
+        """Revoke the current access token and optionally its refresh token."""
+        await require_user_id(info)
+        result = await AsyncAuthService.logout(
+            info.context["token_claims"], refresh_token
+        )
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return MessageResponseGType(message="Logged out")
+
+    @strawberry.mutation()
+    async def revoke_all_sessions(self, info: Info) -> MessageResponseGType:
+        """Revoke every access and refresh token of the current user."""
+        result = await AsyncAuthService.revoke_all_sessions(await require_user_id(info))
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return MessageResponseGType(message="All sessions revoked")
+
+    @strawberry.mutation()
+    async def create_post(self, info: Info, post_input: PostGInput) -> AsyncPostGType:
+        """Create a new blog post."""
+        result = await AsyncPostService.create_post(
+            title=post_input.title,
+            content=post_input.content,
+            author_id=await require_user_id(info),
+            excerpt=post_input.excerpt,
+            tags=post_input.tags,
+            is_published=post_input.is_published or False,
+        )
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return convert_async_post_model(result["post"])
+
+    @strawberry.mutation()
+    async def update_post(
+        self, info: Info, id: int, post_input: PostGInput
+    ) -> AsyncPostGType:
+        """Update an existing post."""
+        user_id = await require_user_id(info)
+
+        # Build update data
+        update_data = {}
+        if post_input.title:
+            update_data["title"] = post_input.title
+        if post_input.content:
+            update_data["content"] = post_input.content
+        if post_input.excerpt is not None:
+            update_data["excerpt"] = post_input.excerpt
+        if post_input.tags is not None:
+            update_data["tags"] = post_input.tags
+        if post_input.is_published is not None:
+            update_data["is_published"] = post_input.is_published
+
+        result = await AsyncPostService.update_post(id, user_id, **update_data)
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return convert_async_post_model(result["post"])
+
+    @strawberry.mutation()
+    async def delete_post(self, info: Info, id: int) -> MessageResponseGType:
+        """Delete a blog post."""
+        result = await AsyncPostService.delete_post(id, await require_user_id(info))
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return MessageResponseGType(message="Post deleted successfully")
+
+    @strawberry.mutation()
+    async def publish_post(self, info: Info, id: int) -> AsyncPostGType:
+        """Publish a blog post."""
+        result = await AsyncPostService.publish_post(id, await require_user_id(info))
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return convert_async_post_model(result["post"])
+
+    @strawberry.mutation()
+    async def create_posts(
+        self, info: Info, inputs: list[PostGInput]
+    ) -> AsyncBulkPostsPayloadGType:
+        """Create many posts in one transaction; invalid items are skipped."""
+        result = await AsyncPostService.create_posts(
+            [post_input_fields(post_input) for post_input in inputs],
+            await require_user_id(info),
+        )
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return AsyncBulkPostsPayloadGType(
+            posts=convert_async_post_models(result["posts"]),
+            errors=convert_bulk_errors(result["errors"]),
+        )
+
+    @strawberry.mutation()
+    async def publish_posts(
+        self, info: Info, ids: list[int]
+    ) -> AsyncBulkPostsPayloadGType:
+        """Publish many posts in one transaction; other users' posts are skipped."""
+        result = await AsyncPostService.publish_posts(ids, await require_user_id(info))
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return AsyncBulkPostsPayloadGType(
+            posts=convert_async_post_models(result["posts"]),
+            errors=convert_bulk_errors(result["errors"]),
+        )
+
+    @strawberry.mutation()
+    async def delete_posts(self, info: Info, ids: list[int]) -> BulkDeletePayloadGType:
+        """Delete many posts in one transaction; other users' posts are skipped."""
+        result = await AsyncPostService.delete_posts(ids, await require_user_id(info))
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return BulkDeletePayloadGType(
+            deleted_ids=result["deleted_ids"],
+            errors=convert_bulk_errors(result["errors"]),
+        )
+
+
+async_schema = strawberry.Schema(
+    query=AsyncQueryGType,
+    mutation=AsyncMutationGType,
+    extensions=schema_extensions(),
+)
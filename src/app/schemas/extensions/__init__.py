@@ -0,0 +1,23 @@
+# app/schemas/extensions/__init__.py
+from app.schemas.extensions.metrics import GraphQLMetrics
+from app.schemas.extensions.query_cost import QueryCostAnalysis, QueryCostLimiter
+from app.schemas.extensions.read_routing import ReadReplicaRouter
+from app.schemas.extensions.request_scope import (
+    RequestScopedExtension,
+    RequestScopedParserCache,
+    RequestScopedValidationCache,
+)
+from app.schemas.extensions.slow_operations import SlowOperationLog
+from app.schemas.extensions.sql_stats import SqlQueryStats
+
+__all__ = [
+    "GraphQLMetrics",
+    "QueryCostAnalysis",
+    "QueryCostLimiter",
+    "ReadReplicaRouter",
+    "RequestScopedExtension",
+    "RequestScopedParserCache",
+    "RequestScopedValidationCache",
+    "SlowOperationLog",
+    "SqlQueryStats",
+]
@@ -0,0 +1,90 @@
+# app/schemas/extensions/metrics.py
+"""Record GraphQL latencies and errors for the metrics endpoint."""
+
+import time
+from collections.abc import Iterator
+from inspect import isawaitable
+
+from strawberry.resolvers import is_default_resolver
+
+from app.metrics import (
+    operation_duration,
+    operation_errors,
+    operation_statements,
+    resolver_duration,
+    resolver_errors,
+)
+from app.schemas.extensions.request_scope import RequestScopedExtension
+
+ANONYMOUS_OPERATION = "(anonymous)"
+
+
+class GraphQLMetrics(RequestScopedExtension):
+    """Time every operation and every field with its own resolver.
+
+    Fields resolved by plain attribute access and introspection fields are not
+    timed, which keeps the per-field cost to a dictionary lookup.
+    """
+
+    def __init__(self, *, execution_context=None):
+        self.execution_context = execution_context
+        # "Type.field" label per field, None for fields left untimed
+        self._field_labels: dict[tuple[str, str], str | None] = {}
+
+    def on_operation(self) -> Iterator[None]:
+        started = time.perf_counter()
+        yield
+        duration = time.perf_counter() - started
+
+        execution_context = self.execution_context
+        operation = execution_context.operation_name or ANONYMOUS_OPERATION
+        operation_duration.observe(operation, duration)
+        if execution_context.errors:
+            operation_errors.inc(operation)
+
+        context = execution_context.context
+        stats = context.get("sql_stats") if isinstance(context, dict) else None
+        if stats is not None:
+            operation_statements.inc(operation, stats.count)
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        key = (info.parent_type.name, info.field_name)
+        try:
+            field = self._field_labels[key]
+        except KeyError:
+            field = self._field_labels[key] = self._field_label(info)
+        if field is None:
+            return _next(root, info, *args, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            resolver_errors.inc(field)
+            resolver_duration.observe(field, time.perf_counter() - started)
+            raise
+
+        if isawaitable(result):
+            return self._await_result(result, field, started)
+        resolver_duration.observe(field, time.perf_counter() - started)
+        return result
+
+    async def _await_result(self, result, field: str, started: float):
+        try:
+            return await result
+        except Exception:
+            resolver_errors.inc(field)
+            raise
+        finally:
+            resolver_duration.observe(field, time.perf_counter() - started)
+
+    @staticmethod
+    def _field_label(info) -> str | None:
+        type_name, field_name = info.parent_type.name, info.field_name
+        if type_name.startswith("__") or field_name.startswith("__"):
+            return None
+
+        field = info.parent_type.fields.get(field_name)
+        if field is None or field.resolve is None or is_default_resolver(field.resolve):
+            return None
+        return f"{type_name}.{field_name}"
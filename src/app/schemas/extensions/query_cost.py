@@ -0,0 +1,220 @@
+# app/schemas/extensions/query_cost.py
+"""Static cost, depth and alias analysis of GraphQL operations."""
+
+from collections.abc import Iterator
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    get_named_type,
+    get_nullable_type,
+    is_leaf_type,
+    is_list_type,
+)
+from graphql.execution.values import get_argument_values
+from strawberry.schema.schema import validate_document
+
+from app.schemas.extensions.request_scope import RequestScopedExtension
+
+# Arguments that bound how many items a list or connection field returns
+PAGE_SIZE_ARGUMENTS = ("first", "limit")
+
+
+class QueryCostAnalysis:
+    """Cost, depth and alias count of one operation."""
+
+    def __init__(
+        self,
+        schema,
+        document,
+        operation_name=None,
+        variables=None,
+        default_page_size=20,
+        max_page_size=100,
+        default_list_size=100,
+        field_costs=None,
+    ):
+        self.schema = schema
+        self.variables = variables or {}
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+        self.default_list_size = default_list_size
+        self.field_costs = field_costs or {}
+        self.fragments = {}
+        self.operation = None
+        self.cost = 0
+        self.depth = 0
+        self.aliases = 0
+
+        for definition in document.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                if operation_name is None or (
+                    definition.name and definition.name.value == operation_name
+                ):
+                    self.operation = self.operation or definition
+            else:
+                self.fragments[definition.name.value] = definition
+
+    def analyze(self) -> "QueryCostAnalysis":
+        """Walk the operation and compute its cost, depth and aliases."""
+        if self.operation is not None:
+            root_type = self.schema.get_root_type(self.operation.operation)
+            self.cost = self._measure(self.operation.selection_set, root_type, 1, 1)
+        return self
+
+    def _measure(self, selection_set, parent_type, multiplier, depth, sized=False):
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost += self._measure_field(
+                    selection, parent_type, multiplier, depth, sized
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments[selection.name.value]
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                cost += self._measure(
+                    fragment.selection_set, fragment_type, multiplier, depth, sized
+                )
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = (
+                    self.schema.get_type(selection.type_condition.name.value)
+                    if selection.type_condition
+                    else parent_type
+                )
+                cost += self._measure(
+                    selection.selection_set, fragment_type, multiplier, depth, sized
+                )
+        return cost
+
+    def _measure_field(self, node, parent_type, multiplier, depth, sized):
+        name = node.name.value
+        if name.startswith("__"):
+            # Introspection is bounded by the schema itself
+            return 0
+
+        if node.alias:
+            self.aliases += 1
+
+        self.depth = max(self.depth, depth)
+        field = parent_type.fields[name]
+        field_type = get_named_type(field.type)
+        if is_leaf_type(field_type):
+            return 0
+
+        size = self._page_size(node, field)
+        child_sized = size is not None
+        if size is None:
+            if is_list_type(get_nullable_type(field.type)):
+                # Edges of an already sized connection add no multiplier
+                size = 1 if sized else self.default_list_size
+            else:
+                size = 1
+
+        field_cost = self.field_costs.get(f"{parent_type.name}.{name}", 1)
+        return field_cost * multiplier + self._measure(
+            node.selection_set, field_type, multiplier * size, depth + 1, child_sized
+        )
+
+    def _page_size(self, node, field) -> int | None:
+        names = [name for name in PAGE_SIZE_ARGUMENTS if name in field.args]
+        if not names:
+            return None
+
+        arguments = get_argument_values(field, node, self.variables)
+        for name in names:
+            value = arguments.get(name)
+            if value is not None:
+                # Mirrors the services, which reject values below 1 and clamp
+                # the rest to the maximum page size
+                return min(max(value, 1), self.max_page_size)
+
+        # Unset `first` falls back to the default page size, unset `limit` is
+        # unbounded
+        return self.default_page_size if "first" in names else self.default_list_size
+
+
+class QueryCostLimiter(RequestScopedExtension):
+    """Reject operations over the depth, alias or cost budget before execution.
+
+    The computed cost is reported under ``extensions.cost`` of every response.
+    Must run after ``ValidationCache`` so only valid documents are measured.
+    """
+
+    def __init__(
+        self,
+        *,
+        execution_context=None,
+        max_depth: int = 10,
+        max_aliases: int = 30,
+        max_cost: int = 5000,
+        **analysis_options,
+    ):
+        self.execution_context = execution_context
+        self.max_depth = max_depth
+        self.max_aliases = max_aliases
+        self.max_cost = max_cost
+        self.analysis_options = analysis_options
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+
+        if execution_context.errors is None:
+            execution_context.errors = validate_document(
+                execution_context.schema._schema,
+                execution_context.graphql_document,
+                execution_context.validation_rules,
+            )
+
+        if not execution_context.errors:
+            analysis = QueryCostAnalysis(
+                execution_context.schema._schema,
+                execution_context.graphql_document,
+                operation_name=execution_context.operation_name,
+                variables=execution_context.variables,
+                **self.analysis_options,
+            ).analyze()
+            if isinstance(execution_context.context, dict):
+                execution_context.context["query_cost"] = analysis
+            execution_context.errors = self._check_budget(analysis)
+
+        yield
+
+    def _check_budget(self, analysis: QueryCostAnalysis) -> list[GraphQLError]:
+        errors = []
+        for limit, value, maximum in (
+            ("depth", analysis.depth, self.max_depth),
+            ("aliases", analysis.aliases, self.max_aliases),
+            ("cost", analysis.cost, self.max_cost),
+        ):
+            if value > maximum:
+                errors.append(
+                    GraphQLError(
+                        f"Operation {limit} of {value} exceeds the maximum of "
+                        f"{maximum}",
+                        extensions={
+                            "code": "QUERY_TOO_COMPLEX",
+                            "limit": limit,
+                            "value": value,
+                            "maximum": maximum,
+                        },
+                    )
+                )
+        return errors
+
+    def get_results(self) -> dict:
+        context = self.execution_context.context
+        analysis = context.get("query_cost") if isinstance(context, dict) else None
+        if analysis is None:
+            return {}
+
+        return {
+            "cost": {
+                "requested": analysis.cost,
+                "maximum": self.max_cost,
+                "depth": analysis.depth,
+                "aliases": analysis.aliases,
+            }
+        }
@@ -0,0 +1,28 @@
+# app/schemas/extensions/read_routing.py
+"""Route query operations to a read replica."""
+
+from collections.abc import Iterator
+
+from strawberry.types.graphql import OperationType
+
+from app.replicas import route_reads_to_primary, route_reads_to_replica
+from app.schemas.extensions.request_scope import RequestScopedExtension
+
+
+class ReadReplicaRouter(RequestScopedExtension):
+    """Read from a replica while a query operation executes.
+
+    Mutations keep every statement on the primary. Outside a Flask request
+    (the ASGI app, CLI) this does nothing.
+    """
+
+    def on_execute(self) -> Iterator[None]:
+        routed = (
+            self.execution_context.operation_type == OperationType.QUERY
+            and route_reads_to_replica() is not None
+        )
+        try:
+            yield
+        finally:
+            if routed:
+                route_reads_to_primary()
@@ -0,0 +1,34 @@
+# app/schemas/extensions/request_scope.py
+"""Per-request execution context for shared extension instances.
+
+Strawberry creates each schema extension once and assigns the current
+operation's ``execution_context`` to it before every execution. With several
+threads (or asyncio tasks) executing at once, an extension could otherwise
+read another operation's document or variables.
+"""
+
+from contextvars import ContextVar
+
+from strawberry.extensions import ParserCache, SchemaExtension, ValidationCache
+
+_execution_context = ContextVar("graphql_execution_context", default=None)
+
+
+class RequestScopedExtension(SchemaExtension):
+    """Keeps ``execution_context`` per thread and task instead of per instance."""
+
+    @property
+    def execution_context(self):
+        return _execution_context.get()
+
+    @execution_context.setter
+    def execution_context(self, value):
+        _execution_context.set(value)
+
+
+class RequestScopedParserCache(RequestScopedExtension, ParserCache):
+    """``ParserCache`` safe to share between concurrent operations."""
+
+
+class RequestScopedValidationCache(RequestScopedExtension, ValidationCache):
+    """``ValidationCache`` safe to share between concurrent operations."""
@@ -0,0 +1,89 @@
+# app/schemas/extensions/slow_operations.py
+"""Log GraphQL operations slower than a threshold."""
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+
+from app.schemas.extensions.request_scope import RequestScopedExtension
+
+logger = logging.getLogger(__name__)
+
+
+def variables_shape(value):
+    """Replace the values of GraphQL variables by their types.
+
+    Lists become ``[shape of the first item, length]``, so the log shows how
+    large an input was without recording what it contained.
+    """
+    if isinstance(value, dict):
+        return {key: variables_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [variables_shape(value[0]), len(value)] if value else []
+    if value is None:
+        return "null"
+    return type(value).__name__
+
+
+class SlowOperationLog(RequestScopedExtension):
+    """Log operations taking at least ``threshold_ms`` as one JSON record.
+
+    The record holds the operation name, the shape of its variables, its SQL
+    statement count and time, and the time spent parsing, validating and
+    executing. Profiled requests also carry their profile id.
+    """
+
+    def __init__(self, *, execution_context=None, threshold_ms: float = 1000):
+        self.execution_context = execution_context
+        self.threshold_ms = threshold_ms
+
+    def _timed(self, phase: str) -> Iterator[None]:
+        started = time.perf_counter()
+        yield
+        context = self.execution_context.context
+        if isinstance(context, dict):
+            context.setdefault("operation_timings", {})[phase] = (
+                time.perf_counter() - started
+            )
+
+    def on_parse(self) -> Iterator[None]:
+        yield from self._timed("parse")
+
+    def on_validate(self) -> Iterator[None]:
+        yield from self._timed("validate")
+
+    def on_execute(self) -> Iterator[None]:
+        yield from self._timed("execute")
+
+    def on_operation(self) -> Iterator[None]:
+        started = time.perf_counter()
+        yield
+        duration_ms = (time.perf_counter() - started) * 1000
+        if self.threshold_ms and duration_ms >= self.threshold_ms:
+            self._log(duration_ms)
+
+    def _log(self, duration_ms: float) -> None:
+        execution_context = self.execution_context
+        context = execution_context.context
+        if not isinstance(context, dict):
+            context = {}
+
+        timings = {
+            f"{phase}_ms": round(seconds * 1000, 3)
+            for phase, seconds in context.get("operation_timings", {}).items()
+        }
+        stats = context.get("sql_stats")
+        if stats is not None:
+            timings["sql_ms"] = round(stats.duration * 1000, 3)
+
+        record = {
+            "operation": execution_context.operation_name,
+            "duration_ms": round(duration_ms, 3),
+            "variables": variables_shape(execution_context.variables or {}),
+            "sql_queries": stats.count if stats is not None else None,
+            "timings": timings,
+            "errors": len(execution_context.errors or ()),
+            "profile_id": context.get("profile_id"),
+        }
+        logger.warning("Slow GraphQL operation: %s", json.dumps(record))
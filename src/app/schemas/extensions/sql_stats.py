@@ -0,0 +1,72 @@
+# app/schemas/extensions/sql_stats.py
+"""Report the SQL each GraphQL operation runs."""
+
+import logging
+from collections.abc import Iterator
+
+from flask import current_app, has_app_context
+
+from app.schemas.extensions.request_scope import RequestScopedExtension
+from app.sql_stats import collect_sql
+
+logger = logging.getLogger(__name__)
+
+
+class SqlQueryStats(RequestScopedExtension):
+    """Count statements, database time and repeated statements per operation.
+
+    In debug mode (or with ``GRAPHQL_SQL_STATS_IN_RESPONSE``) they are returned
+    under ``extensions.sql``. Operations running at least ``log_min_queries``
+    statements, spending ``log_min_duration_ms`` in the database, or repeating
+    one statement shape ``log_repeated`` times are logged as warnings.
+    """
+
+    def __init__(
+        self,
+        *,
+        execution_context=None,
+        log_min_queries: int = 50,
+        log_min_duration_ms: float = 500,
+        log_repeated: int = 10,
+    ):
+        self.execution_context = execution_context
+        self.log_min_queries = log_min_queries
+        self.log_min_duration_ms = log_min_duration_ms
+        self.log_repeated = log_repeated
+
+    def on_operation(self) -> Iterator[None]:
+        with collect_sql() as stats:
+            context = self.execution_context.context
+            if isinstance(context, dict):
+                context["sql_stats"] = stats
+            yield
+        self._log_if_expensive(stats)
+
+    def _log_if_expensive(self, stats) -> None:
+        repeated = stats.repeated(self.log_repeated)
+        if (
+            stats.count < self.log_min_queries
+            and stats.duration * 1000 < self.log_min_duration_ms
+            and not repeated
+        ):
+            return
+
+        logger.warning(
+            "GraphQL operation %s ran %d SQL statements in %.1f ms%s",
+            self.execution_context.operation_name or "(anonymous)",
+            stats.count,
+            stats.duration * 1000,
+            "".join(f"\n  {count}x {shape}" for shape, count in repeated),
+        )
+
+    def get_results(self) -> dict:
+        if not has_app_context() or not (
+            current_app.debug or current_app.config["GRAPHQL_SQL_STATS_IN_RESPONSE"]
+        ):
+            return {}
+
+        context = self.execution_context.context
+        stats = context.get("sql_stats") if isinstance(context, dict) else None
+        if stats is None:
+            return {}
+        return {"sql": stats.as_dict()}
@@ -0,0 +1,103 @@
+# app/schemas/loaders.py
+"""Request-scoped batch loaders for GraphQL resolvers."""
+
+from collections.abc import Callable, Hashable, Iterable
+
+from app.extensions import db
+from app.models import PostModel, UserModel
+
+
+class BatchLoader:
+    """Synchronous DataLoader that resolves queued keys with a single query.
+
+    List resolvers queue every key their items will need; the first ``load``
+    call then fetches all pending keys at once and caches the results for the
+    rest of the request.
+    """
+
+    def __init__(self, batch_fn: Callable[[list], dict]):
+        self.batch_fn = batch_fn
+        self._cache: dict = {}
+        self._pending: set = set()
+
+    def queue(self, keys: Iterable[Hashable]) -> None:
+        """Register keys to be fetched with the next batch."""
+        self._pending.update(key for key in keys if key not in self._cache)
+
+    def load(self, key: Hashable):
+        """Return the value for key, fetching pending keys in one batch."""
+        if key not in self._cache:
+            self._pending.add(key)
+            self._dispatch()
+        return self._cache.get(key)
+
+    def load_many(self, keys: Iterable[Hashable]) -> list:
+        """Return values for several keys, fetching them in one batch."""
+        keys = list(keys)
+        self.queue(keys)
+        self._dispatch()
+        return [self._cache.get(key) for key in keys]
+
+    def prime(self, key: Hashable, value) -> None:
+        """Seed the cache with an already loaded value."""
+        self._cache.setdefault(key, value)
+        self._pending.discard(key)
+
+    def clear(self, key: Hashable) -> None:
+        """Drop a cached value so the next load fetches it again."""
+        self._cache.pop(key, None)
+
+    def _dispatch(self) -> None:
+        if not self._pending:
+            return
+
+        keys = sorted(self._pending)
+        self._pending.clear()
+        results = self.batch_fn(keys)
+        for key in keys:
+            self._cache[key] = results.get(key)
+
+
+def load_users(user_ids: list[int]) -> dict[int, UserModel]:
+    """Load users by id with a single ``WHERE id IN (...)`` query."""
+    users = UserModel.query.filter(UserModel.id.in_(user_ids)).all()
+    return {user.id: user for user in users}
+
+
+def load_post_counts(author_ids: list[int]) -> dict[int, tuple[int, int]]:
+    """Count total and published posts per author with one GROUP BY query."""
+    rows = db.session.execute(
+        db.select(
+            PostModel.author_id,
+            db.func.count(PostModel.id),
+            db.func.count(PostModel.id).filter(PostModel.is_published.is_(True)),
+        )
+        .where(PostModel.author_id.in_(author_ids))
+        .group_by(PostModel.author_id)
+    )
+    return {author_id: (total, published) for author_id, total, published in rows}
+
+
+class Loaders:
+    """Container for the loaders available to a single GraphQL request."""
+
+    def __init__(self):
+        self.user_by_id = BatchLoader(self._load_users)
+        self.post_counts_by_author = BatchLoader(load_post_counts)
+
+    def _load_users(self, user_ids: list[int]) -> dict[int, UserModel]:
+        users = load_users(user_ids)
+        # Authors without filled counters will need the aggregate fallback
+        self.post_counts_by_author.queue(
+            user.id for user in users.values() if user.post_count is None
+        )
+        return users
+
+
+def get_loaders(info) -> Loaders:
+    """Return the request loaders, creating them if the context has none."""
+    context = info.context
+    loaders = context.get("loaders")
+    if loaders is None:
+        loaders = context["loaders"] = Loaders()
+    return loaders
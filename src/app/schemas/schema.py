@@ -1,24 +1,68 @@
 # app/schemas/schema.py
 import strawberry
-from flask_jwt_extended import jwt_required
 from strawberry.types import Info
 
+from app.config import Config
+from app.http_cache import record_collection
+from app.identity import UserSnapshot
 from app.models import UserModel
+from app.schemas.extensions import (
+    GraphQLMetrics,
+    QueryCostLimiter,
+    ReadReplicaRouter,
+    RequestScopedParserCache,
+    RequestScopedValidationCache,
+    SlowOperationLog,
+    SqlQueryStats,
+)
+from app.schemas.selection import post_columns
 from app.schemas.types import (
     AuthPayloadGType,
+    BulkDeletePayloadGType,
+    BulkPostsPayloadGType,
     LoginGInput,
     MessageResponseGType,
+    PostConnectionGType,
     PostGInput,
     PostGType,
+    SearchConnectionGType,
+    TagGType,
+    UserConnectionGType,
     UserGInput,
     UserGType,
+    convert_bulk_errors,
     convert_post_model,
+    convert_post_models,
+    convert_post_page,
+    convert_search_page,
     convert_user_model,
+    convert_user_models,
+    convert_user_page,
 )
 from app.services.auth_service import AuthService
+from app.services.pagination import keyset_paginate
 from app.services.post_service import PostService
 
 
+def require_user(info: Info) -> UserSnapshot:
+    """Return the authenticated, active user or reject the operation."""
+    user = info.context["identity"].user
+    if user is None:
+        raise Exception("Authentication required")
+    return user
+
+
+def post_input_fields(post_input: PostGInput) -> dict:
+    """Fields of a new post from its GraphQL input."""
+    return {
+        "title": post_input.title,
+        "content": post_input.content,
+        "excerpt": post_input.excerpt,
+        "tags": post_input.tags,
+        "is_published": post_input.is_published or False,
+    }
+
+
 @strawberry.type
 class QueryGType:
     """GraphQL queries."""
@@ -30,11 +74,29 @@ class QueryGType:
 
     @strawberry.field()
     def posts(
-        self, published_only: bool = True, limit: int | None = None
+        self, info: Info, published_only: bool = True, limit: int | None = None
     ) -> list[PostGType]:
         """Get all blog posts."""
-        posts = PostService.get_all_posts(published_only=published_only, limit=limit)
-        return [convert_post_model(post) for post in posts]
+        columns = post_columns(info)
+        posts = PostService.get_all_posts(
+            published_only=published_only, limit=limit, columns=columns
+        )
+        return convert_post_models(posts, info, columns)
+
+    @strawberry.field()
+    def posts_connection(
+        self,
+        info: Info,
+        published_only: bool = True,
+        first: int | None = None,
+        after: str | None = None,
+    ) -> PostConnectionGType:
+        """Get a page of blog posts using cursor pagination."""
+        columns = post_columns(info, ("edges", "node"))
+        page = PostService.get_posts_page(
+            published_only=published_only, first=first, after=after, columns=columns
+        )
+        return convert_post_page(page, info, columns)
 
     @strawberry.field()
     def post(self, id: int, published_only: bool = True) -> PostGType | None:
@@ -50,27 +112,105 @@ class QueryGType:
 
     @strawberry.field()
     def posts_by_author(
-        self, author_id: int, published_only: bool = True
+        self, info: Info, author_id: int, published_only: bool = True
     ) -> list[PostGType]:
         """Get posts by a specific author."""
+        columns = post_columns(info)
         posts = PostService.get_posts_by_author(
-            author_id, published_only=published_only
+            author_id, published_only=published_only, columns=columns
+        )
+        return convert_post_models(posts, info, columns)
+
+    @strawberry.field()
+    def posts_by_author_connection(
+        self,
+        info: Info,
+        author_id: int,
+        published_only: bool = True,
+        first: int | None = None,
+        after: str | None = None,
+    ) -> PostConnectionGType:
+        """Get a page of posts by a specific author using cursor pagination."""
+        columns = post_columns(info, ("edges", "node"))
+        page = PostService.get_posts_by_author_page(
+            author_id,
+            published_only=published_only,
+            first=first,
+            after=after,
+            columns=columns,
         )
-        return [convert_post_model(post) for post in posts]
+        return convert_post_page(page, info, columns)
 
     @strawberry.field()
     def search_posts(
-        self, search_term: str, published_only: bool = True
+        self, info: Info, search_term: str, published_only: bool = True
     ) -> list[PostGType]:
         """Search posts by title, content, or tags."""
-        posts = PostService.search_posts(search_term, published_only=published_only)
-        return [convert_post_model(post) for post in posts]
+        columns = post_columns(info)
+        posts = PostService.search_posts(
+            search_term, published_only=published_only, columns=columns
+        )
+        return convert_post_models(posts, info, columns)
+
+    @strawberry.field()
+    def search_posts_connection(
+        self,
+        info: Info,
+        search_term: str,
+        published_only: bool = True,
+        first: int | None = None,
+        after: str | None = None,
+    ) -> SearchConnectionGType:
+        """Search posts ranked by relevance, with highlighted snippets."""
+        columns = post_columns(info, ("edges", "node"))
+        page = PostService.search_posts_page(
+            search_term,
+            published_only=published_only,
+            first=first,
+            after=after,
+            columns=columns,
+        )
+        return convert_search_page(page, info, columns)
+
+    @strawberry.field()
+    def posts_by_tag(
+        self, info: Info, tag: str, published_only: bool = True
+    ) -> list[PostGType]:
+        """Get posts carrying a specific tag."""
+        columns = post_columns(info)
+        posts = PostService.get_posts_by_tag(
+            tag, published_only=published_only, columns=columns
+        )
+        return convert_post_models(posts, info, columns)
 
     @strawberry.field()
-    def users(self) -> list[UserGType]:
+    def tags(self, published_only: bool = True) -> list[TagGType]:
+        """Get all tags with their post counts."""
+        record_collection("posts")
+        return [
+            TagGType(name=name, post_count=post_count)
+            for name, post_count in PostService.get_tags(published_only=published_only)
+        ]
+
+    @strawberry.field()
+    def users(self, info: Info) -> list[UserGType]:
         """Get all users."""
         users = UserModel.query.filter_by(is_active=True).all()
-        return [convert_user_model(user) for user in users]
+        return convert_user_models(users, info)
+
+    @strawberry.field()
+    def users_connection(
+        self, info: Info, first: int | None = None, after: str | None = None
+    ) -> UserConnectionGType:
+        """Get a page of users using cursor pagination."""
+        page = keyset_paginate(
+            UserModel.query.filter_by(is_active=True),
+            UserModel.created_at,
+            UserModel.id,
+            first,
+            after,
+        )
+        return convert_user_page(page, info)
 
     @strawberry.field()
     def user(self, id: int) -> UserGType | None:
@@ -113,6 +253,7 @@ class MutationGType:
 
         return AuthPayloadGType(
             access_token=auth_result["token"],
+            refresh_token=auth_result["refresh_token"],
             user=convert_user_model(auth_result["user"]),
         )
 
@@ -128,16 +269,51 @@ class MutationGType:
 
         return AuthPayloadGType(
             access_token=result["token"],
+            refresh_token=result["refresh_token"],
             user=convert_user_model(result["user"]),
         )
 
     @strawberry.mutation()
-    @jwt_required()
-    def create_post(self, post_input: PostGInput) -> PostGType:
+    def refresh_token(self, refresh_token: str) -> AuthPayloadGType:
+        """Exchange a refresh token for a new access and refresh token."""
+        result = AuthService.refresh_tokens(refresh_token)
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return AuthPayloadGType(
+            access_token=result["token"],
+            refresh_token=result["refresh_token"],
+            user=convert_user_model(result["user"]),
+        )
+
+    @strawberry.mutation()
+    def logout(
+        self, info: Info, refresh_token: str | None = None
+    ) -> MessageResponseGType:
+        """Revoke the current access token and optionally its refresh token."""
+        require_user(info)
+        result = AuthService.logout(info.context["identity"].claims, refresh_token)
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return MessageResponseGType(message="Logged out")
+
+    @strawberry.mutation()
+    def revoke_all_sessions(self, info: Info) -> MessageResponseGType:
+        """Revoke every access and refresh token of the current user."""
+        result = AuthService.revoke_all_sessions(require_user(info).id)
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return MessageResponseGType(message="All sessions revoked")
+
+    @strawberry.mutation()
+    def create_post(self, info: Info, post_input: PostGInput) -> PostGType:
         """Create a new blog post."""
-        current_user = AuthService.get_current_user()
-        if not current_user:
-            raise Exception("Authentication required")
+        current_user = require_user(info)
 
         result = PostService.create_post(
             title=post_input.title,
@@ -154,12 +330,9 @@ class MutationGType:
         return convert_post_model(result["post"])
 
     @strawberry.mutation()
-    @jwt_required()
-    def update_post(self, id: int, post_input: PostGInput) -> PostGType:
+    def update_post(self, info: Info, id: int, post_input: PostGInput) -> PostGType:
         """Update an existing post."""
-        current_user = AuthService.get_current_user()
-        if not current_user:
-            raise Exception("Authentication required")
+        current_user = require_user(info)
 
         # Build update data
         update_data = {}
@@ -182,12 +355,9 @@ class MutationGType:
         return convert_post_model(result["post"])
 
     @strawberry.mutation()
-    @jwt_required()
-    def delete_post(self, id: int) -> MessageResponseGType:
+    def delete_post(self, info: Info, id: int) -> MessageResponseGType:
         """Delete a blog post."""
-        current_user = AuthService.get_current_user()
-        if not current_user:
-            raise Exception("Authentication required")
+        current_user = require_user(info)
 
         result = PostService.delete_post(id, current_user.id)
 
@@ -197,12 +367,9 @@ class MutationGType:
         return MessageResponseGType(message="Post deleted successfully")
 
     @strawberry.mutation()
-    @jwt_required()
-    def publish_post(self, id: int) -> PostGType:
+    def publish_post(self, info: Info, id: int) -> PostGType:
         """Publish a blog post."""
-        current_user = AuthService.get_current_user()
-        if not current_user:
-            raise Exception("Authentication required")
+        current_user = require_user(info)
 
         result = PostService.publish_post(id, current_user.id)
 
@@ -211,6 +378,93 @@ class MutationGType:
 
         return convert_post_model(result["post"])
 
+    @strawberry.mutation()
+    def create_posts(
+        self, info: Info, inputs: list[PostGInput]
+    ) -> BulkPostsPayloadGType:
+        """Create many posts in one transaction; invalid items are skipped."""
+        current_user = require_user(info)
+
+        result = PostService.create_posts(
+            [post_input_fields(post_input) for post_input in inputs], current_user.id
+        )
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return BulkPostsPayloadGType(
+            posts=convert_post_models(result["posts"], info),
+            errors=convert_bulk_errors(result["errors"]),
+        )
+
+    @strawberry.mutation()
+    def publish_posts(self, info: Info, ids: list[int]) -> BulkPostsPayloadGType:
+        """Publish many posts in one transaction; other users' posts are skipped."""
+        current_user = require_user(info)
+
+        result = PostService.publish_posts(ids, current_user.id)
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return BulkPostsPayloadGType(
+            posts=convert_post_models(result["posts"], info),
+            errors=convert_bulk_errors(result["errors"]),
+        )
+
+    @strawberry.mutation()
+    def delete_posts(self, info: Info, ids: list[int]) -> BulkDeletePayloadGType:
+        """Delete many posts in one transaction; other users' posts are skipped."""
+        current_user = require_user(info)
+
+        result = PostService.delete_posts(ids, current_user.id)
+
+        if result["error"]:
+            raise Exception(result["error"])
+
+        return BulkDeletePayloadGType(
+            deleted_ids=result["deleted_ids"],
+            errors=convert_bulk_errors(result["errors"]),
+        )
+
+
+def schema_extensions() -> list:
+    """Extensions shared by the sync and async schemas.
+
+    Operations and resolvers are timed for the metrics endpoint, slow
+    operations are logged, the SQL of every operation is measured, repeated
+    operations skip parsing and validation, over-budget ones are rejected
+    before execution, and queries read from a replica when configured.
+    """
+    extensions = [GraphQLMetrics()] if Config.METRICS_ENABLED else []
+    return extensions + [
+        SlowOperationLog(threshold_ms=Config.GRAPHQL_SLOW_OPERATION_MS),
+        SqlQueryStats(
+            log_min_queries=Config.GRAPHQL_SQL_LOG_MIN_QUERIES,
+            log_min_duration_ms=Config.GRAPHQL_SQL_LOG_MIN_DURATION_MS,
+            log_repeated=Config.GRAPHQL_SQL_LOG_REPEATED,
+        ),
+        RequestScopedParserCache(maxsize=Config.GRAPHQL_DOCUMENT_CACHE_SIZE),
+        RequestScopedValidationCache(maxsize=Config.GRAPHQL_DOCUMENT_CACHE_SIZE),
+        QueryCostLimiter(
+            max_depth=Config.GRAPHQL_MAX_DEPTH,
+            max_aliases=Config.GRAPHQL_MAX_ALIASES,
+            max_cost=Config.GRAPHQL_MAX_COST,
+            default_page_size=Config.GRAPHQL_DEFAULT_PAGE_SIZE,
+            max_page_size=Config.GRAPHQL_MAX_PAGE_SIZE,
+            default_list_size=Config.GRAPHQL_DEFAULT_LIST_SIZE,
+            field_costs={
+                "QueryGType.searchPosts": 10,
+                "QueryGType.searchPostsConnection": 10,
+            },
+        ),
+        ReadReplicaRouter(),
+    ]
+
 
 # Create the schema
-schema = strawberry.Schema(query=QueryGType, mutation=MutationGType)
+schema = strawberry.Schema(
+    query=QueryGType,
+    mutation=MutationGType,
+    extensions=schema_extensions(),
+)
@@ -0,0 +1,76 @@
+# app/schemas/selection.py
+"""Columns a GraphQL selection reads, so list queries load only those.
+
+A list of post titles should not pull every post body from the database;
+resolvers pass ``post_columns(info)`` to the services, which restrict their
+queries with ``load_only``, and to the converters, which leave unselected
+fields empty instead of lazily loading them row by row.
+"""
+
+from collections.abc import Iterable, Iterator
+
+from strawberry.types import Info
+from strawberry.types.nodes import SelectedField, Selection
+from strawberry.utils.str_converters import to_snake_case
+
+# Post columns read by each PostGType field
+POST_FIELD_COLUMNS = {
+    "id": ("id",),
+    "title": ("title",),
+    "content": ("content",),
+    "content_html": ("content_html",),
+    "excerpt": ("excerpt",),
+    "slug": ("slug",),
+    "is_published": ("is_published",),
+    "published_at": ("published_at",),
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+    "author_id": ("author_id",),
+    "author": ("author_id",),
+    "tag_list": ("tags",),
+}
+
+# Columns every converted post needs: its identity and HTTP cache validator
+POST_BASE_COLUMNS = ("id", "updated_at")
+
+
+def _fields(selections: Iterable[Selection]) -> Iterator[SelectedField]:
+    """Selected fields, with those of fragments inlined."""
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            yield selection
+        else:
+            yield from _fields(selection.selections)
+
+
+def selected_fields(info: Info, path: Iterable[str] = ()) -> set[str]:
+    """Python names of the fields selected at ``path`` below the current field.
+
+    ``path`` lists GraphQL field names, e.g. ``("edges", "node")`` for the
+    nodes of a connection.
+    """
+    fields = list(_fields(info.selected_fields))
+    for name in path:
+        fields = [
+            child
+            for field in fields
+            for child in _fields(field.selections)
+            if child.name == name
+        ]
+    return {
+        to_snake_case(child.name)
+        for field in fields
+        for child in _fields(field.selections)
+        if not child.name.startswith("__")
+    }
+
+
+def post_columns(info: Info, path: Iterable[str] = ()) -> frozenset[str] | None:
+    """Post columns the selection at ``path`` reads; None to load every column."""
+    columns = set(POST_BASE_COLUMNS)
+    for field in selected_fields(info, path):
+        if field not in POST_FIELD_COLUMNS:
+            # A field this mapping does not know may read any column
+            return None
+        columns.update(POST_FIELD_COLUMNS[field])
+    return frozenset(columns)
@@ -4,7 +4,9 @@ from datetime import datetime
 import strawberry
 from strawberry.types import Info
 
-from app.models import PostModel, UserModel
+from app.http_cache import record_collection, record_entity
+from app.models import PostModel
+from app.schemas.loaders import get_loaders
 
 
 @strawberry.type
@@ -19,6 +21,8 @@ class UserGType:
     bio: str | None = None
     is_active: bool
     created_at: datetime
+    stored_post_count: strawberry.Private[int | None] = None
+    stored_published_post_count: strawberry.Private[int | None] = None
 
     @strawberry.field()
     def full_name(self) -> str:
@@ -32,7 +36,21 @@ class UserGType:
     @strawberry.field()
     def post_count(self, info: Info) -> int:
         """Number of posts by this user"""
-        return PostModel.query.filter_by(author_id=self.id).count()
+        if self.stored_post_count is not None:
+            return self.stored_post_count
+        return self._aggregated_counts(info)[0]
+
+    @strawberry.field()
+    def published_post_count(self, info: Info) -> int:
+        """Number of published posts by this user"""
+        if self.stored_published_post_count is not None:
+            return self.stored_published_post_count
+        return self._aggregated_counts(info)[1]
+
+    def _aggregated_counts(self, info: Info) -> tuple[int, int]:
+        """Fall back to the batched GROUP BY loader for unfilled counters."""
+        counts = get_loaders(info).post_counts_by_author.load(self.id)
+        return counts or (0, 0)
 
 
 @strawberry.type
@@ -42,6 +60,7 @@ class PostGType:
     id: int
     title: str
     content: str
+    content_html: str | None = None
     excerpt: str | None = None
     slug: str | None = None
     is_published: bool
@@ -49,27 +68,87 @@ class PostGType:
     created_at: datetime
     updated_at: datetime
     author_id: int
+    tags: strawberry.Private[str | None] = None
 
     @strawberry.field()
     def author(self, info: Info) -> UserGType:
         """Post author."""
-        author = UserModel.query.get(self.author_id)
-        return UserGType(
-            id=author.id,
-            username=author.username,
-            email=author.email,
-            first_name=author.first_name,
-            last_name=author.last_name,
-            bio=author.bio,
-            is_active=author.is_active,
-            created_at=author.created_at,
-        )
+        author = get_loaders(info).user_by_id.load(self.author_id)
+        return convert_user_model(author)
 
     @strawberry.field()
     def tag_list(self) -> list[str]:
-        """Post tags as a list."""
-        post = PostModel.query.get(self.id)
-        return post.tag_list if post else []
+        """Post tags as a list, as written."""
+        return PostModel.split_tags(self.tags)
+
+
+@strawberry.type
+class TagGType:
+    """GraphQL Tag Type"""
+
+    name: str
+    post_count: int
+
+
+@strawberry.type
+class PageInfoGType:
+    """Relay pagination info."""
+
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: str | None = None
+    end_cursor: str | None = None
+
+
+@strawberry.type
+class PostEdgeGType:
+    """Post with its pagination cursor."""
+
+    node: PostGType
+    cursor: str
+
+
+@strawberry.type
+class PostConnectionGType:
+    """Relay connection of posts."""
+
+    edges: list[PostEdgeGType]
+    page_info: PageInfoGType
+
+
+@strawberry.type
+class SearchEdgeGType:
+    """Ranked search match with its cursor and highlighted fragments."""
+
+    node: PostGType
+    cursor: str
+    relevance: float
+    title_highlight: str | None = None
+    snippet: str | None = None
+
+
+@strawberry.type
+class SearchConnectionGType:
+    """Relay connection of ranked search matches."""
+
+    edges: list[SearchEdgeGType]
+    page_info: PageInfoGType
+
+
+@strawberry.type
+class UserEdgeGType:
+    """User with its pagination cursor."""
+
+    node: UserGType
+    cursor: str
+
+
+@strawberry.type
+class UserConnectionGType:
+    """Relay connection of users."""
+
+    edges: list[UserEdgeGType]
+    page_info: PageInfoGType
 
 
 @strawberry.input
@@ -109,6 +188,7 @@ class AuthPayloadGType:
 
     access_token: str
     user: UserGType
+    refresh_token: str | None = None
 
 
 @strawberry.type
@@ -119,8 +199,34 @@ class MessageResponseGType:
     success: bool = True
 
 
+@strawberry.type
+class BulkItemErrorGType:
+    """Why one item of a bulk mutation was skipped."""
+
+    index: int  # Position in the mutation input
+    id: int | None
+    message: str
+
+
+@strawberry.type
+class BulkPostsPayloadGType:
+    """Posts created or updated by a bulk mutation, and the skipped items."""
+
+    posts: list[PostGType]
+    errors: list[BulkItemErrorGType]
+
+
+@strawberry.type
+class BulkDeletePayloadGType:
+    """Ids deleted by a bulk mutation, and the skipped items."""
+
+    deleted_ids: list[int]
+    errors: list[BulkItemErrorGType]
+
+
 def convert_user_model(user_model) -> UserGType:
     """Convert SQLAlchemy User model to GraphQL User type."""
+    record_entity("user", user_model.id, user_model.updated_at)
     return UserGType(
         id=user_model.id,
         username=user_model.username,
@@ -130,20 +236,113 @@ def convert_user_model(user_model) -> UserGType:
         bio=user_model.bio,
         is_active=user_model.is_active,
         created_at=user_model.created_at,
+        stored_post_count=user_model.post_count,
+        stored_published_post_count=user_model.published_post_count,
     )
 
 
-def convert_post_model(post_model) -> PostGType:
-    """Convert SQLAlchemy Post model to GraphQL Post type."""
+def convert_user_models(user_models, info: Info) -> list[UserGType]:
+    """Convert a list of users, queueing unfilled post counters for one batch."""
+    record_collection("users")
+    get_loaders(info).post_counts_by_author.queue(
+        {
+            user.id
+            for user in user_models
+            if user.post_count is None or user.published_post_count is None
+        }
+    )
+    return [convert_user_model(user) for user in user_models]
+
+
+def convert_post_model(post_model, columns=None) -> PostGType:
+    """Convert SQLAlchemy Post model to GraphQL Post type.
+
+    With ``columns`` (see ``app.schemas.selection``) only those are read; the
+    query did not load the others, so they are left empty rather than loaded
+    one row at a time.
+    """
+
+    def column(name):
+        return getattr(post_model, name) if columns is None or name in columns else None
+
+    record_entity("post", post_model.id, post_model.updated_at)
     return PostGType(
         id=post_model.id,
-        title=post_model.title,
-        content=post_model.content,
-        excerpt=post_model.excerpt,
-        slug=post_model.slug,
-        is_published=post_model.is_published,
-        published_at=post_model.published_at,
-        created_at=post_model.created_at,
+        title=column("title"),
+        content=column("content"),
+        content_html=column("content_html"),
+        excerpt=column("excerpt"),
+        slug=column("slug"),
+        is_published=column("is_published"),
+        published_at=column("published_at"),
+        created_at=column("created_at"),
         updated_at=post_model.updated_at,
-        author_id=post_model.author_id,
+        author_id=column("author_id"),
+        tags=column("tags"),
+    )
+
+
+def convert_post_models(post_models, info: Info, columns=None) -> list[PostGType]:
+    """Convert a list of posts, queueing their authors for a single batch load."""
+    record_collection("posts")
+    loaders = get_loaders(info)
+    if columns is None or "author_id" in columns:
+        loaders.user_by_id.queue({post.author_id for post in post_models})
+    return [convert_post_model(post, columns) for post in post_models]
+
+
+def convert_bulk_errors(errors) -> list[BulkItemErrorGType]:
+    """Convert the per-item errors of a bulk service call."""
+    return [BulkItemErrorGType(**error) for error in errors]
+
+
+def convert_page_info(page) -> PageInfoGType:
+    """Convert a keyset Page to Relay page info."""
+    return PageInfoGType(
+        has_next_page=page.has_next_page,
+        has_previous_page=page.has_previous_page,
+        start_cursor=page.cursors[0] if page.cursors else None,
+        end_cursor=page.cursors[-1] if page.cursors else None,
+    )
+
+
+def convert_post_page(page, info: Info, columns=None) -> PostConnectionGType:
+    """Convert a keyset Page of posts to a Relay connection."""
+    nodes = convert_post_models(page.items, info, columns)
+    return PostConnectionGType(
+        edges=[
+            PostEdgeGType(node=node, cursor=cursor)
+            for node, cursor in zip(nodes, page.cursors, strict=True)
+        ],
+        page_info=convert_page_info(page),
+    )
+
+
+def convert_search_page(page, info: Info, columns=None) -> SearchConnectionGType:
+    """Convert a keyset Page of search hits to a Relay connection."""
+    nodes = convert_post_models([hit.post for hit in page.items], info, columns)
+    return SearchConnectionGType(
+        edges=[
+            SearchEdgeGType(
+                node=node,
+                cursor=cursor,
+                relevance=-hit.score,
+                title_highlight=hit.title_highlight,
+                snippet=hit.snippet,
+            )
+            for node, hit, cursor in zip(nodes, page.items, page.cursors, strict=True)
+        ],
+        page_info=convert_page_info(page),
+    )
+
+
+def convert_user_page(page, info: Info) -> UserConnectionGType:
+    """Convert a keyset Page of users to a Relay connection."""
+    nodes = convert_user_models(page.items, info)
+    return UserConnectionGType(
+        edges=[
+            UserEdgeGType(node=node, cursor=cursor)
+            for node, cursor in zip(nodes, page.cursors, strict=True)
+        ],
+        page_info=convert_page_info(page),
     )
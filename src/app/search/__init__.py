@@ -0,0 +1,67 @@
+# app/search/__init__.py
+"""Pluggable full-text search for blog posts."""
+
+from flask import current_app
+
+from app.extensions import db
+from app.search.backends import (
+    LikeSearchBackend,
+    PostgresFTSBackend,
+    SearchBackend,
+    SearchHit,
+    SQLiteFTSBackend,
+)
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (LikeSearchBackend, SQLiteFTSBackend, PostgresFTSBackend)
+}
+
+
+def select_backend(engine, name: str = "auto") -> SearchBackend:
+    """Pick the configured backend, or the native one for the database."""
+    if name != "auto":
+        return BACKENDS[name]()
+
+    if engine.dialect.name == "postgresql":
+        return PostgresFTSBackend()
+
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as connection:
+            if SQLiteFTSBackend.is_available(connection):
+                return SQLiteFTSBackend()
+
+    return LikeSearchBackend()
+
+
+def init_search(app):
+    """Select the search backend and install its index structures if cheap."""
+    with app.app_context():
+        backend = select_backend(db.engine, app.config["SEARCH_BACKEND"])
+        if backend.install_at_startup:
+            install_search(backend)
+
+    app.extensions["search_backend"] = backend
+
+
+def install_search(backend: SearchBackend) -> None:
+    """Create the index structures of a backend on the primary database."""
+    with db.engine.begin() as connection:
+        backend.install(connection)
+
+
+def get_search_backend() -> SearchBackend:
+    """Return the search backend of the current app."""
+    return current_app.extensions["search_backend"]
+
+
+__all__ = [
+    "SearchBackend",
+    "SearchHit",
+    "LikeSearchBackend",
+    "SQLiteFTSBackend",
+    "PostgresFTSBackend",
+    "init_search",
+    "install_search",
+    "get_search_backend",
+]
@@ -0,0 +1,278 @@
+# app/search/backends.py
+"""Full-text search backends for blog posts.
+
+Every backend exposes the same two operations: ``match`` returns a subquery of
+``(post_id, score)`` rows where a lower score is a better match, and
+``highlight`` returns highlighted titles and content snippets for a page of
+post ids, as HTML-escaped text where only the ``<mark>`` tags are markup.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from markupsafe import escape
+
+from app.extensions import db
+from app.models import PostModel, TagModel
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+# Private-use characters the database wraps matches in, so the fragments can be
+# escaped before the real tags go in
+MATCH_START = "\ue000"
+MATCH_END = "\ue001"
+
+
+def mark_matches(fragment: str | None) -> str | None:
+    """Escape a database highlight fragment and turn its match markers into tags."""
+    if fragment is None:
+        return None
+    return (
+        str(escape(fragment))
+        .replace(MATCH_START, HIGHLIGHT_START)
+        .replace(MATCH_END, HIGHLIGHT_END)
+    )
+
+
+def mark_rows(rows) -> dict[int, tuple[str | None, str | None]]:
+    """Build the highlight mapping from (post_id, title, snippet) rows."""
+    return {
+        post_id: (mark_matches(title), mark_matches(snippet))
+        for post_id, title, snippet in rows
+    }
+
+
+@dataclass
+class SearchHit:
+    """A ranked search match with its highlighted fragments."""
+
+    post: PostModel
+    score: float
+    title_highlight: str | None = None
+    snippet: str | None = None
+
+
+class SearchBackend(ABC):
+    """Base class for post search backends."""
+
+    name = "base"
+
+    # Whether the app installs the index structures when it starts; otherwise
+    # a migration or `flask install-search` does
+    install_at_startup = True
+
+    @abstractmethod
+    def install(self, connection) -> None:
+        """Create the index structures the backend needs (idempotent)."""
+
+    @abstractmethod
+    def match(self, search_term: str):
+        """Return a subquery of (post_id, score) rows matching the term."""
+
+    @abstractmethod
+    def highlight(
+        self, search_term: str, post_ids: list[int]
+    ) -> dict[int, tuple[str | None, str | None]]:
+        """Return {post_id: (title_highlight, snippet)} for the given posts."""
+
+
+class LikeSearchBackend(SearchBackend):
+    """Portable fallback using LIKE scans; newest matches first, no ranking."""
+
+    name = "like"
+
+    def install(self, connection) -> None:
+        pass  # Scans the posts table itself
+
+    def match(self, search_term: str):
+        return (
+            db.select(
+                PostModel.id.label("post_id"), (-PostModel.id).label("score")
+            ).where(
+                db.or_(
+                    PostModel.title.contains(search_term),
+                    PostModel.content.contains(search_term),
+                    PostModel.tag_objects.any(
+                        TagModel.name == TagModel.normalize(search_term)
+                    ),
+                )
+            )
+        ).subquery("hits")
+
+    def highlight(self, search_term, post_ids):
+        return {}  # No highlighting without a full-text index
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """SQLite FTS5 external-content index kept in sync by triggers."""
+
+    name = "sqlite_fts"
+
+    # Column weights for bm25(): title, content, tags
+    WEIGHTS = (10.0, 1.0, 5.0)
+
+    INSTALL_STATEMENTS = (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+            title, content, tags,
+            content='posts', content_rowid='id',
+            tokenize='porter unicode61'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS posts_fts_after_insert AFTER INSERT ON posts
+        BEGIN
+            INSERT INTO posts_fts(rowid, title, content, tags)
+            VALUES (new.id, new.title, new.content, new.tags);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS posts_fts_after_delete AFTER DELETE ON posts
+        BEGIN
+            INSERT INTO posts_fts(posts_fts, rowid, title, content, tags)
+            VALUES ('delete', old.id, old.title, old.content, old.tags);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS posts_fts_after_update
+        AFTER UPDATE OF title, content, tags ON posts
+        BEGIN
+            INSERT INTO posts_fts(posts_fts, rowid, title, content, tags)
+            VALUES ('delete', old.id, old.title, old.content, old.tags);
+            INSERT INTO posts_fts(rowid, title, content, tags)
+            VALUES (new.id, new.title, new.content, new.tags);
+        END
+        """,
+    )
+
+    @staticmethod
+    def is_available(connection) -> bool:
+        """Return True if the SQLite build was compiled with FTS5."""
+        options = connection.exec_driver_sql("PRAGMA compile_options").scalars()
+        return "ENABLE_FTS5" in set(options)
+
+    def install(self, connection) -> None:
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+        ).first()
+
+        for statement in self.INSTALL_STATEMENTS:
+            connection.exec_driver_sql(statement)
+
+        if not exists:
+            # Index rows written before the search table existed
+            connection.exec_driver_sql(
+                "INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"
+            )
+
+    @staticmethod
+    def to_fts_query(search_term: str) -> str:
+        """Turn free text into a safe FTS5 query of quoted prefix terms."""
+        tokens = re.findall(r"\w+", search_term)
+        return " ".join(f'"{token}"*' for token in tokens)
+
+    def match(self, search_term: str):
+        weights = ", ".join(str(weight) for weight in self.WEIGHTS)
+        return (
+            db.select(
+                db.literal_column("posts_fts.rowid").label("post_id"),
+                db.literal_column(f"bm25(posts_fts, {weights})").label("score"),
+            )
+            .select_from(db.text("posts_fts"))
+            .where(
+                db.text("posts_fts MATCH :fts_query").bindparams(
+                    fts_query=self.to_fts_query(search_term) or '""'
+                )
+            )
+        ).subquery("hits")
+
+    def highlight(self, search_term, post_ids):
+        if not post_ids:
+            return {}
+
+        rows = db.session.execute(
+            db.text(
+                "SELECT rowid, highlight(posts_fts, 0, :start, :end), "
+                "snippet(posts_fts, 1, :start, :end, '…', 24) "
+                "FROM posts_fts WHERE posts_fts MATCH :fts_query "
+                "AND rowid IN :post_ids"
+            ).bindparams(db.bindparam("post_ids", expanding=True)),
+            {
+                "start": MATCH_START,
+                "end": MATCH_END,
+                "fts_query": self.to_fts_query(search_term) or '""',
+                "post_ids": list(post_ids),
+            },
+        )
+        return mark_rows(rows)
+
+
+class PostgresFTSBackend(SearchBackend):
+    """PostgreSQL tsvector generated column with a GIN index."""
+
+    name = "postgres_fts"
+
+    # Adding the generated column rewrites the table under an ACCESS EXCLUSIVE
+    # lock, so it is left to the migrations
+    install_at_startup = False
+
+    LANGUAGE = "english"
+
+    INSTALL_STATEMENTS = (
+        """
+        ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(tags, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(content, '')), 'C')
+        ) STORED
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_posts_search_vector
+        ON posts USING GIN (search_vector)
+        """,
+    )
+
+    def install(self, connection) -> None:
+        for statement in self.INSTALL_STATEMENTS:
+            connection.exec_driver_sql(statement)
+
+    def _tsquery(self, search_term: str):
+        return db.func.websearch_to_tsquery(self.LANGUAGE, search_term)
+
+    def match(self, search_term: str):
+        vector = db.literal_column("posts.search_vector")
+        tsquery = self._tsquery(search_term)
+        return (
+            db.select(
+                PostModel.id.label("post_id"),
+                (-db.func.ts_rank_cd(vector, tsquery)).label("score"),
+            ).where(vector.op("@@")(tsquery))
+        ).subquery("hits")
+
+    def highlight(self, search_term, post_ids):
+        if not post_ids:
+            return {}
+
+        tsquery = self._tsquery(search_term)
+        selectors = f'StartSel="{MATCH_START}", StopSel="{MATCH_END}"'
+        rows = db.session.execute(
+            db.select(
+                PostModel.id,
+                db.func.ts_headline(
+                    self.LANGUAGE,
+                    PostModel.title,
+                    tsquery,
+                    f"{selectors}, HighlightAll=true",
+                ),
+                db.func.ts_headline(
+                    self.LANGUAGE,
+                    PostModel.content,
+                    tsquery,
+                    f"{selectors}, MaxWords=35, MinWords=15",
+                ),
+            ).where(PostModel.id.in_(post_ids))
+        )
+        return mark_rows(rows)
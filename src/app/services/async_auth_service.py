@@ -0,0 +1,143 @@
+# app/services/async_auth_service.py
+import asyncio
+
+from flask_jwt_extended import create_access_token, create_refresh_token
+from sqlalchemy.exc import IntegrityError
+
+from app.async_db import async_session
+from app.extensions import db
+from app.identity import bearer_token, decode_access_token
+from app.models import UserModel
+from app.services.auth_service import AuthService
+
+
+class AsyncAuthService:
+    """Async counterpart of AuthService for the ASGI app.
+
+    Password hashing waits on the hashing process pool from a worker thread
+    instead of blocking the event loop.
+    """
+
+    @staticmethod
+    async def register_user(username: str, email: str, password: str, **kwargs) -> dict:
+        """Register a new UserModel."""
+        async with async_session() as session:
+            try:
+                # Check if user already exists
+                if await session.scalar(
+                    db.select(UserModel.id).where(UserModel.username == username)
+                ):
+                    return {"error": "Username already exists", "user": None}
+
+                if await session.scalar(
+                    db.select(UserModel.id).where(UserModel.email == email)
+                ):
+                    return {"error": "Email already exists", "user": None}
+
+                # Create new user
+                user = UserModel(username=username, email=email, **kwargs)
+                await asyncio.to_thread(user.set_password, password)
+                session.add(user)
+                await session.commit()
+
+                return {"error": None, "user": user}
+
+            except IntegrityError:
+                await session.rollback()
+                return {"error": "User creation failed", "user": None}
+            except Exception as e:
+                await session.rollback()
+                return {"error": str(e), "user": None}
+
+    @staticmethod
+    async def authenticate_user(username: str, password: str) -> dict:
+        """Authenticate user and return access token."""
+        try:
+            # Find user by username or email
+            async with async_session() as session:
+                user = await session.scalar(
+                    db.select(UserModel)
+                    .where(
+                        db.or_(
+                            UserModel.username == username,
+                            UserModel.email == username,
+                        )
+                    )
+                    .order_by(UserModel.username != username)
+                    .limit(1)
+                )
+
+            if not user:
+                return {"error": "User not found", "user": None, "token": None}
+
+            if not user.is_active:
+                return {"error": "Account is deactivated", "user": None, "token": None}
+
+            if not await asyncio.to_thread(user.check_password, password):
+                return {"error": "Invalid password", "user": None, "token": None}
+
+            if user.password_needs_rehash():
+                await AsyncAuthService._rehash_password(user, password)
+
+            return {
+                "error": None,
+                "user": user,
+                "token": create_access_token(identity=str(user.id)),
+                "refresh_token": create_refresh_token(identity=str(user.id)),
+            }
+
+        except Exception as e:
+            return {"error": str(e), "user": None, "token": None}
+
+    @staticmethod
+    async def _rehash_password(user: UserModel, password: str) -> None:
+        """Upgrade a stored hash to the configured parameters."""
+        async with async_session() as session:
+            try:
+                await asyncio.to_thread(user.set_password, password)
+                session.add(user)
+                await session.commit()
+            except Exception:
+                # Keep the old hash; the next login tries again
+                await session.rollback()
+
+    @staticmethod
+    async def get_token_claims(authorization: str | None) -> dict | None:
+        """Return the claims of a ``Bearer`` token, or None if it is invalid.
+
+        The revocation check may rebuild its filter or confirm a hit on the sync
+        session, so decoding runs in a worker thread.
+        """
+        token = bearer_token(authorization)
+        return await asyncio.to_thread(decode_access_token, token) if token else None
+
+    # Revocations are rare writes shared with the sync service, so they run
+    # on its session in a worker thread
+
+    @staticmethod
+    async def refresh_tokens(refresh_token: str) -> dict:
+        """Exchange a refresh token for a new token pair."""
+        return await asyncio.to_thread(AuthService.refresh_tokens, refresh_token)
+
+    @staticmethod
+    async def logout(access_claims: dict, refresh_token: str | None = None) -> dict:
+        """Revoke the current access token and, if given, its refresh token."""
+        return await asyncio.to_thread(AuthService.logout, access_claims, refresh_token)
+
+    @staticmethod
+    async def revoke_all_sessions(user_id: int) -> dict:
+        """Revoke every token issued to a user so far."""
+        return await asyncio.to_thread(AuthService.revoke_all_sessions, user_id)
+
+    @staticmethod
+    async def get_user(user_id) -> UserModel | None:
+        """Get an active user by id."""
+        if user_id is None:
+            return None
+
+        async with async_session() as session:
+            return await session.scalar(
+                db.select(UserModel).where(
+                    UserModel.id == int(user_id), UserModel.is_active.is_(True)
+                )
+            )
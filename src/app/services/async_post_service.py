@@ -0,0 +1,381 @@
+# app/services/async_post_service.py
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+
+from app.async_db import async_session
+from app.extensions import db
+from app.models import PostModel, TagModel, UserModel, post_tags
+from app.search import get_search_backend
+from app.services.pagination import clamp_limit
+from app.services.post_service import (
+    authorize_posts,
+    build_posts,
+    bulk_item_error,
+    check_bulk_size,
+    project_post_columns,
+    validate_post_fields,
+)
+
+
+class AsyncPostService:
+    """Async counterpart of PostService for the ASGI app."""
+
+    @staticmethod
+    async def get_all_posts(
+        published_only: bool = True,
+        limit: int | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> list[PostModel]:
+        """Get all posts with optional filtering."""
+        query = project_post_columns(db.select(PostModel), columns)
+        if published_only:
+            query = query.where(PostModel.is_published.is_(True))
+        query = query.order_by(db.desc(PostModel.feed_sort_column(published_only)))
+
+        limit = clamp_limit(limit)
+        if limit is not None:
+            query = query.limit(limit)
+
+        async with async_session() as session:
+            return list(await session.scalars(query))
+
+    @staticmethod
+    async def get_post_by_id(
+        post_id: int, published_only: bool = True
+    ) -> PostModel | None:
+        """Get a single post by ID."""
+        return await AsyncPostService._first(
+            db.select(PostModel).where(PostModel.id == post_id), published_only
+        )
+
+    @staticmethod
+    async def get_post_by_slug(
+        slug: str, published_only: bool = True
+    ) -> PostModel | None:
+        """Get a single post by slug."""
+        return await AsyncPostService._first(
+            db.select(PostModel).where(PostModel.slug == slug), published_only
+        )
+
+    @staticmethod
+    async def _first(query, published_only: bool) -> PostModel | None:
+        if published_only:
+            query = query.where(PostModel.is_published.is_(True))
+
+        async with async_session() as session:
+            return await session.scalar(query.limit(1))
+
+    @staticmethod
+    async def get_posts_by_author(
+        author_id: int,
+        published_only: bool = True,
+        columns: Iterable[str] | None = None,
+    ) -> list[PostModel]:
+        """Get posts by specific author."""
+        query = project_post_columns(db.select(PostModel), columns).where(
+            PostModel.author_id == author_id
+        )
+        if published_only:
+            query = query.where(PostModel.is_published.is_(True))
+        query = query.order_by(db.desc(PostModel.created_at))
+
+        async with async_session() as session:
+            return list(await session.scalars(query))
+
+    @staticmethod
+    async def get_posts_by_tag(
+        tag_name: str,
+        published_only: bool = True,
+        columns: Iterable[str] | None = None,
+    ) -> list[PostModel]:
+        """Get posts carrying a specific tag."""
+        query = (
+            project_post_columns(db.select(PostModel), columns)
+            .join(post_tags, post_tags.c.post_id == PostModel.id)
+            .join(TagModel, TagModel.id == post_tags.c.tag_id)
+            .where(TagModel.name == TagModel.normalize(tag_name))
+        )
+        if published_only:
+            query = query.where(PostModel.is_published.is_(True))
+        query = query.order_by(
+            db.desc(PostModel.published_at), db.desc(PostModel.created_at)
+        )
+
+        async with async_session() as session:
+            return list(await session.scalars(query))
+
+    @staticmethod
+    async def search_posts(
+        search_term: str,
+        published_only: bool = True,
+        columns: Iterable[str] | None = None,
+    ) -> list[PostModel]:
+        """Search posts by title, content or tags, best match first."""
+        hits = get_search_backend().match(search_term)
+        query = project_post_columns(db.select(PostModel), columns).join(
+            hits, hits.c.post_id == PostModel.id
+        )
+        if published_only:
+            query = query.where(PostModel.is_published.is_(True))
+        query = query.order_by(hits.c.score, PostModel.id)
+
+        async with async_session() as session:
+            return list(await session.scalars(query))
+
+    @staticmethod
+    async def create_post(title: str, content: str, author_id: int, **kwargs) -> dict:
+        """Create a new blog post."""
+        async with async_session() as session:
+            try:
+                # Verify author exists
+                author = await session.get(UserModel, author_id)
+                if not author:
+                    return {"error": "Author not found", "post": None}
+
+                post = PostModel(
+                    title=title, content=content, author_id=author_id, **kwargs
+                )
+
+                await AsyncPostService._save(session, post)
+                return {"error": None, "post": post}
+
+            except Exception as e:
+                await session.rollback()
+                return {"error": str(e), "post": None}
+
+    @staticmethod
+    async def update_post(post_id: int, user_id: int, **kwargs) -> dict:
+        """Update an existing post."""
+        async with async_session() as session:
+            try:
+                post = await session.get(PostModel, post_id)
+                if not post:
+                    return {"error": "Post not found", "post": None}
+
+                # Check if user owns the post
+                if post.author_id != user_id:
+                    return {"error": "Not authorized to edit this post", "post": None}
+
+                # Update post fields
+                for key, value in kwargs.items():
+                    if hasattr(post, key) and value is not None:
+                        setattr(post, key, value)
+
+                await AsyncPostService._save(session, post)
+                return {"error": None, "post": post}
+
+            except Exception as e:
+                await session.rollback()
+                return {"error": str(e), "post": None}
+
+    @staticmethod
+    async def delete_post(post_id: int, user_id: int) -> dict:
+        """Delete a post."""
+        async with async_session() as session:
+            try:
+                post = await session.get(PostModel, post_id)
+                if not post:
+                    return {"error": "Post not found", "success": False}
+
+                # Check if user owns the post
+                if post.author_id != user_id:
+                    return {
+                        "error": "Not authorized to delete this post",
+                        "success": False,
+                    }
+
+                await session.delete(post)
+                await session.commit()
+                return {"error": None, "success": True}
+
+            except Exception as e:
+                await session.rollback()
+                return {"error": str(e), "success": False}
+
+    @staticmethod
+    async def publish_post(post_id: int, user_id: int) -> dict:
+        """Publish a post."""
+        async with async_session() as session:
+            try:
+                post = await session.get(PostModel, post_id)
+                if not post:
+                    return {"error": "Post not found", "post": None}
+
+                # Check if user owns the post
+                if post.author_id != user_id:
+                    return {
+                        "error": "Not authorized to publish this post",
+                        "post": None,
+                    }
+
+                post.is_published = True
+                post.published_at = datetime.now(UTC)
+                await AsyncPostService._save(session, post)
+                return {"error": None, "post": post}
+
+            except Exception as e:
+                await session.rollback()
+                return {"error": str(e), "post": None}
+
+    @staticmethod
+    async def create_posts(items: list[dict], author_id: int) -> dict:
+        """Create many posts in one transaction."""
+        error = check_bulk_size(items)
+        if error:
+            return {"error": error, "posts": [], "errors": []}
+
+        async with async_session() as session:
+            try:
+                if not await session.get(UserModel, author_id):
+                    return {"error": "Author not found", "posts": [], "errors": []}
+
+                valid, errors = [], []
+                for index, item in enumerate(items):
+                    message = validate_post_fields(item)
+                    if message:
+                        errors.append(bulk_item_error(index, message))
+                    else:
+                        valid.append(item)
+
+                attempt = 1
+                while True:
+                    posts = build_posts(valid, author_id)
+                    try:
+                        post_ids = await session.run_sync(
+                            lambda sync_session, batch: PostModel.insert_many(
+                                batch, sync_session
+                            ),
+                            posts,
+                        )
+                        await session.commit()
+                        break
+                    except IntegrityError as e:
+                        await session.rollback()
+                        if (
+                            "slug" not in str(e.orig)
+                            or attempt >= PostModel.SLUG_ALLOCATION_ATTEMPTS
+                        ):
+                            raise
+                        attempt += 1
+
+                return {
+                    "error": None,
+                    "posts": await AsyncPostService._load_many(session, post_ids),
+                    "errors": errors,
+                }
+
+            except Exception as e:
+                await session.rollback()
+                return {"error": str(e), "posts": [], "errors": []}
+
+    @staticmethod
+    async def publish_posts(post_ids: list[int], user_id: int) -> dict:
+        """Publish many posts in one transaction, reporting errors per id."""
+        error = check_bulk_size(post_ids)
+        if error:
+            return {"error": error, "posts": [], "errors": []}
+
+        async with async_session() as session:
+            try:
+                posts = list(
+                    await session.scalars(
+                        db.select(PostModel).where(PostModel.id.in_(set(post_ids)))
+                    )
+                )
+                allowed, errors = authorize_posts(posts, post_ids, user_id, "publish")
+
+                now = datetime.now(UTC)
+                for post in allowed:
+                    if not post.is_published:
+                        post.is_published = True
+                        post.published_at = now
+
+                await session.run_sync(PostModel.flush_batch)
+                await session.commit()
+
+                return {
+                    "error": None,
+                    "posts": await AsyncPostService._load_many(
+                        session, [post.id for post in allowed]
+                    ),
+                    "errors": errors,
+                }
+
+            except Exception as e:
+                await session.rollback()
+                return {"error": str(e), "posts": [], "errors": []}
+
+    @staticmethod
+    async def delete_posts(post_ids: list[int], user_id: int) -> dict:
+        """Delete many posts in one transaction, reporting errors per id."""
+        error = check_bulk_size(post_ids)
+        if error:
+            return {"error": error, "deleted_ids": [], "errors": []}
+
+        async with async_session() as session:
+            try:
+                posts = list(
+                    await session.scalars(
+                        db.select(PostModel)
+                        .where(PostModel.id.in_(set(post_ids)))
+                        .options(selectinload(PostModel.tag_objects))
+                    )
+                )
+                allowed, errors = authorize_posts(posts, post_ids, user_id, "delete")
+
+                for post in allowed:
+                    await session.delete(post)
+                await session.run_sync(PostModel.flush_batch)
+                await session.commit()
+
+                return {
+                    "error": None,
+                    "deleted_ids": [post.id for post in allowed],
+                    "errors": errors,
+                }
+
+            except Exception as e:
+                await session.rollback()
+                return {"error": str(e), "deleted_ids": [], "errors": []}
+
+    @staticmethod
+    async def _load_many(session, post_ids: list[int]) -> list[PostModel]:
+        """Load posts by id in one query, in the given order."""
+        if not post_ids:
+            return []
+        posts_by_id = {
+            post.id: post
+            for post in await session.scalars(
+                db.select(PostModel).where(PostModel.id.in_(post_ids))
+            )
+        }
+        return [posts_by_id[post_id] for post_id in post_ids]
+
+    @staticmethod
+    async def _save(session, post: PostModel) -> None:
+        """Async PostModel.save(): same preparation and slug retry rules."""
+        slug_allocated = await session.run_sync(post.prepare_for_save)
+
+        attempt = 1
+        while True:
+            session.add(post)
+            try:
+                await session.commit()
+                return
+            except IntegrityError as e:
+                await session.rollback()
+                if (
+                    not slug_allocated
+                    or "slug" not in str(e.orig)
+                    or attempt >= PostModel.SLUG_ALLOCATION_ATTEMPTS
+                ):
+                    raise
+                attempt += 1
+                post.slug = await session.run_sync(
+                    lambda sync_session: post.generate_slug(
+                        min_seq=post.slug_seq + 1, session=sync_session
+                    )
+                )
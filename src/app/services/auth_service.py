@@ -1,9 +1,15 @@
 # app/services/auth_service.py
-from flask_jwt_extended import create_access_token, decode_token, get_jwt_identity
+from flask_jwt_extended import (
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+)
 from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db
+from app.identity import UserSnapshot, current_identity, decode_access_token
 from app.models import UserModel
+from app.revocation import get_revocation_list
 
 
 class AuthService:
@@ -46,43 +52,123 @@ class AuthService:
             if not user:
                 return {"error": "User not found", "user": None, "token": None}
 
-            if not UserModel.is_active:
+            if not user.is_active:
                 return {"error": "Account is deactivated", "user": None, "token": None}
 
             if not user.check_password(password):
                 return {"error": "Invalid password", "user": None, "token": None}
 
-            # Create access token
-            access_token = create_access_token(identity=user.id)
+            if user.password_needs_rehash():
+                AuthService._rehash_password(user, password)
 
-            return {"error": None, "user": user, "token": access_token}
+            return {"error": None, "user": user, **AuthService._issue_tokens(user)}
 
         except Exception as e:
             return {"error": str(e), "user": None, "token": None}
 
     @staticmethod
-    def get_current_user() -> UserModel | None:
-        """Get current user from JWT token."""
+    def _issue_tokens(user: UserModel) -> dict:
+        """Create an access and refresh token pair for a user."""
+        return {
+            "token": create_access_token(identity=str(user.id)),
+            "refresh_token": create_refresh_token(identity=str(user.id)),
+        }
+
+    @staticmethod
+    def refresh_tokens(refresh_token: str) -> dict:
+        """Exchange a refresh token for a new token pair.
+
+        The refresh token is rotated: once used, it is revoked.
+        """
         try:
-            user_id = get_jwt_identity()
-            if user_id:
-                return UserModel.query.get(user_id)
-            return None
+            claims = decode_token(refresh_token)
         except Exception:
-            return None
+            return {"error": "Invalid refresh token", "user": None, "token": None}
+
+        revocations = get_revocation_list()
+        if claims.get("type") != "refresh" or revocations.is_revoked(claims):
+            return {"error": "Invalid refresh token", "user": None, "token": None}
+
+        user = db.session.get(UserModel, int(claims["sub"]))
+        if not user or not user.is_active:
+            return {"error": "Account is deactivated", "user": None, "token": None}
 
-    @staticmethod
-    def verify_token(token: str) -> dict:
-        """Verify JWT token and return user info."""
         try:
-            decoded = decode_token(token)
-            user_id = decoded["sub"]
-            user = UserModel.query.get(user_id)
+            revocations.revoke(claims)
+        except IntegrityError:
+            # Already exchanged by a concurrent request
+            db.session.rollback()
+            return {"error": "Invalid refresh token", "user": None, "token": None}
 
-            if not user or not UserModel.is_active:
-                return {"error": "Invalid token", "user": None}
+        return {"error": None, "user": user, **AuthService._issue_tokens(user)}
 
-            return {"error": None, "user": user}
+    @staticmethod
+    def logout(access_claims: dict, refresh_token: str | None = None) -> dict:
+        """Revoke the current access token and, if given, its refresh token."""
+        revocations = get_revocation_list()
+        tokens = [access_claims]
+        if refresh_token:
+            try:
+                claims = decode_token(refresh_token)
+            except Exception:
+                return {"error": "Invalid refresh token"}
+            if claims.get("type") != "refresh" or claims["sub"] != access_claims["sub"]:
+                return {"error": "Invalid refresh token"}
+            if not revocations.is_revoked(claims):
+                tokens.append(claims)
+
+        try:
+            for claims in tokens:
+                revocations.revoke(claims)
+            return {"error": None}
 
         except Exception as e:
-            return {"error": str(e), "user": None}
+            db.session.rollback()
+            return {"error": str(e)}
+
+    @staticmethod
+    def revoke_all_sessions(user_id: int) -> dict:
+        """Revoke every access and refresh token issued to a user so far."""
+        try:
+            get_revocation_list().revoke_all(user_id)
+            return {"error": None}
+        except Exception as e:
+            db.session.rollback()
+            return {"error": str(e)}
+
+    @staticmethod
+    def _rehash_password(user: UserModel, password: str) -> None:
+        """Upgrade a stored hash to the configured parameters."""
+        try:
+            user.set_password(password)
+            db.session.commit()
+        except Exception:
+            # Keep the old hash; the next login tries again
+            db.session.rollback()
+
+    @staticmethod
+    def get_current_user() -> UserModel | None:
+        """Get current user from JWT token."""
+        snapshot = current_identity().user
+        return db.session.get(UserModel, snapshot.id) if snapshot else None
+
+    @staticmethod
+    def get_current_user_snapshot() -> UserSnapshot | None:
+        """Get the id, username and active flag of the current user.
+
+        Served from the user cache, without loading the full row.
+        """
+        return current_identity().user
+
+    @staticmethod
+    def verify_token(token: str) -> dict:
+        """Verify JWT token and return user info."""
+        claims = decode_access_token(token)
+        if claims is None:
+            return {"error": "Invalid token", "user": None}
+
+        user = db.session.get(UserModel, int(claims["sub"]))
+        if not user or not user.is_active:
+            return {"error": "Invalid token", "user": None}
+
+        return {"error": None, "user": user}
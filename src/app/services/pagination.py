@@ -0,0 +1,104 @@
+# app/services/pagination.py
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from flask import current_app
+
+from app.extensions import db
+
+
+@dataclass
+class Page:
+    """A single page of keyset-paginated results."""
+
+    items: list
+    cursors: list[str] = field(default_factory=list)
+    has_next_page: bool = False
+    has_previous_page: bool = False
+
+
+def encode_cursor(sort_value, row_id: int) -> str:
+    """Encode a (sort key, id) pair as an opaque cursor."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | float | None, int]:
+    """Decode a cursor produced by ``encode_cursor``."""
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if isinstance(sort_value, str):
+            sort_value = datetime.fromisoformat(sort_value)
+        elif sort_value is not None and not isinstance(sort_value, int | float):
+            raise TypeError(sort_value)
+        return sort_value, int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def clamp_page_size(first: int | None) -> int:
+    """Apply the default and the server-enforced maximum page size."""
+    max_size = current_app.config["GRAPHQL_MAX_PAGE_SIZE"]
+    if first is None:
+        return min(current_app.config["GRAPHQL_DEFAULT_PAGE_SIZE"], max_size)
+    if first < 1:
+        raise ValueError("Page size must be positive")
+    return min(first, max_size)
+
+
+def clamp_limit(limit: int | None) -> int | None:
+    """Apply the maximum page size to a list ``limit``; None stays unbounded."""
+    if limit is None:
+        return None
+    if limit < 1:
+        raise ValueError("Limit must be positive")
+    return min(limit, current_app.config["GRAPHQL_MAX_PAGE_SIZE"])
+
+
+def keyset_paginate(
+    query, sort_column, id_column, first: int | None = None, after: str | None = None
+) -> Page:
+    """Return the page after ``after`` ordered by (sort_column, id) descending.
+
+    Seeks with ``WHERE (sort, id) < (:sort, :id)`` instead of OFFSET, so every
+    page costs one index range scan no matter how deep the client pages. Rows
+    with a NULL sort key, if the column allows them, come last by id.
+    """
+    page_size = clamp_page_size(first)
+    nullable = sort_column.nullable
+    sort_order = db.desc(sort_column)
+    if nullable:
+        sort_order = sort_order.nulls_last()
+
+    if after:
+        sort_value, row_id = decode_cursor(after)
+        if sort_value is None:
+            query = query.filter(sort_column.is_(None), id_column < row_id)
+        else:
+            seek = db.tuple_(sort_column, id_column) < (sort_value, row_id)
+            if nullable:
+                seek = db.or_(seek, sort_column.is_(None))
+            query = query.filter(seek)
+
+    rows = (
+        query.order_by(None)
+        .order_by(sort_order, db.desc(id_column))
+        .limit(page_size + 1)
+        .all()
+    )
+    items = rows[:page_size]
+
+    return Page(
+        items=items,
+        cursors=[
+            encode_cursor(getattr(item, sort_column.key), item.id) for item in items
+        ],
+        has_next_page=len(rows) > page_size,
+        has_previous_page=after is not None,
+    )
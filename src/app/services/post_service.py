@@ -1,7 +1,95 @@
 # app/services/post_service.py
+from collections.abc import Iterable
+from datetime import UTC, datetime
 
+from flask import current_app
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only, make_transient_to_detached, selectinload
+
+from app.cache import get_post_cache, post_cache_tag
 from app.extensions import db
-from app.models import PostModel, UserModel
+from app.identity import get_user_snapshot
+from app.models import PostModel, TagModel
+from app.search import SearchHit, get_search_backend
+from app.services.pagination import (
+    Page,
+    clamp_limit,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    keyset_paginate,
+)
+
+
+def check_bulk_size(items: list) -> str | None:
+    """Return an error if a bulk mutation has too many items."""
+    limit = current_app.config["BULK_MUTATION_MAX_ITEMS"]
+    if len(items) > limit:
+        return f"Too many items ({len(items)}, max {limit})"
+    return None
+
+
+def bulk_item_error(index: int, message: str, post_id: int | None = None) -> dict:
+    """Error of one item of a bulk mutation, by its position in the input."""
+    return {"index": index, "id": post_id, "message": message}
+
+
+def validate_post_fields(fields: dict) -> str | None:
+    """Return why a new post cannot be saved, or None if it can."""
+    if not PostModel.slugify(fields.get("title") or ""):
+        return "Title is required"
+    if not (fields.get("content") or "").strip():
+        return "Content is required"
+
+    # Checked up front: one oversized value would fail the whole batch
+    for name in ("title", "excerpt", "tags"):
+        limit = PostModel.__table__.c[name].type.length
+        if len(fields.get(name) or "") > limit:
+            return f"{name.capitalize()} is too long (max {limit} characters)"
+    return None
+
+
+def project_post_columns(query, columns: Iterable[str] | None, *required: str):
+    """Load only the given post columns (and ``required``); None loads all.
+
+    Works on ORM queries and ``select()`` statements alike.
+    """
+    if columns is None:
+        return query
+    names = sorted({*columns, *required})
+    return query.options(load_only(*(getattr(PostModel, name) for name in names)))
+
+
+def build_posts(items: list[dict], author_id: int) -> list[PostModel]:
+    """Create unsaved posts from validated bulk input."""
+    now = datetime.now(UTC)
+    return [
+        PostModel(
+            author_id=author_id,
+            published_at=now if item.get("is_published") else None,
+            **item,
+        )
+        for item in items
+    ]
+
+
+def authorize_posts(
+    posts: list[PostModel], post_ids: list[int], user_id: int, action: str
+) -> tuple[list[PostModel], list[dict]]:
+    """Split requested ids into the caller's posts and per-item errors."""
+    posts_by_id = {post.id: post for post in posts}
+    allowed, errors = {}, []
+    for index, post_id in enumerate(post_ids):
+        post = posts_by_id.get(post_id)
+        if post is None:
+            errors.append(bulk_item_error(index, "Post not found", post_id))
+        elif post.author_id != user_id:
+            errors.append(
+                bulk_item_error(index, f"Not authorized to {action} this post", post_id)
+            )
+        else:
+            allowed[post_id] = post
+    return list(allowed.values()), errors
 
 
 class PostService:
@@ -9,54 +97,133 @@ class PostService:
 
     @staticmethod
     def get_all_posts(
-        published_only: bool = True, limit: int | None = None
+        published_only: bool = True,
+        limit: int | None = None,
+        columns: Iterable[str] | None = None,
     ) -> list[PostModel]:
-        """Get all posts with optional filtering."""
+        """Get all posts with optional filtering.
+
+        ``columns`` restricts the loaded post columns, see
+        ``project_post_columns``; the list resolvers pass what was selected.
+        """
         query = (
             PostModel.get_published()
             if published_only
             else PostModel.query.order_by(db.desc(PostModel.created_at))
         )
+        query = project_post_columns(query, columns)
 
-        if limit:
+        limit = clamp_limit(limit)
+        if limit is not None:
             query = query.limit(limit)
 
         return query.all()
 
     @staticmethod
-    def get_post_by_id(post_id: int, published_only: bool = True) -> PostModel | None:
-        """Get a single post by ID."""
-        query = PostModel.query.filter_by(id=post_id)
-
+    def get_posts_page(
+        published_only: bool = True,
+        first: int | None = None,
+        after: str | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> Page:
+        """Get a page of posts after the given cursor."""
+        sort_column = PostModel.feed_sort_column(published_only)
+        # The cursors are built from the sort column
+        query = project_post_columns(PostModel.query, columns, sort_column.key)
         if published_only:
             query = query.filter_by(is_published=True)
 
-        return query.first()
+        return keyset_paginate(
+            query,
+            sort_column,
+            PostModel.id,
+            first,
+            after,
+        )
+
+    @staticmethod
+    def get_post_by_id(post_id: int, published_only: bool = True) -> PostModel | None:
+        """Get a single post by ID."""
+        return PostService._cached_lookup(
+            ("id", post_id, published_only),
+            lambda: PostService._filter_published(
+                PostModel.query.filter_by(id=post_id), published_only
+            ).first(),
+        )
 
     @staticmethod
     def get_post_by_slug(slug: str, published_only: bool = True) -> PostModel | None:
         """Get a single post by slug."""
-        query = PostModel.query.filter_by(slug=slug)
+        return PostService._cached_lookup(
+            ("slug", slug, published_only),
+            lambda: PostService._filter_published(
+                PostModel.query.filter_by(slug=slug), published_only
+            ).first(),
+        )
 
+    @staticmethod
+    def _filter_published(query, published_only: bool):
         if published_only:
             query = query.filter_by(is_published=True)
+        return query
+
+    @staticmethod
+    def _cached_lookup(key: tuple, load) -> PostModel | None:
+        """Read-through lookup against the post cache.
+
+        Column snapshots are cached rather than instances, and re-attached
+        with ``merge(load=False)`` so a hit never touches the database.
+        """
+        cache = get_post_cache()
+        if cache is None:
+            return load()
 
-        return query.first()
+        snapshot = cache.get(key)
+        if snapshot is not None:
+            post = PostModel(**snapshot)
+            make_transient_to_detached(post)
+            return db.session.merge(post, load=False)
+
+        post = load()
+        if post is not None:
+            snapshot = {
+                attr.key: getattr(post, attr.key)
+                for attr in db.inspect(PostModel).column_attrs
+            }
+            cache.set(key, snapshot, tags=[post_cache_tag(post.id)])
+        return post
 
     @staticmethod
     def get_posts_by_author(
-        author_id: int, published_only: bool = True
+        author_id: int,
+        published_only: bool = True,
+        columns: Iterable[str] | None = None,
     ) -> list[PostModel]:
         """Get posts by specific author."""
-        return PostModel.get_by_author(author_id, published_only).all()
+        return project_post_columns(
+            PostModel.get_by_author(author_id, published_only), columns
+        ).all()
+
+    @staticmethod
+    def get_posts_by_author_page(
+        author_id: int,
+        published_only: bool = True,
+        first: int | None = None,
+        after: str | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> Page:
+        """Get a page of posts by a specific author after the given cursor."""
+        query = project_post_columns(
+            PostModel.get_by_author(author_id, published_only), columns, "created_at"
+        )
+        return keyset_paginate(query, PostModel.created_at, PostModel.id, first, after)
 
     @staticmethod
     def create_post(title: str, content: str, author_id: int, **kwargs) -> dict:
         """Create a new blog post."""
         try:
-            # Verify author exists
-            author = UserModel.query.get(author_id)
-            if not author:
+            # Verify author exists, usually from the user snapshot cache
+            if not get_user_snapshot(author_id):
                 return {"error": "Author not found", "post": None}
 
             post = PostModel(
@@ -133,6 +300,183 @@ class PostService:
             return {"error": str(e), "post": None}
 
     @staticmethod
-    def search_posts(search_term: str, published_only: bool = True) -> list[PostModel]:
+    def create_posts(items: list[dict], author_id: int) -> dict:
+        """Create many posts in one transaction.
+
+        Items failing validation are reported by index and skipped; the others
+        are inserted with batched statements and a single commit.
+        """
+        error = check_bulk_size(items)
+        if error:
+            return {"error": error, "posts": [], "errors": []}
+
+        try:
+            if not get_user_snapshot(author_id):
+                return {"error": "Author not found", "posts": [], "errors": []}
+
+            valid, errors = [], []
+            for index, item in enumerate(items):
+                message = validate_post_fields(item)
+                if message:
+                    errors.append(bulk_item_error(index, message))
+                else:
+                    valid.append(item)
+
+            attempt = 1
+            while True:
+                posts = build_posts(valid, author_id)
+                try:
+                    post_ids = PostModel.insert_many(posts)
+                    db.session.commit()
+                    break
+                except IntegrityError as e:
+                    # A concurrent create took one of the slugs: allocate again
+                    db.session.rollback()
+                    if (
+                        "slug" not in str(e.orig)
+                        or attempt >= PostModel.SLUG_ALLOCATION_ATTEMPTS
+                    ):
+                        raise
+                    attempt += 1
+
+            return {
+                "error": None,
+                "posts": PostService._load_many(post_ids),
+                "errors": errors,
+            }
+
+        except Exception as e:
+            db.session.rollback()
+            return {"error": str(e), "posts": [], "errors": []}
+
+    @staticmethod
+    def publish_posts(post_ids: list[int], user_id: int) -> dict:
+        """Publish many posts in one transaction, reporting errors per id."""
+        error = check_bulk_size(post_ids)
+        if error:
+            return {"error": error, "posts": [], "errors": []}
+
+        try:
+            posts = PostModel.query.filter(PostModel.id.in_(set(post_ids))).all()
+            allowed, errors = authorize_posts(posts, post_ids, user_id, "publish")
+
+            now = datetime.now(UTC)
+            for post in allowed:
+                if not post.is_published:
+                    post.is_published = True
+                    post.published_at = now
+
+            PostModel.flush_batch()
+            published_ids = [post.id for post in allowed]
+            db.session.commit()
+
+            return {
+                "error": None,
+                "posts": PostService._load_many(published_ids),
+                "errors": errors,
+            }
+
+        except Exception as e:
+            db.session.rollback()
+            return {"error": str(e), "posts": [], "errors": []}
+
+    @staticmethod
+    def delete_posts(post_ids: list[int], user_id: int) -> dict:
+        """Delete many posts in one transaction, reporting errors per id."""
+        error = check_bulk_size(post_ids)
+        if error:
+            return {"error": error, "deleted_ids": [], "errors": []}
+
+        try:
+            posts = (
+                PostModel.query.filter(PostModel.id.in_(set(post_ids)))
+                # Loaded up front so tag links are deleted in one batch
+                .options(selectinload(PostModel.tag_objects))
+                .all()
+            )
+            allowed, errors = authorize_posts(posts, post_ids, user_id, "delete")
+
+            for post in allowed:
+                db.session.delete(post)
+            PostModel.flush_batch()
+            deleted_ids = [post.id for post in allowed]
+            db.session.commit()
+
+            return {"error": None, "deleted_ids": deleted_ids, "errors": errors}
+
+        except Exception as e:
+            db.session.rollback()
+            return {"error": str(e), "deleted_ids": [], "errors": []}
+
+    @staticmethod
+    def _load_many(post_ids: list[int]) -> list[PostModel]:
+        """Load posts by id in one query, in the given order."""
+        if not post_ids:
+            return []
+        posts = PostModel.query.filter(PostModel.id.in_(post_ids)).all()
+        posts_by_id = {post.id: post for post in posts}
+        return [posts_by_id[post_id] for post_id in post_ids]
+
+    @staticmethod
+    def search_posts(
+        search_term: str,
+        published_only: bool = True,
+        columns: Iterable[str] | None = None,
+    ) -> list[PostModel]:
         """Search posts by title, content, or tags."""
-        return PostModel.search_posts(search_term, published_only).all()
+        return project_post_columns(
+            PostModel.search_posts(search_term, published_only), columns
+        ).all()
+
+    @staticmethod
+    def search_posts_page(
+        search_term: str,
+        published_only: bool = True,
+        first: int | None = None,
+        after: str | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> Page:
+        """Get a page of ranked search hits after the given cursor."""
+        page_size = clamp_page_size(first)
+        after_key = decode_cursor(after) if after else None
+
+        rows = (
+            project_post_columns(
+                PostModel.search_ranked(search_term, published_only, after=after_key),
+                columns,
+            )
+            .limit(page_size + 1)
+            .all()
+        )
+        page_rows = rows[:page_size]
+
+        highlights = get_search_backend().highlight(
+            search_term, [post.id for post, _ in page_rows]
+        )
+        hits = [
+            SearchHit(post, score, *highlights.get(post.id, (None, None)))
+            for post, score in page_rows
+        ]
+
+        return Page(
+            items=hits,
+            cursors=[encode_cursor(hit.score, hit.post.id) for hit in hits],
+            has_next_page=len(rows) > page_size,
+            has_previous_page=after is not None,
+        )
+
+    @staticmethod
+    def get_posts_by_tag(
+        tag_name: str,
+        published_only: bool = True,
+        columns: Iterable[str] | None = None,
+    ) -> list[PostModel]:
+        """Get posts carrying a specific tag."""
+        return project_post_columns(
+            PostModel.get_by_tag(tag_name, published_only), columns
+        ).all()
+
+    @staticmethod
+    def get_tags(published_only: bool = True) -> list[tuple[str, int]]:
+        """Get tag names with the number of posts using each."""
+        return TagModel.get_with_post_counts(published_only)
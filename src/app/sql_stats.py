@@ -0,0 +1,98 @@
+# app/sql_stats.py
+"""Count SQL statements, their time and repeated shapes.
+
+Engine events record every statement into the collectors active in the
+current thread or task (``collect_sql``), so statements of concurrent requests
+never mix. A shape is a statement with whitespace and ``IN`` lists collapsed;
+the same shape executed many times in one operation is the mark of an N+1
+pattern.
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_collectors: ContextVar[tuple] = ContextVar("sql_collectors", default=())
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)"
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """Return a statement with whitespace and ``IN`` lists collapsed."""
+    return _IN_LIST.sub("(...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class SqlStats:
+    """Statements executed while collecting."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, min_count: int = 2, limit: int = 5) -> list[tuple[str, int]]:
+        """Most frequent shapes executed at least ``min_count`` times."""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common(limit)
+            if count >= min_count
+        ]
+
+    def as_dict(self, min_repeats: int = 2) -> dict:
+        return {
+            "queries": self.count,
+            "duration_ms": round(self.duration * 1000, 3),
+            "repeated": [
+                {"statement": shape, "count": count}
+                for shape, count in self.repeated(min_repeats)
+            ],
+        }
+
+    def describe(self) -> str:
+        lines = [f"{self.count} statements in {self.duration * 1000:.1f} ms"]
+        lines += [f"  {count}x {shape}" for shape, count in self.shapes.most_common()]
+        return "\n".join(lines)
+
+
+@contextmanager
+def collect_sql():
+    """Collect the statements run by this thread or task inside the block.
+
+    Collectors nest: statements count towards every enclosing collector.
+    """
+    stats = SqlStats()
+    token = _collectors.set((*_collectors.get(), stats))
+    try:
+        yield stats
+    finally:
+        _collectors.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement(conn, cursor, statement, parameters, context, executemany):
+    if _collectors.get() and context is not None:
+        context._sql_stats_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    collectors = _collectors.get()
+    started = getattr(context, "_sql_stats_started", None)
+    if not collectors or started is None:
+        return
+
+    duration = time.perf_counter() - started
+    for stats in collectors:
+        stats.record(statement, duration)
@@ -0,0 +1,39 @@
+# app/testing.py
+"""Test helpers bounding the SQL an operation may run.
+
+Counts include every statement of the request, so warm or disable the
+per-process caches (``POST_CACHE_ENABLED``, token and user caches) when a test
+needs a stable number.
+"""
+
+from contextlib import contextmanager
+
+from app.sql_stats import collect_sql
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """Fail if the block runs more than ``limit`` SQL statements."""
+    with collect_sql() as stats:
+        yield stats
+
+    if stats.count > limit:
+        raise AssertionError(
+            f"Expected at most {limit} SQL statements, ran {stats.describe()}"
+        )
+
+
+def assert_operation_queries(
+    client, query: str, limit: int, variables=None, headers=None
+) -> dict:
+    """Run a GraphQL operation with a Flask test client, bounding its SQL.
+
+    Returns the JSON response.
+    """
+    with assert_max_queries(limit):
+        response = client.post(
+            "/api/graphql",
+            json={"query": query, "variables": variables or {}},
+            headers=headers or {},
+        )
+    return response.get_json()
@@ -0,0 +1,252 @@
+# app/transfer.py
+"""Streaming NDJSON export and import of users and posts.
+
+Every line is a JSON object whose ``type`` is ``user`` or ``post``; posts name
+their author by username, so a dump loads into a database with other ids.
+Export reads in keyset batches and import writes in chunks, so memory stays
+flat whatever the number of rows. Users are matched by username and posts by
+slug: rows that already exist are skipped, which makes re-running or resuming
+an import safe.
+"""
+
+import json
+import os
+from datetime import UTC, datetime
+
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.http_cache import queue_purge, surrogate_key
+from app.models import PostModel, UserModel
+from app.passwords import get_password_hasher
+from app.services.post_service import validate_post_fields
+
+USER_FIELDS = (
+    "username",
+    "email",
+    "password_hash",
+    "first_name",
+    "last_name",
+    "bio",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+POST_FIELDS = (
+    "title",
+    "content",
+    "excerpt",
+    "tags",
+    "slug",
+    "is_published",
+    "published_at",
+    "created_at",
+    "updated_at",
+)
+DATETIME_FIELDS = ("created_at", "updated_at", "published_at")
+
+
+class TransferError(ValueError):
+    """Raised when an import line cannot be loaded."""
+
+
+class ImportCheckpoint:
+    """Number of input lines already imported, saved after every chunk."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> int:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)["line"]
+        except FileNotFoundError:
+            return 0
+
+    def save(self, line: int) -> None:
+        # Written aside and renamed, so a crash leaves the old or new value
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump({"line": line}, file)
+        os.replace(temporary, self.path)
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _encode(kind: str, row) -> str:
+    record = {"type": kind}
+    for key, value in row._mapping.items():
+        if key != "id":
+            record[key] = value.isoformat() if isinstance(value, datetime) else value
+    return json.dumps(record, ensure_ascii=False)
+
+
+def _keyset_batches(query, id_column, batch_size: int):
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            query.where(id_column > last_id).order_by(id_column).limit(batch_size)
+        ).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def export_lines(batch_size: int = 1000):
+    """Yield every user, then every post, as NDJSON lines."""
+    users = db.select(
+        UserModel.id, *(getattr(UserModel, field) for field in USER_FIELDS)
+    )
+    for rows in _keyset_batches(users, UserModel.id, batch_size):
+        for row in rows:
+            yield _encode("user", row)
+
+    posts = db.select(
+        PostModel.id,
+        UserModel.username.label("author"),
+        *(getattr(PostModel, field) for field in POST_FIELDS),
+    ).join(UserModel, UserModel.id == PostModel.author_id)
+    for rows in _keyset_batches(posts, PostModel.id, batch_size):
+        for row in rows:
+            yield _encode("post", row)
+
+
+def _fields(record: dict, fields: tuple, line: int) -> dict:
+    values = {field: record.get(field) for field in fields}
+    for field in DATETIME_FIELDS:
+        if isinstance(values.get(field), str):
+            try:
+                values[field] = datetime.fromisoformat(values[field])
+            except ValueError as e:
+                raise TransferError(f"Line {line}: invalid {field}") from e
+    return values
+
+
+def _insert_users(records: list, stats: dict) -> None:
+    usernames = [record.get("username") for _, record in records]
+    existing = set(
+        db.session.scalars(
+            db.select(UserModel.username).where(UserModel.username.in_(usernames))
+        )
+    )
+
+    now = datetime.now(UTC)
+    rows = []
+    for line, record in records:
+        if not record.get("username") or not record.get("email"):
+            raise TransferError(f"Line {line}: username and email are required")
+        if record["username"] in existing:
+            stats["skipped"] += 1
+            continue
+        existing.add(record["username"])
+
+        row = _fields(record, USER_FIELDS, line)
+        if not row["password_hash"]:
+            if not record.get("password"):
+                raise TransferError(f"Line {line}: password_hash is required")
+            row["password_hash"] = get_password_hasher().hash(record["password"])
+        row["is_active"] = row["is_active"] is not False
+        row["created_at"] = row["created_at"] or now
+        row["updated_at"] = row["updated_at"] or row["created_at"]
+        # Posts imported afterwards add to the counters
+        row["post_count"] = row["published_post_count"] = 0
+        rows.append(row)
+
+    if rows:
+        db.session.execute(UserModel.__table__.insert(), rows)
+        queue_purge(db.session, surrogate_key("users"))
+        stats["users"] += len(rows)
+
+
+def _insert_posts(records: list, stats: dict) -> None:
+    authors = {record.get("author") for _, record in records}
+    author_ids = dict(
+        db.session.execute(
+            db.select(UserModel.username, UserModel.id).where(
+                UserModel.username.in_(authors)
+            )
+        ).all()
+    )
+    slugs = [record["slug"] for _, record in records if record.get("slug")]
+    existing = set(
+        db.session.scalars(db.select(PostModel.slug).where(PostModel.slug.in_(slugs)))
+    )
+
+    now = datetime.now(UTC)
+    posts = []
+    for line, record in records:
+        slug = record.get("slug")
+        if slug and slug in existing:
+            stats["skipped"] += 1
+            continue
+        if slug:
+            existing.add(slug)
+
+        author_id = author_ids.get(record.get("author"))
+        if author_id is None:
+            raise TransferError(f"Line {line}: unknown author {record.get('author')!r}")
+        fields = _fields(record, POST_FIELDS, line)
+        message = validate_post_fields(fields)
+        if message:
+            raise TransferError(f"Line {line}: {message}")
+        fields["created_at"] = fields["created_at"] or now
+        if fields["is_published"] and not fields["published_at"]:
+            # The published feed pages on published_at: date it by creation
+            fields["published_at"] = fields["created_at"]
+        posts.append(PostModel(author_id=author_id, **fields))
+
+    # Slugs, rendered content, excerpts, tags and counters per chunk
+    PostModel.insert_many(posts)
+    stats["posts"] += len(posts)
+
+
+def _import_chunk(chunk: list, stats: dict) -> None:
+    users = [(line, record) for line, record in chunk if record["type"] == "user"]
+    posts = [(line, record) for line, record in chunk if record["type"] == "post"]
+    try:
+        # Users first, so posts in the same chunk find their authors
+        _insert_users(users, stats)
+        _insert_posts(posts, stats)
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        raise TransferError(f"Lines {chunk[0][0]}-{chunk[-1][0]}: {e.orig}") from e
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def import_lines(lines, batch_size: int = 1000, checkpoint=None) -> dict:
+    """Load NDJSON lines in chunks of ``batch_size``, one commit per chunk.
+
+    With a checkpoint, lines imported by an earlier run are skipped and
+    progress is saved after every chunk; the checkpoint is cleared at the end.
+    """
+    stats = {"users": 0, "posts": 0, "skipped": 0}
+    start = checkpoint.load() if checkpoint is not None else 0
+    chunk = []
+    for line, text in enumerate(lines, 1):
+        if line <= start or not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError as e:
+            raise TransferError(f"Line {line}: invalid JSON") from e
+        if not isinstance(record, dict) or record.get("type") not in ("user", "post"):
+            raise TransferError(f"Line {line}: type must be 'user' or 'post'")
+
+        chunk.append((line, record))
+        if len(chunk) >= batch_size:
+            _import_chunk(chunk, stats)
+            chunk = []
+            if checkpoint is not None:
+                checkpoint.save(line)
+
+    if chunk:
+        _import_chunk(chunk, stats)
+    if checkpoint is not None:
+        checkpoint.clear()
+    return stats
@@ -0,0 +1,9 @@
+# asgi.py
+from dotenv import load_dotenv
+
+from app.asgi import create_asgi_app
+
+load_dotenv()
+
+# Run with: uvicorn asgi:app --workers 4
+app = create_asgi_app()
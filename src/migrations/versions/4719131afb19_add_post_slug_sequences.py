@@ -0,0 +1,41 @@
+"""add post slug sequences
+
+Slug base and numeric suffix, filled for existing posts by
+`flask backfill-slugs`.
+
+Revision ID: 4719131afb19
+Revises: 780845a15672
+Create Date: 2026-10-18 01:42:35.535630
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4719131afb19'
+down_revision = '780845a15672'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    columns = {column["name"] for column in inspector.get_columns("posts")}
+    with op.batch_alter_table("posts") as batch_op:
+        if "slug_base" not in columns:
+            batch_op.add_column(sa.Column("slug_base", sa.String(length=200)))
+        if "slug_seq" not in columns:
+            batch_op.add_column(sa.Column("slug_seq", sa.Integer()))
+
+    if "ix_posts_slug_base_seq" not in {
+        index["name"] for index in inspector.get_indexes("posts")
+    }:
+        op.create_index("ix_posts_slug_base_seq", "posts", ["slug_base", "slug_seq"])
+
+
+def downgrade():
+    op.drop_index("ix_posts_slug_base_seq", table_name="posts")
+    with op.batch_alter_table("posts") as batch_op:
+        batch_op.drop_column("slug_seq")
+        batch_op.drop_column("slug_base")
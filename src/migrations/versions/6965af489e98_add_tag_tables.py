@@ -0,0 +1,50 @@
+"""add tag tables
+
+Existing comma-separated tags are copied in by `flask migrate-tags`.
+
+Revision ID: 6965af489e98
+Revises: a85c0f100df7
+Create Date: 2026-10-18 01:41:14.786885
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6965af489e98'
+down_revision = 'a85c0f100df7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("tags"):
+        op.create_table(
+            "tags",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_tags_name", "tags", ["name"], unique=True)
+
+    if not inspector.has_table("post_tags"):
+        op.create_table(
+            "post_tags",
+            sa.Column("post_id", sa.Integer(), nullable=False),
+            sa.Column("tag_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["post_id"], ["posts.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["tag_id"], ["tags.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("post_id", "tag_id"),
+        )
+        op.create_index(
+            "ix_post_tags_tag_id_post_id", "post_tags", ["tag_id", "post_id"]
+        )
+
+
+def downgrade():
+    op.drop_table("post_tags")
+    op.drop_table("tags")
@@ -0,0 +1,37 @@
+"""add keyset pagination indexes
+
+(sort key, id) indexes matching the cursors of the Relay connections.
+
+Revision ID: 780845a15672
+Revises: 6965af489e98
+Create Date: 2026-10-18 01:41:16.313121
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '780845a15672'
+down_revision = '6965af489e98'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("posts", "ix_posts_published_feed", ["is_published", "published_at", "id"]),
+    ("posts", "ix_posts_created_at_id", ["created_at", "id"]),
+    ("posts", "ix_posts_author_feed", ["author_id", "created_at", "id"]),
+    ("users", "ix_users_created_at_id", ["created_at", "id"]),
+)
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    for table, name, columns in INDEXES:
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for table, name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
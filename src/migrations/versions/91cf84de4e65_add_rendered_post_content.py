@@ -0,0 +1,46 @@
+"""add rendered post content
+
+Rendered HTML of post bodies, filled for existing posts by
+`flask rerender-posts`.
+
+Revision ID: 91cf84de4e65
+Revises: 4719131afb19
+Create Date: 2026-10-18 01:42:36.813807
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '91cf84de4e65'
+down_revision = '4719131afb19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    columns = {column["name"] for column in inspector.get_columns("posts")}
+    with op.batch_alter_table("posts") as batch_op:
+        if "content_html" not in columns:
+            batch_op.add_column(sa.Column("content_html", sa.Text()))
+        if "content_hash" not in columns:
+            batch_op.add_column(sa.Column("content_hash", sa.String(length=64)))
+        if "content_renderer_version" not in columns:
+            batch_op.add_column(sa.Column("content_renderer_version", sa.Integer()))
+
+    if "ix_posts_content_renderer_version" not in {
+        index["name"] for index in inspector.get_indexes("posts")
+    }:
+        op.create_index(
+            "ix_posts_content_renderer_version", "posts", ["content_renderer_version"]
+        )
+
+
+def downgrade():
+    op.drop_index("ix_posts_content_renderer_version", table_name="posts")
+    with op.batch_alter_table("posts") as batch_op:
+        batch_op.drop_column("content_renderer_version")
+        batch_op.drop_column("content_hash")
+        batch_op.drop_column("content_html")
@@ -0,0 +1,33 @@
+"""add user post counters
+
+Counters stay NULL, and are computed by a GROUP BY fallback, until
+`flask rebuild-post-counters` fills them.
+
+Revision ID: a85c0f100df7
+Revises: cfcfae82f85b
+Create Date: 2026-10-18 01:40:33.499269
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a85c0f100df7'
+down_revision = 'cfcfae82f85b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("users")}
+    with op.batch_alter_table("users") as batch_op:
+        for name in ("post_count", "published_post_count"):
+            if name not in columns:
+                batch_op.add_column(sa.Column(name, sa.Integer(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("published_post_count")
+        batch_op.drop_column("post_count")
@@ -0,0 +1,50 @@
+"""add postgres search vector
+
+PostgreSQL only: the weighted tsvector column and GIN index searched by the
+postgres_fts backend. Adding the generated column rewrites posts under an
+ACCESS EXCLUSIVE lock, so run it in a maintenance window; the index is built
+concurrently. SQLite installs its FTS5 table and triggers at startup.
+
+Revision ID: cb55c1a8a02d
+Revises: eb21106281d3
+Create Date: 2026-10-18 01:42:07.615408
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cb55c1a8a02d'
+down_revision = 'eb21106281d3'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR = """
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(tags, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(content, '')), 'C')
+"""
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_posts_search_vector "
+            "ON posts USING GIN (search_vector)"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_posts_search_vector")
+    op.execute("ALTER TABLE posts DROP COLUMN IF EXISTS search_vector")
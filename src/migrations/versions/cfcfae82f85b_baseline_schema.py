@@ -0,0 +1,67 @@
+"""baseline schema
+
+The users and posts tables as first released. Databases created before
+migrations existed already have them and only get stamped.
+
+Revision ID: cfcfae82f85b
+Revises: 
+Create Date: 2026-10-18 01:40:32.143210
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cfcfae82f85b'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("username", sa.String(length=80), nullable=False),
+            sa.Column("email", sa.String(length=120), nullable=False),
+            sa.Column("password_hash", sa.String(length=255), nullable=False),
+            sa.Column("first_name", sa.String(length=50), nullable=True),
+            sa.Column("last_name", sa.String(length=50), nullable=True),
+            sa.Column("bio", sa.Text(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_users_username", "users", ["username"], unique=True)
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    if not inspector.has_table("posts"):
+        op.create_table(
+            "posts",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(length=200), nullable=False),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("excerpt", sa.String(length=500), nullable=True),
+            sa.Column("slug", sa.String(length=200), nullable=True),
+            sa.Column("tags", sa.String(length=500), nullable=True),
+            sa.Column("is_published", sa.Boolean(), nullable=False),
+            sa.Column("published_at", sa.DateTime(), nullable=True),
+            sa.Column("author_id", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["author_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_posts_title", "posts", ["title"])
+        op.create_index("ix_posts_slug", "posts", ["slug"], unique=True)
+        op.create_index("ix_posts_is_published", "posts", ["is_published"])
+        op.create_index("ix_posts_author_id", "posts", ["author_id"])
+
+
+def downgrade():
+    op.drop_table("posts")
+    op.drop_table("users")
@@ -0,0 +1,42 @@
+"""add revoked tokens
+
+Revoked JWT ids and per-user "sign out everywhere" cutoffs.
+
+Revision ID: eb21106281d3
+Revises: 91cf84de4e65
+Create Date: 2026-10-18 01:42:38.101981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'eb21106281d3'
+down_revision = '91cf84de4e65'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table("revoked_tokens"):
+        return
+
+    op.create_table(
+        "revoked_tokens",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("jti", sa.String(length=36), nullable=True),
+        sa.Column("token_type", sa.String(length=10), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("jti"),
+    )
+    op.create_index("ix_revoked_tokens_expires_at", "revoked_tokens", ["expires_at"])
+
+
+def downgrade():
+    op.drop_table("revoked_tokens")
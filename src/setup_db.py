@@ -120,8 +120,8 @@ def main():
     with app.app_context():
         print("Setting up database...")
 
-        # Create all tables
-        db.create_all()
+        # Create all tables (on the primary; replicas follow it)
+        db.create_all(bind_key=None)
         print("Database tables created")
 
         # Check if data already exists
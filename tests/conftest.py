@@ -0,0 +1,118 @@
+# tests/conftest.py
+import pytest
+from starlette.testclient import TestClient
+
+from app import create_app
+from app.asgi import create_asgi_app
+from app.config import Config
+from app.extensions import db
+from app.models import PostModel, UserModel
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Test config on a fresh SQLite database."""
+    return type(
+        "TestConfig",
+        (Config,),
+        {
+            "TESTING": True,
+            "PASSWORD_HASH_WORKERS": 0,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+        },
+    )
+
+
+@pytest.fixture
+def app(request, config):
+    """App on the test config; parametrize indirectly to override settings."""
+    app = create_app(type("TestConfig", (config,), getattr(request, "param", {})))
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all(bind_key=None)
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def asgi_client(app, config):
+    """Test client of the ASGI app on the test config and database of ``app``."""
+    with TestClient(create_asgi_app(config)) as client:
+        yield client
+
+
+@pytest.fixture
+def agql(asgi_client):
+    """Run a GraphQL operation against the ASGI app and return the JSON response."""
+
+    def run(query, variables=None, token=None):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        response = asgi_client.post(
+            "/api/graphql",
+            json={"query": query, "variables": variables or {}},
+            headers=headers,
+        )
+        return response.json()
+
+    return run
+
+
+@pytest.fixture
+def gql(client):
+    """Run a GraphQL operation and return the JSON response."""
+
+    def run(query, variables=None, token=None):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        response = client.post(
+            "/api/graphql",
+            json={"query": query, "variables": variables or {}},
+            headers=headers,
+        )
+        return response.get_json()
+
+    return run
+
+
+@pytest.fixture
+def blog(app):
+    """Three authors with four posts each, every other one published."""
+    with app.app_context():
+        for i in range(3):
+            author = UserModel.create_user(
+                username=f"author{i}", email=f"author{i}@example.com", password="pw"
+            )
+            for j in range(4):
+                post = PostModel(
+                    title=f"GraphQL post {j} by {author.username}",
+                    content=f"Body of post {j}",
+                    tags="graphql, flask",
+                    author_id=author.id,
+                )
+                if j % 2 == 0:
+                    post.publish()
+                else:
+                    post.save()
+
+
+@pytest.fixture
+def login(gql):
+    """Log a user in and return the access and refresh tokens."""
+
+    def run(username, password="pw"):
+        result = gql(
+            """
+            mutation ($input: LoginGInput!) {
+              login(loginInput: $input) { accessToken refreshToken }
+            }
+            """,
+            {"input": {"username": username, "password": password}},
+        )
+        return result["data"]["login"]
+
+    return run
@@ -0,0 +1,73 @@
+# tests/test_asgi.py
+from graphql import build_schema
+
+from app.extensions import db
+from app.models import UserModel
+from app.schemas.async_schema import async_schema
+from app.schemas.schema import schema
+
+CREATE_POST = """
+mutation ($input: PostGInput!) { createPost(postInput: $input) { title } }
+"""
+
+LOGOUT = "mutation { logout { message } }"
+
+POST_INPUT = {"input": {"title": "Async post", "content": "Written over ASGI"}}
+
+
+def test_async_mutation_runs_for_active_user(agql, blog, login):
+    tokens = login("author0")
+
+    result = agql(CREATE_POST, POST_INPUT, token=tokens["accessToken"])
+
+    assert result["data"]["createPost"]["title"] == "Async post"
+
+
+def test_async_mutation_rejects_deactivated_user(app, agql, blog, login):
+    tokens = login("author0")
+    with app.app_context():
+        user = db.session.scalar(db.select(UserModel).filter_by(username="author0"))
+        user.is_active = False
+        db.session.commit()
+
+    result = agql(CREATE_POST, POST_INPUT, token=tokens["accessToken"])
+
+    assert result["errors"][0]["message"] == "Authentication required"
+
+
+def test_async_mutation_rejects_revoked_token(agql, blog, login):
+    token = login("author0")["accessToken"]
+    assert agql(LOGOUT, token=token)["data"]["logout"]["message"] == "Logged out"
+
+    result = agql(CREATE_POST, POST_INPUT, token=token)
+
+    assert result["errors"][0]["message"] == "Authentication required"
+
+
+def fields_by_type(schema):
+    type_map = build_schema(schema.as_str()).type_map
+    return {
+        name: set(graphql_type.fields)
+        for name, graphql_type in type_map.items()
+        if not name.startswith("__") and hasattr(graphql_type, "fields")
+    }
+
+
+def test_async_schema_differs_only_in_listed_operations():
+    sync_types = fields_by_type(schema)
+    async_types = fields_by_type(async_schema)
+
+    assert sync_types["QueryGType"] - async_types["QueryGType"] == {
+        "postsConnection",
+        "postsByAuthorConnection",
+        "searchPostsConnection",
+        "usersConnection",
+        "tags",
+    }
+    assert async_types["QueryGType"] <= sync_types["QueryGType"]
+    assert async_types["MutationGType"] - sync_types["MutationGType"] == {"register"}
+    assert sync_types["MutationGType"] <= async_types["MutationGType"]
+
+    shared = set(sync_types) & set(async_types) - {"QueryGType", "MutationGType"}
+    assert {name for name in shared if sync_types[name] != async_types[name]} == set()
+    assert set(async_types) - set(sync_types) == {"UserGInput"}
@@ -0,0 +1,98 @@
+# tests/test_bulk_mutations.py
+import pytest
+
+from app.models import PostModel, UserModel
+
+CREATE = """
+mutation ($inputs: [PostGInput!]!) {
+  createPosts(inputs: $inputs) {
+    posts { title slug isPublished }
+    errors { index id message }
+  }
+}
+"""
+
+PUBLISH = """
+mutation ($ids: [Int!]!) {
+  publishPosts(ids: $ids) { posts { id isPublished } errors { index id message } }
+}
+"""
+
+DELETE = """
+mutation ($ids: [Int!]!) {
+  deletePosts(ids: $ids) { deletedIds errors { index id message } }
+}
+"""
+
+
+@pytest.fixture
+def post_ids(app, blog):
+    """Ids of author0's draft and author1's first post."""
+    with app.app_context():
+        draft = PostModel.query.filter_by(title="GraphQL post 1 by author0").one()
+        other = PostModel.query.filter_by(title="GraphQL post 0 by author1").one()
+        return draft.id, other.id
+
+
+def counters(app, username):
+    with app.app_context():
+        user = UserModel.query.filter_by(username=username).one()
+        return user.post_count, user.published_post_count
+
+
+def test_create_posts_skips_invalid_items(app, gql, login, blog):
+    inputs = [
+        {"title": "Bulk", "content": "One", "isPublished": True},
+        {"title": "  ", "content": "No title"},
+        {"title": "Bulk", "content": "Two", "tags": "x" * 501},
+        {"title": "Bulk", "content": "Three"},
+    ]
+    token = login("author0")["accessToken"]
+    result = gql(CREATE, {"inputs": inputs}, token=token)["data"]["createPosts"]
+
+    assert result["posts"] == [
+        {"title": "Bulk", "slug": "bulk", "isPublished": True},
+        {"title": "Bulk", "slug": "bulk-1", "isPublished": False},
+    ]
+    assert result["errors"] == [
+        {"index": 1, "id": None, "message": "Title is required"},
+        {"index": 2, "id": None, "message": "Tags is too long (max 500 characters)"},
+    ]
+    assert counters(app, "author0") == (6, 3)
+
+
+def test_publish_posts_reports_foreign_and_missing_posts(app, gql, login, post_ids):
+    draft_id, other_id = post_ids
+    token = login("author0")["accessToken"]
+    variables = {"ids": [draft_id, other_id, 999]}
+    result = gql(PUBLISH, variables, token=token)["data"]["publishPosts"]
+
+    assert result["posts"] == [{"id": draft_id, "isPublished": True}]
+    assert result["errors"] == [
+        {"index": 1, "id": other_id, "message": "Not authorized to publish this post"},
+        {"index": 2, "id": 999, "message": "Post not found"},
+    ]
+    assert counters(app, "author0") == (4, 3)
+
+
+def test_delete_posts_reports_foreign_and_missing_posts(app, gql, login, post_ids):
+    draft_id, other_id = post_ids
+    token = login("author0")["accessToken"]
+    variables = {"ids": [999, other_id, draft_id]}
+    result = gql(DELETE, variables, token=token)["data"]["deletePosts"]
+
+    assert result["deletedIds"] == [draft_id]
+    assert [error["index"] for error in result["errors"]] == [0, 1]
+    assert counters(app, "author0") == (3, 2)
+    assert counters(app, "author1") == (4, 2)
+
+
+def test_bulk_mutations_are_bounded_and_authenticated(app, gql, login, blog):
+    app.config["BULK_MUTATION_MAX_ITEMS"] = 2
+    token = login("author0")["accessToken"]
+
+    result = gql(DELETE, {"ids": [1, 2, 3]}, token=token)
+    assert result["errors"][0]["message"] == "Too many items (3, max 2)"
+
+    result = gql(DELETE, {"ids": [1]})
+    assert result["data"] is None
@@ -0,0 +1,69 @@
+# tests/test_cache.py
+import pytest
+
+from app.cache import TTLCache
+from app.extensions import db
+from app.models import PostModel
+
+POST = "query ($id: Int!) { post(id: $id) { title } }"
+
+
+@pytest.fixture
+def post_id(app, blog):
+    with app.app_context():
+        return PostModel.query.filter_by(title="GraphQL post 0 by author0").one().id
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_expires_and_invalidates_by_tag():
+    cache = TTLCache(ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+    cache = TTLCache()
+    cache.set("a", 1, tags=["post"])
+    cache.set("b", 2, tags=["post"])
+    cache.invalidate_tag("post")
+    assert cache.stats()["size"] == 0
+
+
+def test_post_lookup_is_served_from_cache(client, gql, post_id):
+    for _ in range(3):
+        assert gql(POST, {"id": post_id})["data"]["post"] is not None
+
+    stats = client.get("/api/cache/stats").get_json()["post"]
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 1, 1)
+
+
+def test_update_invalidates_cached_post(app, gql, post_id):
+    gql(POST, {"id": post_id})
+    with app.app_context():
+        post = db.session.get(PostModel, post_id)
+        post.title = "Renamed"
+        post.save()
+
+    assert gql(POST, {"id": post_id})["data"]["post"] == {"title": "Renamed"}
+
+
+def test_unpublish_and_delete_invalidate_cached_post(app, gql, post_id):
+    gql(POST, {"id": post_id})
+    with app.app_context():
+        db.session.get(PostModel, post_id).unpublish()
+    assert gql(POST, {"id": post_id})["data"]["post"] is None
+
+    query = "query ($id: Int!) { post(id: $id, publishedOnly: false) { title } }"
+    assert gql(query, {"id": post_id})["data"]["post"] is not None
+    with app.app_context():
+        db.session.get(PostModel, post_id).delete()
+    assert gql(query, {"id": post_id})["data"]["post"] is None
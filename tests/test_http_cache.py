@@ -0,0 +1,63 @@
+# tests/test_http_cache.py
+import pytest
+
+from app.extensions import db
+from app.models import PostModel
+
+PURGED = []
+
+
+def get(client, query, **headers):
+    return client.get("/api/graphql", query_string={"query": query}, headers=headers)
+
+
+@pytest.fixture
+def post_id(app, blog):
+    with app.app_context():
+        return PostModel.query.filter_by(title="GraphQL post 0 by author0").one().id
+
+
+def test_get_query_is_cacheable_and_conditional(client, post_id):
+    query = f"{{ post(id: {post_id}) {{ title author {{ username }} }} }}"
+    response = get(client, query)
+
+    assert response.status_code == 200
+    assert response.headers["Surrogate-Key"] == f"post-{post_id} user-1"
+    assert response.cache_control.public
+    assert response.cache_control.s_maxage == 60
+    assert response.last_modified is not None
+
+    cached = get(client, query, **{"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+
+
+def test_etag_changes_when_a_post_changes(app, client, post_id):
+    query = "{ posts { title } }"
+    etag = get(client, query).headers["ETag"]
+
+    with app.app_context():
+        post = db.session.get(PostModel, post_id)
+        post.title = "Renamed"
+        post.save()
+
+    response = get(client, query, **{"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert "posts" in response.headers["Surrogate-Key"].split()
+
+
+def test_errors_and_post_requests_are_not_cached(client, blog):
+    assert "ETag" not in get(client, "{ post(id: 999) { nope } }").headers
+    response = client.post("/api/graphql", json={"query": "{ posts { id } }"})
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "app", [{"SURROGATE_PURGE_HOOK": PURGED.extend}], indirect=True
+)
+def test_writes_purge_surrogate_keys(app, post_id):
+    PURGED.clear()
+    with app.app_context():
+        db.session.get(PostModel, post_id).unpublish()
+
+    assert {"posts", f"post-{post_id}", "user-1"} <= set(PURGED)
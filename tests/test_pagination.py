@@ -0,0 +1,109 @@
+# tests/test_pagination.py
+from app.extensions import db
+from app.models import PostModel
+
+POSTS_PAGE = """
+query ($first: Int, $after: String, $publishedOnly: Boolean!) {
+  postsConnection(first: $first, after: $after, publishedOnly: $publishedOnly) {
+    edges { cursor node { id } }
+    pageInfo { hasNextPage hasPreviousPage endCursor }
+  }
+}
+"""
+
+
+def fetch_all(gql, first, published_only=True):
+    ids, after, pages = [], None, 0
+    while True:
+        variables = {"first": first, "after": after, "publishedOnly": published_only}
+        connection = gql(POSTS_PAGE, variables)["data"]["postsConnection"]
+        ids += [int(edge["node"]["id"]) for edge in connection["edges"]]
+        pages += 1
+        assert connection["pageInfo"]["hasPreviousPage"] is (after is not None)
+        if not connection["pageInfo"]["hasNextPage"]:
+            return ids, pages
+        after = connection["pageInfo"]["endCursor"]
+
+
+def test_posts_connection_walks_every_post_once(gql, blog):
+    ids, pages = fetch_all(gql, first=4)
+    assert pages == 2
+    assert len(ids) == len(set(ids)) == 6
+
+    ids, pages = fetch_all(gql, first=5, published_only=False)
+    assert pages == 3
+    assert len(ids) == len(set(ids)) == 12
+
+
+def test_page_size_is_clamped(app, gql, blog):
+    app.config["GRAPHQL_MAX_PAGE_SIZE"] = 3
+
+    variables = {"first": 50, "after": None, "publishedOnly": True}
+    connection = gql(POSTS_PAGE, variables)["data"]["postsConnection"]
+
+    assert len(connection["edges"]) == 3
+    assert connection["pageInfo"]["hasNextPage"] is True
+
+
+def test_invalid_page_arguments(gql, blog):
+    result = gql(POSTS_PAGE, {"first": 0, "publishedOnly": True})
+    assert result["errors"][0]["message"] == "Page size must be positive"
+
+    result = gql(POSTS_PAGE, {"after": "not-a-cursor", "publishedOnly": True})
+    assert result["errors"][0]["message"] == "Invalid cursor"
+
+
+def test_users_connection(gql, blog):
+    query = """
+    query ($after: String) {
+      usersConnection(first: 2, after: $after) {
+        edges { node { username } }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+    """
+    first = gql(query)["data"]["usersConnection"]
+    second = gql(query, {"after": first["pageInfo"]["endCursor"]})["data"]
+
+    usernames = [edge["node"]["username"] for edge in first["edges"]]
+    usernames += [
+        edge["node"]["username"] for edge in second["usersConnection"]["edges"]
+    ]
+    assert sorted(usernames) == ["author0", "author1", "author2"]
+    assert second["usersConnection"]["pageInfo"]["hasNextPage"] is False
+
+
+def test_posts_created_as_published_are_dated(gql, login, blog):
+    mutation = """
+    mutation ($input: PostGInput!) { createPost(postInput: $input) { publishedAt } }
+    """
+    variables = {"input": {"title": "New", "content": "Body", "isPublished": True}}
+    result = gql(mutation, variables, token=login("author0")["accessToken"])
+
+    assert result["data"]["createPost"]["publishedAt"] is not None
+
+
+def test_posts_without_publication_date_are_paged_last(app, gql, blog):
+    with app.app_context():
+        undated = [
+            post.id for post in PostModel.query.filter_by(is_published=True).limit(3)
+        ]
+        db.session.execute(
+            db.update(PostModel)
+            .where(PostModel.id.in_(undated))
+            .values(published_at=None)
+        )
+        db.session.commit()
+
+    ids, pages = fetch_all(gql, first=2)
+
+    assert pages == 3
+    assert sorted(ids[3:]) == sorted(undated)
+    assert len(set(ids)) == 6
+
+    result = app.test_cli_runner().invoke(args=["backfill-published-at"])
+    assert "Backfilled publication dates for 3 posts" in result.output
+    with app.app_context():
+        assert (
+            PostModel.query.filter_by(published_at=None, is_published=True).count() == 0
+        )
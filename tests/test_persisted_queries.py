@@ -0,0 +1,62 @@
+# tests/test_persisted_queries.py
+import hashlib
+
+import pytest
+
+from app.api.persisted_queries import PersistedQueryError, PersistedQueryStore
+
+QUERY = "{ posts { title } }"
+QUERY_HASH = hashlib.sha256(QUERY.encode()).hexdigest()
+
+
+def persisted(query_hash=QUERY_HASH, version=1):
+    return {"persistedQuery": {"version": version, "sha256Hash": query_hash}}
+
+
+def post(client, **body):
+    return client.post("/api/graphql", json=body).get_json()
+
+
+def error_code(result):
+    return result["errors"][0]["extensions"]["code"]
+
+
+def test_unknown_hash_is_not_found_until_registered(client, blog):
+    result = post(client, extensions=persisted())
+    assert error_code(result) == "PERSISTED_QUERY_NOT_FOUND"
+    assert result["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    registered = post(client, query=QUERY, extensions=persisted())
+    replayed = post(client, extensions=persisted())
+
+    assert len(replayed["data"]["posts"]) == 6
+    assert replayed == registered
+
+
+def test_hash_mismatch_is_rejected(client, blog):
+    result = post(client, query=QUERY, extensions=persisted("0" * 64))
+    assert error_code(result) == "PERSISTED_QUERY_INVALID"
+    assert result["errors"][0]["message"] == "provided sha does not match query"
+
+    result = post(client, extensions=persisted("0" * 64))
+    assert error_code(result) == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_unsupported_version_is_rejected(client):
+    result = post(client, query=QUERY, extensions=persisted(version=2))
+    assert error_code(result) == "PERSISTED_QUERY_INVALID"
+
+
+def test_strict_store_only_runs_manifest_queries():
+    store = PersistedQueryStore(registered={QUERY_HASH: QUERY}, strict=True)
+    assert store.resolve(None, persisted()) == QUERY
+
+    other = "{ users { id } }"
+    other_hash = PersistedQueryStore.hash_query(other)
+    with pytest.raises(PersistedQueryError) as e:
+        store.resolve(other, persisted(other_hash))
+    assert e.value.code == "PERSISTED_QUERY_NOT_SUPPORTED"
+
+    with pytest.raises(PersistedQueryError) as e:
+        store.resolve(QUERY, None)
+    assert e.value.code == "PERSISTED_QUERY_REQUIRED"
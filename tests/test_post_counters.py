@@ -0,0 +1,64 @@
+# tests/test_post_counters.py
+from app.extensions import db
+from app.models import PostModel, UserModel
+
+USER_COUNTS = "{ users { username postCount publishedPostCount } }"
+
+
+def counters(app):
+    with app.app_context():
+        return {
+            user.username: (user.post_count, user.published_post_count)
+            for user in UserModel.query.order_by(UserModel.id)
+        }
+
+
+def test_counters_follow_post_writes(app, blog):
+    assert counters(app)["author0"] == (4, 2)
+
+    with app.app_context():
+        author = UserModel.query.filter_by(username="author0").one()
+        draft = author.posts.filter_by(is_published=False).first()
+        draft.is_published = True
+        draft.save()
+
+        published = author.posts.filter_by(is_published=True).first()
+        published.delete()
+
+    assert counters(app)["author0"] == (3, 2)
+
+
+def test_counters_follow_author_change(app, blog):
+    with app.app_context():
+        post = PostModel.query.filter_by(title="GraphQL post 0 by author0").one()
+        post.author_id = UserModel.query.filter_by(username="author1").one().id
+        post.save()
+
+    assert counters(app)["author0"] == (3, 1)
+    assert counters(app)["author1"] == (5, 3)
+
+
+def test_null_counters_fall_back_to_aggregate(app, blog, gql):
+    with app.app_context():
+        db.session.execute(
+            db.update(UserModel).values(post_count=None, published_post_count=None)
+        )
+        db.session.commit()
+
+    users = gql(USER_COUNTS)["data"]["users"]
+
+    assert {user["postCount"] for user in users} == {4}
+    assert {user["publishedPostCount"] for user in users} == {2}
+
+
+def test_rebuild_post_counters_command(app, blog):
+    with app.app_context():
+        db.session.execute(
+            db.update(UserModel).values(post_count=None, published_post_count=7)
+        )
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["rebuild-post-counters"])
+
+    assert "Rebuilt post counters for 3 users" in result.output
+    assert set(counters(app).values()) == {(4, 2)}
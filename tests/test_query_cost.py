@@ -0,0 +1,49 @@
+# tests/test_query_cost.py
+import pytest
+
+from app.services.post_service import PostService
+
+POST_AUTHORS = """
+query ($limit: Int) { posts(limit: $limit, publishedOnly: false) { author { username } } }
+"""
+POST_IDS = "query ($limit: Int) { posts(limit: $limit, publishedOnly: false) { id } }"
+
+
+def cost(result):
+    return result["extensions"]["cost"]["requested"]
+
+
+@pytest.mark.parametrize("limit", [0, -5])
+def test_non_positive_limit_is_rejected(gql, blog, limit):
+    result = gql(POST_AUTHORS, {"limit": limit})
+
+    assert result["data"] is None
+    assert result["errors"][0]["message"] == "Limit must be positive"
+    # Costed as a single item, never as a free or negative list
+    assert cost(result) == 2
+
+
+def test_oversized_limit_is_capped(app, gql, blog):
+    result = gql(POST_AUTHORS, {"limit": 10_000})
+    assert cost(result) == 1 + 100
+    assert len(result["data"]["posts"]) == 12
+
+    app.config["GRAPHQL_MAX_PAGE_SIZE"] = 5
+    result = gql(POST_IDS, {"limit": 10_000})
+    assert len(result["data"]["posts"]) == 5
+
+
+def test_service_checks_limit(app, blog):
+    with app.app_context():
+        assert len(PostService.get_all_posts(published_only=False, limit=3)) == 3
+        assert len(PostService.get_all_posts(published_only=False)) == 12
+        with pytest.raises(ValueError, match="Limit must be positive"):
+            PostService.get_all_posts(limit=0)
+
+
+def test_async_schema_checks_limit(agql, blog):
+    result = agql(POST_IDS, {"limit": 0})
+    assert result["errors"][0]["message"] == "Limit must be positive"
+
+    result = agql(POST_IDS, {"limit": 10_000})
+    assert len(result["data"]["posts"]) == 12
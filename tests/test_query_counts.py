@@ -0,0 +1,52 @@
+# tests/test_query_counts.py
+"""Post lists load their authors in one batched query, however many posts."""
+
+from app.testing import assert_operation_queries
+
+# One query for the posts, one for all of their authors
+POST_LIST_QUERIES = 2
+
+
+def test_posts_with_authors(blog, client):
+    result = assert_operation_queries(
+        client,
+        "{ posts(publishedOnly: false) { id author { username } } }",
+        POST_LIST_QUERIES,
+    )
+
+    posts = result["data"]["posts"]
+    assert len(posts) == 12
+    assert {post["author"]["username"] for post in posts} == {
+        "author0",
+        "author1",
+        "author2",
+    }
+
+
+def test_posts_by_author_with_authors(blog, client):
+    result = assert_operation_queries(
+        client,
+        "{ postsByAuthor(authorId: 1, publishedOnly: false) "
+        "{ id author { username } } }",
+        POST_LIST_QUERIES,
+    )
+
+    posts = result["data"]["postsByAuthor"]
+    assert len(posts) == 4
+    assert {post["author"]["username"] for post in posts} == {"author0"}
+
+
+def test_search_posts_with_authors(blog, client):
+    result = assert_operation_queries(
+        client,
+        '{ searchPosts(searchTerm: "graphql") { id author { username } } }',
+        POST_LIST_QUERIES,
+    )
+
+    posts = result["data"]["searchPosts"]
+    assert len(posts) == 6
+    assert {post["author"]["username"] for post in posts} == {
+        "author0",
+        "author1",
+        "author2",
+    }
@@ -0,0 +1,80 @@
+# tests/test_rendering.py
+import pytest
+
+from app.extensions import db
+from app.models import PostModel, UserModel
+from app.rendering import render_markdown
+
+UNSAFE = """# Title
+
+<script>alert("xss")</script>
+
+<img src="x.png" onerror="alert(1)">
+
+[link](javascript:alert(1))
+
+```python
+print("hi")
+```
+"""
+
+
+@pytest.fixture
+def post_id(app):
+    with app.app_context():
+        author = UserModel.create_user(
+            username="writer", email="writer@example.com", password="pw"
+        )
+        post = PostModel(title="Unsafe", content=UNSAFE, author_id=author.id)
+        return post.publish().id
+
+
+def test_markdown_is_rendered_and_sanitized():
+    rendered = render_markdown(UNSAFE)
+
+    assert "<h1>Title</h1>" in rendered
+    assert '<code class="language-python">' in rendered
+    assert "<script>" not in rendered
+    assert "onerror" not in rendered
+    assert "javascript:" not in rendered
+
+
+def test_content_html_is_stored_on_save(gql, post_id):
+    query = f"{{ post(id: {post_id}) {{ contentHtml excerpt }} }}"
+    post = gql(query)["data"]["post"]
+
+    assert post["contentHtml"] == render_markdown(UNSAFE)
+    assert post["excerpt"].startswith("Title")
+    assert "#" not in post["excerpt"]
+
+
+def test_unchanged_content_is_not_rendered_again(app, post_id):
+    with app.app_context():
+        post = db.session.get(PostModel, post_id)
+        post.content_html = "<p>stale</p>"
+        post.title = "Renamed"
+        post.save()
+        assert post.content_html == "<p>stale</p>"
+
+        post.content = "New **body**"
+        post.save()
+        assert post.content_html == "<p>New <strong>body</strong></p>"
+
+
+def test_rerender_posts_command(app, post_id):
+    with app.app_context():
+        db.session.execute(
+            db.update(PostModel).values(
+                content_html=None, content_renderer_version=None
+            )
+        )
+        db.session.commit()
+
+    runner = app.test_cli_runner()
+    assert "Re-rendered 1 posts" in runner.invoke(args=["rerender-posts"]).output
+    assert "Re-rendered 0 posts" in runner.invoke(args=["rerender-posts"]).output
+    output = runner.invoke(args=["rerender-posts", "--force"]).output
+    assert "Re-rendered 1 posts" in output
+
+    with app.app_context():
+        assert db.session.get(PostModel, post_id).content_html is not None
@@ -0,0 +1,92 @@
+# tests/test_replicas.py
+import pytest
+
+from app import create_app
+from app.replicas import READ_AFTER_WRITE_COOKIE, READ_AFTER_WRITE_HEADER
+
+CREATE_POST = """
+mutation ($input: PostGInput!) { createPost(postInput: $input) { title } }
+"""
+
+TITLES = "{ posts(publishedOnly: false) { title } }"
+
+CLIENT = "203.0.113.5"
+OTHER_CLIENT = "198.51.100.7"
+
+
+@pytest.fixture
+def config(config, tmp_path):
+    class ReplicaConfig(config):
+        DATABASE_REPLICA_URLS = [f"sqlite:///{tmp_path / 'replica.db'}"]
+        TRUSTED_PROXY_COUNT = 1
+
+    return ReplicaConfig
+
+
+@pytest.fixture
+def replica(app, blog):
+    result = app.test_cli_runner().invoke(args=["sync-replicas"])
+    assert result.exit_code == 0, result.output
+
+
+@pytest.fixture
+def worker(config):
+    """Client of a second app instance, standing in for another worker process."""
+    return create_app(config).test_client()
+
+
+def post_as(client, query, variables=None, token=None, addr=CLIENT, headers=None):
+    headers = {"X-Forwarded-For": addr, **(headers or {})}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return client.post(
+        "/api/graphql",
+        json={"query": query, "variables": variables or {}},
+        headers=headers,
+    )
+
+
+def titles(response):
+    return {post["title"] for post in response.get_json()["data"]["posts"]}
+
+
+def test_write_hands_out_a_read_after_write_token(client, login, replica):
+    token = login("author0")["accessToken"]
+    variables = {"input": {"title": "Fresh post", "content": "Just written"}}
+
+    response = post_as(client, CREATE_POST, variables, token=token)
+
+    assert response.headers[READ_AFTER_WRITE_HEADER]
+    cookie = client.get_cookie(READ_AFTER_WRITE_COOKIE)
+    assert cookie.value == response.headers[READ_AFTER_WRITE_HEADER]
+    assert "Fresh post" in titles(post_as(client, TITLES))
+    assert "Fresh post" not in titles(post_as(client, TITLES, addr=OTHER_CLIENT))
+
+
+def test_any_worker_honours_the_token_of_the_same_client(
+    client, worker, login, replica
+):
+    token = login("author0")["accessToken"]
+    variables = {"input": {"title": "Fresh post", "content": "Just written"}}
+    written = post_as(client, CREATE_POST, variables, token=token)
+    sticky = {READ_AFTER_WRITE_HEADER: written.headers[READ_AFTER_WRITE_HEADER]}
+
+    # Same forwarded address, or same user from elsewhere: primary
+    assert "Fresh post" in titles(post_as(worker, TITLES, headers=sticky))
+    assert "Fresh post" in titles(
+        post_as(worker, TITLES, token=token, addr=OTHER_CLIENT, headers=sticky)
+    )
+    # No token, someone else's token, or a forged one: replica
+    assert "Fresh post" not in titles(post_as(worker, TITLES))
+    assert "Fresh post" not in titles(
+        post_as(worker, TITLES, addr=OTHER_CLIENT, headers=sticky)
+    )
+    forged = {READ_AFTER_WRITE_HEADER: sticky[READ_AFTER_WRITE_HEADER] + "x"}
+    assert "Fresh post" not in titles(post_as(worker, TITLES, headers=forged))
+
+
+def test_reads_without_writes_get_no_token(client, replica):
+    response = post_as(client, TITLES)
+
+    assert READ_AFTER_WRITE_HEADER not in response.headers
+    assert client.get_cookie(READ_AFTER_WRITE_COOKIE) is None
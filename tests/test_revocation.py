@@ -0,0 +1,105 @@
+# tests/test_revocation.py
+import time
+
+import pytest
+from flask_jwt_extended import verify_jwt_in_request
+from flask_jwt_extended.exceptions import RevokedTokenError
+
+from app.revocation import BloomFilter
+from app.services.auth_service import AuthService
+
+ME = "{ me { username } }"
+
+REFRESH = """
+mutation ($token: String!) {
+  refreshToken(refreshToken: $token) { accessToken refreshToken }
+}
+"""
+
+LOGOUT = """
+mutation ($token: String) { logout(refreshToken: $token) { message } }
+"""
+
+
+def me(gql, tokens):
+    return gql(ME, token=tokens["accessToken"])["data"]["me"]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=100)
+    for i in range(100):
+        bloom.add(f"jti-{i}")
+
+    assert all(f"jti-{i}" in bloom for i in range(100))
+    assert sum(f"other-{i}" in bloom for i in range(1000)) < 10
+
+
+def test_refresh_rotates_the_token_pair(gql, login, blog):
+    tokens = login("author0")
+
+    result = gql(REFRESH, {"token": tokens["refreshToken"]})
+    rotated = result["data"]["refreshToken"]
+    assert me(gql, rotated) == {"username": "author0"}
+
+    replayed = gql(REFRESH, {"token": tokens["refreshToken"]})
+    assert replayed["data"] is None
+
+    result = gql(REFRESH, {"token": tokens["accessToken"]})
+    assert result["data"] is None
+
+
+def test_logout_revokes_access_and_refresh_tokens(gql, login, blog):
+    tokens = login("author0")
+    assert me(gql, tokens) == {"username": "author0"}
+
+    result = gql(LOGOUT, {"token": tokens["refreshToken"]}, token=tokens["accessToken"])
+    assert result["data"]["logout"] == {"message": "Logged out"}
+
+    assert me(gql, tokens) is None
+    assert gql(REFRESH, {"token": tokens["refreshToken"]})["data"] is None
+    assert me(gql, login("author1")) == {"username": "author1"}
+
+
+def test_every_token_decoder_rejects_revoked_tokens(app, gql, login, blog):
+    token = login("author0")["accessToken"]
+    headers = {"Authorization": f"Bearer {token}"}
+    with app.test_request_context(headers=headers):
+        verify_jwt_in_request()
+        assert AuthService.verify_token(token)["user"].username == "author0"
+
+    gql(LOGOUT, token=token)
+
+    with app.test_request_context(headers=headers):
+        with pytest.raises(RevokedTokenError):
+            verify_jwt_in_request()
+        assert AuthService.verify_token(token) == {
+            "error": "Invalid token",
+            "user": None,
+        }
+
+
+def test_revoke_all_sessions(gql, login, blog):
+    first, second = login("author0"), login("author0")
+    other = login("author1")
+    # Cutoffs have one-second resolution, like the iat claim
+    time.sleep(1.1)
+
+    result = gql(
+        "mutation { revokeAllSessions { message } }", token=first["accessToken"]
+    )
+    assert result["data"]["revokeAllSessions"] == {"message": "All sessions revoked"}
+
+    assert me(gql, first) is None
+    assert me(gql, second) is None
+    assert gql(REFRESH, {"token": second["refreshToken"]})["data"] is None
+    assert me(gql, other) == {"username": "author1"}
+    assert me(gql, login("author0")) == {"username": "author0"}
+
+
+def test_purge_revoked_tokens_command(app, gql, login, blog):
+    tokens = login("author0")
+    gql(LOGOUT, {"token": tokens["refreshToken"]}, token=tokens["accessToken"])
+
+    result = app.test_cli_runner().invoke(args=["purge-revoked-tokens"])
+    assert "Purged 0 expired token revocations" in result.output
+    assert me(gql, tokens) is None
@@ -0,0 +1,135 @@
+# tests/test_search.py
+import os
+
+import pytest
+
+from app.models import PostModel, UserModel
+from app.search import SearchBackend, get_search_backend, install_search
+
+# PostgreSQL is only exercised against a database provided by the developer
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+SEARCH = """
+query ($term: String!, $after: String) {
+  searchPostsConnection(searchTerm: $term, first: 2, after: $after) {
+    edges { node { title } relevance titleHighlight snippet }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+
+
+@pytest.fixture
+def posts(app):
+    with app.app_context():
+        author = UserModel.create_user(
+            username="writer", email="writer@example.com", password="pw"
+        )
+        for title, content in (
+            ("Cooking pasta", "Boil water, then mention flask once."),
+            ("Flask tips", "Blueprints and application factories."),
+            ("Gardening", "Nothing about web frameworks here."),
+            ("Testing Flask apps", "Use the flask test client."),
+        ):
+            PostModel(title=title, content=content, author_id=author.id).publish()
+
+
+def test_backends_must_implement_every_operation():
+    class MatchOnly(SearchBackend):
+        def match(self, search_term):
+            return None
+
+    with pytest.raises(TypeError):
+        MatchOnly()
+
+
+@pytest.mark.parametrize("app", [{"SEARCH_BACKEND": "sqlite_fts"}], indirect=True)
+def test_fts_ranks_title_matches_first(gql, posts):
+    data = gql('{ searchPosts(searchTerm: "flask") { title } }')["data"]
+
+    titles = [post["title"] for post in data["searchPosts"]]
+    assert sorted(titles[:2]) == ["Flask tips", "Testing Flask apps"]
+    assert titles[2:] == ["Cooking pasta"]
+
+
+@pytest.mark.parametrize("app", [{"SEARCH_BACKEND": "sqlite_fts"}], indirect=True)
+def test_fts_connection_pages_with_highlights(gql, posts):
+    first = gql(SEARCH, {"term": "flask"})["data"]["searchPostsConnection"]
+    after = first["pageInfo"]["endCursor"]
+    second = gql(SEARCH, {"term": "flask", "after": after})["data"]
+
+    edges = first["edges"] + second["searchPostsConnection"]["edges"]
+    assert len(edges) == 3
+    assert first["pageInfo"]["hasNextPage"] is True
+    assert [edge["relevance"] for edge in edges] == sorted(
+        (edge["relevance"] for edge in edges), reverse=True
+    )
+    highlights = {edge["node"]["title"]: edge for edge in edges}
+    assert highlights["Flask tips"]["titleHighlight"] == "<mark>Flask</mark> tips"
+    assert "<mark>flask</mark>" in highlights["Cooking pasta"]["snippet"]
+
+
+@pytest.mark.parametrize("app", [{"SEARCH_BACKEND": "sqlite_fts"}], indirect=True)
+def test_fts_index_follows_updates(app, gql, posts):
+    with app.app_context():
+        post = PostModel.query.filter_by(title="Gardening").one()
+        post.title = "Gardening with Flask"
+        post.save()
+
+    data = gql('{ searchPosts(searchTerm: "gardening flask") { title } }')["data"]
+    assert data["searchPosts"] == [{"title": "Gardening with Flask"}]
+
+
+@pytest.mark.parametrize("app", [{"SEARCH_BACKEND": "sqlite_fts"}], indirect=True)
+def test_fts_highlights_escape_post_text(app, gql, posts):
+    with app.app_context():
+        post = PostModel.query.filter_by(title="Gardening").one()
+        post.title = "<script>alert(1)</script> Flask"
+        post.content = "Flask & <img src=x onerror=alert(1)>"
+        post.save()
+
+    data = gql(SEARCH, {"term": "alert"})["data"]["searchPostsConnection"]
+
+    (edge,) = data["edges"]
+    assert edge["titleHighlight"] == (
+        "&lt;script&gt;<mark>alert</mark>(1)&lt;/script&gt; Flask"
+    )
+    assert "<img" not in edge["snippet"]
+    assert "&lt;img src=x onerror=<mark>alert</mark>(1)&gt;" in edge["snippet"]
+
+
+@pytest.mark.parametrize("app", [{"SEARCH_BACKEND": "like"}], indirect=True)
+def test_like_backend_matches_without_highlights(gql, posts):
+    edges = gql(SEARCH, {"term": "Flask"})["data"]["searchPostsConnection"]["edges"]
+
+    assert [edge["node"]["title"] for edge in edges] == [
+        "Testing Flask apps",
+        "Flask tips",
+    ]
+    assert {edge["titleHighlight"] for edge in edges} == {None}
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+@pytest.mark.parametrize(
+    "app", [{"SQLALCHEMY_DATABASE_URI": POSTGRES_URL}], indirect=True
+)
+def test_postgres_fts_ranks_and_highlights(app, gql, posts):
+    # The PostgreSQL index is left to migrations rather than app startup
+    with app.app_context():
+        install_search(get_search_backend())
+
+    edges = gql(SEARCH, {"term": "flask"})["data"]["searchPostsConnection"]["edges"]
+
+    assert sorted(edge["node"]["title"] for edge in edges) == [
+        "Flask tips",
+        "Testing Flask apps",
+    ]
+    assert "<mark>Flask</mark>" in edges[0]["titleHighlight"]
+
+
+def test_install_search_command_is_idempotent(app, gql, posts):
+    result = app.test_cli_runner().invoke(args=["install-search"])
+
+    assert "Installed the sqlite_fts search index" in result.output
+    data = gql('{ searchPosts(searchTerm: "gardening") { title } }')["data"]
+    assert data["searchPosts"] == [{"title": "Gardening"}]
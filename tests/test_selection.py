@@ -0,0 +1,54 @@
+# tests/test_selection.py
+from app.sql_stats import collect_sql
+
+
+def post_select(client, query):
+    """Run a query and return it with the statement that loaded its posts."""
+    with collect_sql() as stats:
+        result = client.post("/api/graphql", json={"query": query}).get_json()
+
+    statements = [shape for shape in stats.shapes if "FROM posts" in shape]
+    assert len(statements) == 1
+    return result, statements[0].split(" FROM posts")[0]
+
+
+def test_only_selected_columns_are_loaded(client, blog):
+    result, select = post_select(client, "{ posts { title } }")
+
+    assert len(result["data"]["posts"]) == 6
+    assert "posts.title" in select
+    assert "posts.content" not in select
+    assert "posts.excerpt" not in select
+
+
+def test_fragments_are_followed(client, blog):
+    query = """
+    { posts { ...Body } }
+    fragment Body on PostGType { contentHtml }
+    """
+    result, select = post_select(client, query)
+
+    assert result["data"]["posts"][0]["contentHtml"].startswith("<p>")
+    assert "posts.content_html" in select
+    assert "posts.title" not in select
+
+
+def test_connections_also_load_their_sort_column(client, blog):
+    query = "{ postsConnection(first: 2) { edges { cursor node { slug } } } }"
+    result, select = post_select(client, query)
+
+    assert len(result["data"]["postsConnection"]["edges"]) == 2
+    assert "posts.published_at" in select
+    assert "posts.content" not in select
+
+
+def test_author_selection_loads_author_id(client, blog):
+    result, select = post_select(client, "{ posts { author { username } } }")
+
+    assert {post["author"]["username"] for post in result["data"]["posts"]} == {
+        "author0",
+        "author1",
+        "author2",
+    }
+    assert "posts.author_id" in select
+    assert "posts.title" not in select
@@ -0,0 +1,69 @@
+# tests/test_slugs.py
+import pytest
+
+from app.extensions import db
+from app.models import PostModel, UserModel
+
+
+@pytest.fixture
+def new_post(app):
+    with app.app_context():
+        author_id = UserModel.create_user(
+            username="writer", email="writer@example.com", password="pw"
+        ).id
+
+    def create(title):
+        with app.app_context():
+            return PostModel(title=title, content="Body", author_id=author_id).save().id
+
+    return create
+
+
+def slugs(app):
+    with app.app_context():
+        return [post.slug for post in PostModel.query.order_by(PostModel.id)]
+
+
+def test_repeated_titles_get_numbered_slugs(app, new_post):
+    for _ in range(3):
+        new_post("Hello, World!")
+
+    assert slugs(app) == ["hello-world", "hello-world-1", "hello-world-2"]
+
+
+def test_slug_taken_by_a_legacy_row_is_skipped(app, new_post):
+    new_post("Hello World")
+    legacy_id = new_post("Legacy")
+    with app.app_context():
+        db.session.execute(
+            db.update(PostModel)
+            .where(PostModel.id == legacy_id)
+            .values(slug="hello-world-1", slug_base=None, slug_seq=None)
+        )
+        db.session.commit()
+
+    new_post("Hello World")
+
+    assert slugs(app) == ["hello-world", "hello-world-1", "hello-world-2"]
+
+
+def test_suffix_collision_with_a_numbered_title(app, new_post):
+    new_post("Top 1")
+    new_post("Top")
+    new_post("Top")
+
+    assert slugs(app) == ["top-1", "top", "top-2"]
+
+
+def test_backfill_slugs_command(app, new_post):
+    for title in ("Post", "Post", "Other"):
+        new_post(title)
+    with app.app_context():
+        db.session.execute(db.update(PostModel).values(slug_base=None, slug_seq=None))
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["backfill-slugs"])
+
+    assert "Backfilled slug sequences for 3 posts" in result.output
+    new_post("Post")
+    assert slugs(app)[-1] == "post-2"
@@ -0,0 +1,65 @@
+# tests/test_tags.py
+from app.extensions import db
+from app.models import PostModel, TagModel, UserModel
+from app.models.tag import post_tags
+
+
+def test_tags_are_stored_normalized(app, blog):
+    with app.app_context():
+        post = PostModel.query.first()
+        post.tags = "Python, graphql,  PYTHON "
+        post.save()
+
+        assert sorted(tag.name for tag in post.tag_objects) == ["graphql", "python"]
+        assert TagModel.query.count() == 3
+
+
+def test_tag_list_is_returned_as_written(app, gql, blog):
+    with app.app_context():
+        post = PostModel.query.filter_by(title="GraphQL post 0 by author0").one()
+        post.tags = "Zebra, apple,  Flask "
+        post.save()
+
+    posts = gql("{ posts { title tagList } }")["data"]["posts"]
+
+    tag_lists = {post["title"]: post["tagList"] for post in posts}
+    assert tag_lists.pop("GraphQL post 0 by author0") == ["Zebra", "apple", "Flask"]
+    assert {tuple(tags) for tags in tag_lists.values()} == {("graphql", "flask")}
+
+
+def test_posts_by_tag(app, blog, gql):
+    with app.app_context():
+        post = PostModel.query.filter_by(title="GraphQL post 0 by author1").one()
+        post.tags = "Python"
+        post.save()
+
+    data = gql('{ postsByTag(tag: "python") { title } }')["data"]
+    assert data["postsByTag"] == [{"title": "GraphQL post 0 by author1"}]
+
+    data = gql('{ postsByTag(tag: "graphql", publishedOnly: false) { id } }')["data"]
+    assert len(data["postsByTag"]) == 11
+
+
+def test_tags_with_post_counts(gql, blog):
+    data = gql("{ tags { name postCount } }")["data"]
+    assert data["tags"] == [
+        {"name": "flask", "postCount": 6},
+        {"name": "graphql", "postCount": 6},
+    ]
+
+    data = gql("{ tags(publishedOnly: false) { name postCount } }")["data"]
+    assert {tag["postCount"] for tag in data["tags"]} == {12}
+
+
+def test_migrate_tags_command(app, blog):
+    with app.app_context():
+        db.session.execute(db.delete(post_tags))
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["migrate-tags", "--batch-size", "5"])
+
+    assert "Migrated tags for 12 posts" in result.output
+    with app.app_context():
+        assert db.session.query(post_tags).count() == 24
+        author = UserModel.query.first()
+        assert all(len(post.tag_objects) == 2 for post in author.posts)
@@ -0,0 +1,20 @@
+# tests/test_testing.py
+import pytest
+
+from app.extensions import db
+from app.testing import assert_max_queries
+
+
+def test_assert_max_queries_counts_statements(app):
+    with app.app_context(), assert_max_queries(2) as stats:
+        db.session.execute(db.text("SELECT 1"))
+        db.session.execute(db.text("SELECT 2"))
+
+    assert stats.count == 2
+
+
+def test_assert_max_queries_fails_over_limit(app):
+    with pytest.raises(AssertionError, match="at most 1 SQL statements, ran 2"):
+        with app.app_context(), assert_max_queries(1):
+            db.session.execute(db.text("SELECT 1"))
+            db.session.execute(db.text("SELECT 1"))